@@ -0,0 +1 @@
+"""Performance benchmarks for `vinte_uno` package."""
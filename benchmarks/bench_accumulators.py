@@ -0,0 +1,97 @@
+"""Benchmarks summarizing credit deltas of many rounds.
+
+Compares dumping every delta then computing mean, variance and quantiles
+with the ``statistics`` module, against streaming them through
+``accumulators.RoundStatistics``. Prints time and peak memory traced, time
+including the tracing overhead.
+
+Run it with ``python -m benchmarks.bench_accumulators``.
+"""
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from vinte_uno import accumulators, vinte_uno
+
+ROUNDS = (10000, 100000)
+SEATS = 3
+DELTAS = (-1, -1, 0, 1, 1, 2)
+QUANTILES = 100
+
+
+def outcomes(rounds: int) -> List[Tuple[str, ...]]:
+    """Builds seeded final gambler states the rounds cycle through.
+
+    :param rounds: Number of rounds, the seed
+    :return: Gambler states of a round each
+    """
+    rng = random.Random(rounds)
+    return [
+        tuple(rng.choice(vinte_uno.GAMBLER_STATES[2:]) for _ in range(SEATS))
+        for _ in range(64)
+    ]
+
+
+def dumped(rounds: int) -> float:
+    """Keeps every delta, summarizing them at the end.
+
+    :param rounds: Number of rounds
+    :return: Median delta
+    """
+    rng = random.Random(21)
+    deltas: List[int] = []
+    for _ in range(rounds):
+        deltas.extend(rng.choice(DELTAS) for _ in range(SEATS))
+    statistics.mean(deltas)
+    statistics.variance(deltas)
+    return statistics.quantiles(deltas, n=QUANTILES)[QUANTILES // 2 - 1]
+
+
+def streamed(rounds: int) -> float:
+    """Adds every round to statistics as it ends.
+
+    :param rounds: Number of rounds
+    :return: Median delta
+    """
+    rng = random.Random(21)
+    states = outcomes(rounds)
+    stats = accumulators.RoundStatistics()
+    for index in range(rounds):
+        stats.add(
+            vinte_uno.STAYED,
+            states[index % len(states)],
+            [rng.choice(DELTAS) for _ in range(SEATS)],
+        )
+    return stats.quantiles.quantile(0.5) or 0.0
+
+
+def measure(name: str, summarize: Callable[[int], float], rounds: int) -> None:
+    """Prints time and peak memory of an approach.
+
+    :param name: Approach name
+    :param summarize: Summarizes rounds
+    :param rounds: Number of rounds
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    median = summarize(rounds)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    line = '{0:10} {1:8} rounds {2:8.2f} s {3:10.1f} KiB peak  median {4:.2f}'
+    print(line.format(  # noqa: WPS421
+        name, rounds, seconds, peak / 1024, median,
+    ))
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    for rounds in ROUNDS:
+        measure('dumped', dumped, rounds)
+        measure('streamed', streamed, rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmarks drawing every card of a deck.
+
+Compares ``Deck.pick`` against the former draw path, which built a
+``random.SystemRandom`` and removed the card by value on every call.
+
+Run it with ``python -m benchmarks.bench_deck``.
+"""
+import random
+import timeit
+
+from vinte_uno import vinte_uno
+
+NUMBER = 2000
+
+
+def legacy_pick(deck: vinte_uno.Deck) -> int:
+    """Draws a card as the former ``Deck.pick`` did.
+
+    :param deck: A deck object
+    :raises ValueError: When not have cards on deck
+    :return: A random card id
+    :rtype: int
+    """
+    max_index = len(deck.cards)
+    if max_index < 1:
+        raise ValueError("Doesn't have enough cards!")
+    index = random.SystemRandom().randint(0, max_index - 1)
+    card = deck.cards[index]
+    deck.cards.remove(card)
+    return card
+
+
+def drain_legacy(deck: vinte_uno.Deck) -> None:
+    """Draws every card through the former path.
+
+    :param deck: A deck object
+    """
+    while deck.cards:
+        legacy_pick(deck)
+
+
+def drain(deck: vinte_uno.Deck) -> None:
+    """Draws every card through ``Deck.pick``.
+
+    :param deck: A deck object
+    """
+    while deck.cards:
+        deck.pick()
+
+
+def measure(drain_function: object, rng: random.Random) -> float:
+    """Measures the best time to drain a deck, setup excluded.
+
+    :param drain_function: Function that draws all deck cards
+    :param rng: Random generator given to the deck
+    :return: Seconds per drained deck
+    :rtype: float
+    """
+    timings = timeit.repeat(
+        'drain_function(deck)',
+        setup='deck = Deck(rng=rng)',
+        globals={'drain_function': drain_function, 'Deck': vinte_uno.Deck, 'rng': rng},
+        number=1,
+        repeat=NUMBER,
+    )
+    return min(timings)
+
+
+def main() -> None:
+    """Prints time to drain a deck for each draw path."""
+    legacy = measure(drain_legacy, random.SystemRandom())
+    system = measure(drain, random.SystemRandom())
+    seeded = measure(drain, random.Random(21))
+    print('legacy pick:        {0:10.2f} us'.format(legacy * 1e6))  # noqa: WPS421
+    print('pick, SystemRandom: {0:10.2f} us'.format(system * 1e6))  # noqa: WPS421
+    print('pick, Random:       {0:10.2f} us'.format(seeded * 1e6))  # noqa: WPS421
+    print('speedup:            {0:10.2f} x'.format(legacy / system))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
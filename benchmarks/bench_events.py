@@ -0,0 +1,72 @@
+"""Benchmarks rounds of large tables played on events against turns.
+
+Compares ``simulation.play_round``, stepping every seat each turn, with
+``events.play``, applying the actions of gaming gamblers only. Rounds are
+played with the default policy, then with a single gambler hitting up to
+twenty one while every other gambler stays on its opening two cards.
+
+Run it with ``python -m benchmarks.bench_events``.
+"""
+import random
+import time
+from typing import Callable, Optional
+
+from vinte_uno import events, simulation, vinte_uno
+
+ROUNDS = 20
+SEATS = (3, 100, 500)
+
+
+def one_hitter(gambler: vinte_uno.Gambler, dealer: vinte_uno.Dealer) -> bool:
+    """Policy staying on two cards, except for the first seat.
+
+    :param gambler: A gaming gambler
+    :param dealer: Dealer of the table
+    :return: If the gambler stays
+    :rtype: bool
+    """
+    if gambler is dealer.gamblers[0]:
+        return gambler.hand >= vinte_uno.TWENTY_ONE_RANK_POINTS
+    return len(gambler.cards) >= 2
+
+
+def measure(
+    play: Callable[..., simulation.RoundResult],
+    seats: int,
+    policy: Optional[simulation.Policy],
+) -> float:
+    """Measures seconds per round of an engine.
+
+    :param play: Plays a round of a dealer
+    :param seats: Number of gamblers
+    :param policy: Policy of the gamblers, the default one when None
+    :return: Seconds per round
+    :rtype: float
+    """
+    shoe = vinte_uno.Shoe(decks=max(6, seats // 8), rng=random.Random(21))
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(seats)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=shoe)
+    seconds = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        play(dealer, policy=policy)
+        seconds += time.perf_counter() - start
+        dealer.reset()
+    return seconds / ROUNDS
+
+
+def main() -> None:
+    """Runs the benchmark, state machines built beforehand."""
+    assert vinte_uno.Gambler.machine and vinte_uno.Dealer.machine  # noqa: S101
+    for name, policy in (('default', None), ('one hitter', one_hitter)):
+        for seats in SEATS:
+            turns = measure(simulation.play_round, seats, policy)
+            actions = measure(events.play, seats, policy)
+            line = '{0:10} {1:4} seats  turns {2:9.1f} us  events {3:9.1f} us {4:6.2f} x'
+            print(line.format(  # noqa: WPS421
+                name, seats, turns * 1e6, actions * 1e6, turns / actions,
+            ))
+
+
+if __name__ == '__main__':
+    main()
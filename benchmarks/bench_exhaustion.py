@@ -0,0 +1,101 @@
+"""Benchmarks refilling an exhausted shoe.
+
+Compares rebuilding a six decks shoe, as tables used to when the cards
+ran out, against refilling it in place with each exhaustion policy, then
+plays a fifty seats table on a reused shoe for many rounds.
+
+Run it with ``python -m benchmarks.bench_exhaustion``.
+"""
+import random
+import timeit
+
+from vinte_uno import cards, simulation, vinte_uno
+
+DECKS = 6
+SEATS = 50
+ROUNDS = 200
+NUMBER = 1000
+
+
+def emptied(exhaustion: str) -> cards.Shoe:
+    """Builds a shoe, a round of cards in play, then drains it.
+
+    :param exhaustion: Exhaustion policy
+    :return: An empty shoe
+    :rtype: cards.Shoe
+    """
+    shoe = cards.Shoe(decks=DECKS, penetration=1, rng=random.Random(21), exhaustion=exhaustion)
+    while len(shoe.cards) > SEATS * 3:
+        shoe.pick()
+    shoe.start_round()
+    while shoe.cards:
+        shoe.pick()
+    return shoe
+
+
+def refill(exhaustion: str) -> float:
+    """Measures the best time of a refill.
+
+    :param exhaustion: Exhaustion policy
+    :return: Seconds per refill
+    :rtype: float
+    """
+    shoe = emptied(exhaustion)
+    return min(timeit.repeat(
+        'shoe.refill()',
+        setup='del shoe.cards[:]',
+        globals={'shoe': shoe},
+        number=1,
+        repeat=NUMBER,
+    ))
+
+
+def rebuild() -> float:
+    """Measures the best time of building a new shoe.
+
+    :return: Seconds per shoe
+    :rtype: float
+    """
+    rng = random.Random(21)
+    return min(timeit.repeat(
+        lambda: cards.Shoe(decks=DECKS, penetration=1, rng=rng),
+        number=1,
+        repeat=NUMBER,
+    ))
+
+
+def rounds(exhaustion: str) -> int:
+    """Plays rounds of a large table without ever rebuilding its shoe.
+
+    :param exhaustion: Exhaustion policy
+    :return: Number of refills
+    :rtype: int
+    """
+    shoe = cards.Shoe(decks=DECKS, penetration=1, rng=random.Random(21), exhaustion=exhaustion)
+    refills = 0
+    original = shoe.refill
+
+    def counted() -> None:  # noqa: WPS430
+        nonlocal refills
+        refills += 1
+        original()
+    shoe.refill = counted  # type: ignore
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=shoe)
+    for _ in range(ROUNDS):
+        simulation.play_round(dealer)
+        dealer.reset()
+    return refills
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    print('{0:20} {1:10.1f} us'.format('rebuild', rebuild() * 1e6))  # noqa: WPS421
+    for exhaustion in (cards.RESHUFFLE_DISCARDS, cards.RESERVE):
+        print('{0:20} {1:10.1f} us {2:6} refills in {3} rounds of {4} seats'.format(  # noqa: WPS421
+            exhaustion.lower(), refill(exhaustion) * 1e6, rounds(exhaustion), ROUNDS, SEATS,
+        ))
+
+
+if __name__ == '__main__':
+    main()
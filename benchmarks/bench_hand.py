@@ -0,0 +1,116 @@
+"""Benchmarks hand evaluation.
+
+Compares ``Player.hand``, looked up on ``HAND_TOTALS`` by a key kept up
+to date as cards are hit, against the former property walking every card
+on each access and against computing the total from running totals.
+
+Run it with ``python -m benchmarks.bench_hand``.
+"""
+import random
+import time
+from typing import Iterable, List
+
+from vinte_uno import vinte_uno
+
+HANDS = 1000
+EVALUATIONS = 2000
+
+
+def legacy_hand(cards: Iterable[int]) -> int:
+    """Evaluates a hand as the former ``Player.hand`` did.
+
+    :param cards: Card ids on hand
+    :return: total rank points
+    :rtype: int
+    """
+    have_ace = False
+    rank_points = 0
+    for card_id in cards:
+        card = vinte_uno.CARDS[card_id]
+        rank_points += card.weight
+        if card.rank == 'ace':
+            have_ace = True
+
+    if rank_points == vinte_uno.ACE_RANK_POINTS and have_ace:
+        return vinte_uno.ACE_RANK_POINTS + (rank_points - 1)
+
+    return rank_points
+
+
+class ArithmeticHand(vinte_uno.Hand):
+    """Hand evaluated from running totals, as before the lookup table."""
+
+    @property
+    def soft(self) -> bool:
+        """A property that tells if an ace counts as eleven on hand.
+
+        :return: If the hand is soft
+        :rtype: bool
+        """
+        return self.aces > 0 and (
+            self.hard_total + vinte_uno.ACE_RANK_POINTS - vinte_uno.ACE_WEIGHT
+            <= vinte_uno.TWENTY_ONE_RANK_POINTS
+        )
+
+    @property
+    def hand(self) -> int:
+        """A property that contains total rank points on hand.
+
+        :return: total rank points
+        :rtype: int
+        """
+        if self.soft:
+            return self.hard_total + vinte_uno.ACE_RANK_POINTS - vinte_uno.ACE_WEIGHT
+        return self.hard_total
+
+
+def players(rng: random.Random) -> List[vinte_uno.Gambler]:
+    """Builds gamblers holding two to five random cards.
+
+    :param rng: Random generator
+    :return: Gamblers with cards on hand
+    :rtype: List[vinte_uno.Gambler]
+    """
+    gamblers = []
+    for index in range(HANDS):
+        gambler = vinte_uno.Gambler(name='Gambler {0}'.format(index))
+        gambler.cards = rng.sample(range(len(vinte_uno.CARDS)), rng.randint(2, 5))
+        gamblers.append(gambler)
+    return gamblers
+
+
+def main() -> None:
+    """Prints time per evaluated hand for both implementations."""
+    gamblers = players(random.Random(21))
+    total = HANDS * EVALUATIONS
+
+    start = time.perf_counter()
+    for _ in range(EVALUATIONS):
+        for gambler in gamblers:
+            legacy_hand(gambler.cards)
+    legacy = (time.perf_counter() - start) / total
+
+    hands = [ArithmeticHand(gambler.cards) for gambler in gamblers]
+    start = time.perf_counter()
+    for _ in range(EVALUATIONS):
+        for hand in hands:
+            hand.hand  # noqa: B018, WPS428
+    arithmetic = (time.perf_counter() - start) / total
+
+    start = time.perf_counter()
+    for _ in range(EVALUATIONS):
+        for gambler in gamblers:
+            gambler.hand  # noqa: B018, WPS428
+    lookup = (time.perf_counter() - start) / total
+
+    print('hands evaluated:    {0:10d}'.format(total))  # noqa: WPS421
+    print('legacy hand:        {0:10.1f} ns'.format(legacy * 1e9))  # noqa: WPS421
+    print('arithmetic hand:    {0:10.1f} ns'.format(arithmetic * 1e9))  # noqa: WPS421
+    print('lookup hand:        {0:10.1f} ns'.format(lookup * 1e9))  # noqa: WPS421
+    print('speedup:            {0:10.2f} x legacy {1:.2f} x arithmetic'.format(  # noqa: WPS421
+        legacy / lookup, arithmetic / lookup,
+    ))
+
+
+if __name__ == '__main__':
+    main()
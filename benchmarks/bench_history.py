@@ -0,0 +1,53 @@
+"""Benchmarks recording and replaying the hand history.
+
+Run it with ``python -m benchmarks.bench_history``.
+"""
+import random
+import tempfile
+import time
+from typing import Optional
+
+from vinte_uno import history, simulation, vinte_uno
+
+ROUNDS = 5000
+SEATS = 3
+
+
+def play(recorder: Optional[history.HistoryRecorder] = None) -> float:
+    """Plays rounds, recording them when a recorder is given.
+
+    :param recorder: History recorder
+    :return: Elapsed seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    shoe = vinte_uno.Shoe(rng=random.Random(21))
+    for _ in range(ROUNDS):
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+        dealer = vinte_uno.Dealer(gamblers=gamblers, deck=shoe)
+        if recorder is not None:
+            recorder.attach(dealer)
+        simulation.play_round(dealer)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Prints recording overhead and replay throughput."""
+    with tempfile.TemporaryDirectory() as directory:
+        plain = play()
+        with history.HistoryLog(directory) as log:
+            recorded = play(history.HistoryRecorder(log))
+
+        replay = history.HistoryReplay(directory)
+        start = time.perf_counter()
+        records = sum(1 for _ in replay.records())
+        elapsed = time.perf_counter() - start
+
+    print('round:           {0:10.2f} us'.format(plain / ROUNDS * 1e6))  # noqa: WPS421
+    print('recorded round:  {0:10.2f} us'.format(recorded / ROUNDS * 1e6))  # noqa: WPS421
+    print('records/round:   {0:10.2f}'.format(records / ROUNDS))  # noqa: WPS421
+    print('replay:          {0:10.0f} records/s'.format(records / elapsed))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmarks the cost of engine instrumentation.
+
+Run it with ``python -m benchmarks.bench_instrumentation``.
+"""
+import random
+import timeit
+
+from vinte_uno import instrumentation, simulation, vinte_uno
+
+NUMBER = 2000
+REPEAT = 5
+
+
+def play_round() -> None:
+    """Plays a round on a new table."""
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    deck = vinte_uno.Deck(rng=random.Random(NUMBER))
+    simulation.play_round(vinte_uno.Dealer(gamblers=gamblers, deck=deck))
+
+
+def measure() -> float:
+    """Measures the best time per round.
+
+    :return: Seconds per round
+    :rtype: float
+    """
+    return min(timeit.repeat(play_round, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    """Prints round time before, while and after profiling, then the slowest calls."""
+    profiler = instrumentation.Profiler()
+    before = measure()
+    with profiler:
+        enabled = measure()
+    after = measure()
+
+    print('never enabled: {0:10.2f} us'.format(before * 1e6))  # noqa: WPS421
+    print('enabled:       {0:10.2f} us'.format(enabled * 1e6))  # noqa: WPS421
+    print('disabled:      {0:10.2f} us'.format(after * 1e6))  # noqa: WPS421
+    timings = sorted(profiler.snapshot().items(), key=lambda item: -item[1].seconds)
+    for label, timing in timings[:8]:
+        print('{0:22} {1:10d} calls {2:10.2f} us/call'.format(  # noqa: WPS421
+            label, timing.calls, timing.seconds / timing.calls * 1e6,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Benchmarks simulated rounds per second.
+
+Compares the object engine, ``simulation.play_round``, against the batch
+engine of ``montecarlo`` on the same shoes.
+
+Run it with ``python -m benchmarks.bench_montecarlo``.
+"""
+import time
+
+from vinte_uno import montecarlo, simulation, vinte_uno
+
+OBJECT_ROUNDS = 20000
+BATCH_ROUNDS = 1000000
+SEATS = 3
+
+
+def main() -> None:
+    """Prints rounds per second for both engines."""
+    shoes = montecarlo.deal_shoes(OBJECT_ROUNDS, seed=21)
+    start = time.perf_counter()
+    for shoe in shoes:
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+        dealer = vinte_uno.Dealer(gamblers=gamblers, deck=simulation.stacked_deck(shoe))
+        simulation.play_round(dealer)
+    objects = OBJECT_ROUNDS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    summary = montecarlo.simulate(BATCH_ROUNDS, seats=SEATS, seed=21)
+    batch = BATCH_ROUNDS / (time.perf_counter() - start)
+
+    print(summary)  # noqa: WPS421
+    print('object engine: {0:12.0f} rounds/s'.format(objects))  # noqa: WPS421
+    print('batch engine:  {0:12.0f} rounds/s'.format(batch))  # noqa: WPS421
+    print('speedup:       {0:12.2f} x'.format(batch / objects))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
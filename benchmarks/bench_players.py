@@ -0,0 +1,106 @@
+"""Benchmarks Gambler and Dealer construction.
+
+Compares the shared, class level state machine against the former layout,
+where every player was a ``transitions.Machine`` on its own.
+
+Run it with ``python -m benchmarks.bench_players``.
+"""
+import timeit
+from typing import List, Set
+
+from transitions import Machine
+
+from vinte_uno import vinte_uno
+
+NUMBER = 2000
+REPEAT = 5
+
+
+class LegacyGambler(Machine):  # noqa: H601
+    """Gambler compiling its own state machine, as before."""
+
+    def __init__(self, name: str, credit: int = 1) -> None:
+        """Instantiates this class.
+
+        :param name: Player name
+        :param credit: Represents bet value
+        """
+        super().__init__(
+            model=self,
+            states=list(vinte_uno.Gambler.states),
+            transitions=[dict(transition) for transition in vinte_uno.Gambler.transitions],
+            initial=vinte_uno.Gambler.states[0],
+        )
+        self.name = name
+        self.cards: Set[vinte_uno.Card] = set()
+        self.credit = credit
+        self.amount = 0
+
+
+class LegacyDealer(Machine):  # noqa: H601
+    """Dealer compiling its own state machine, as before."""
+
+    def __init__(self, gamblers: List[LegacyGambler], credit: int = 1) -> None:
+        """Instantiates this class.
+
+        :param gamblers: List containing gamblers of the round.
+        :param credit: Represents bet value
+        """
+        super().__init__(
+            model=self,
+            states=list(vinte_uno.Dealer.states),
+            transitions=[dict(transition) for transition in vinte_uno.Dealer.transitions],
+            initial=vinte_uno.Dealer.states[0],
+        )
+        self.name = 'Dealer'
+        self.cards: Set[vinte_uno.Card] = set()
+        self.credit = credit
+        self.amount = 0
+        self.gamblers = gamblers
+        self.deck = vinte_uno.Deck()
+
+
+def legacy_table(seats: int = 5) -> LegacyDealer:
+    """Builds a table with per instance state machines.
+
+    :param seats: Number of gamblers at the table
+    :return: A dealer with its gamblers
+    :rtype: LegacyDealer
+    """
+    gamblers = [LegacyGambler(name='Gambler {0}'.format(seat)) for seat in range(seats)]
+    return LegacyDealer(gamblers=gamblers)
+
+
+def shared_table(seats: int = 5) -> vinte_uno.Dealer:
+    """Builds a table with the shared state machines.
+
+    :param seats: Number of gamblers at the table
+    :return: A dealer with its gamblers
+    :rtype: vinte_uno.Dealer
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(seats)]
+    return vinte_uno.Dealer(gamblers=gamblers)
+
+
+def measure(function: object) -> float:
+    """Measures the best time per call of a function.
+
+    :param function: A callable without arguments
+    :return: Seconds per call
+    :rtype: float
+    """
+    timings = timeit.repeat(function, number=NUMBER, repeat=REPEAT)  # type: ignore
+    return min(timings) / NUMBER
+
+
+def main() -> None:
+    """Prints construction cost for both layouts."""
+    legacy = measure(legacy_table)
+    shared = measure(shared_table)
+    print('legacy table: {0:10.2f} us'.format(legacy * 1e6))  # noqa: WPS421
+    print('shared table: {0:10.2f} us'.format(shared * 1e6))  # noqa: WPS421
+    print('speedup:      {0:10.2f} x'.format(legacy / shared))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Benchmarks allocations of rounds played on new or pooled tables.
+
+Run it with ``python -m benchmarks.bench_pool``.
+"""
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+from vinte_uno import pool, simulation, vinte_uno
+
+ROUNDS = 20000
+SEATS = 3
+
+
+def new_tables() -> None:
+    """Plays rounds on tables built for each round."""
+    for _ in range(ROUNDS):
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+        simulation.play_round(vinte_uno.Dealer(gamblers=gamblers))
+
+
+def pooled_tables() -> None:
+    """Plays rounds on tables lent by a pool."""
+    tables = pool.TablePool(seats=SEATS)
+    for _ in range(ROUNDS):
+        dealer = tables.acquire()
+        simulation.play_round(dealer)
+        tables.release(dealer)
+
+
+def measure(play: Callable[[], None]) -> None:
+    """Prints time per round, garbage collections and peak traced memory.
+
+    :param play: Plays ``ROUNDS`` rounds
+    """
+    collections = sum(stats['collections'] for stats in gc.get_stats())
+    start = time.perf_counter()
+    play()
+    elapsed = time.perf_counter() - start
+    collections = sum(stats['collections'] for stats in gc.get_stats()) - collections
+
+    tracemalloc.start()
+    play()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('{0:14} {1:8.2f} us/round {2:6d} gc runs {3:8d} peak bytes'.format(  # noqa: WPS421
+        play.__name__, elapsed / ROUNDS * 1e6, collections, peak,
+    ))
+
+
+def main() -> None:
+    """Prints allocation costs of both layouts."""
+    measure(new_tables)
+    measure(pooled_tables)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""Benchmarks dealer odds queries.
+
+Run it with ``python -m benchmarks.bench_probability``.
+"""
+import random
+import time
+import timeit
+
+from vinte_uno import probability, vinte_uno
+
+NUMBER = 100000
+
+
+def main() -> None:
+    """Prints cold and warm query time on a six decks shoe."""
+    shoe = vinte_uno.Shoe(decks=6, rng=random.Random(21))
+    for _ in range(60):
+        shoe.pick()
+    counts = probability.composition(shoe.cards)
+
+    probability.clear_cache()
+    start = time.perf_counter()
+    for weight in probability.WEIGHTS:
+        probability.dealer_odds(weight, counts)
+    cold = (time.perf_counter() - start) / len(probability.WEIGHTS)
+    warm = min(timeit.repeat(
+        lambda: probability.dealer_odds(6, counts), number=NUMBER, repeat=5,
+    )) / NUMBER
+
+    print(probability.dealer_odds(6, counts))  # noqa: WPS421
+    print('cold query:  {0:10.2f} us'.format(cold * 1e6))  # noqa: WPS421
+    print('warm query:  {0:10.2f} us'.format(warm * 1e6))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
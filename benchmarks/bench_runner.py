@@ -0,0 +1,31 @@
+"""Benchmarks simulation throughput against the number of workers.
+
+Run it with ``python -m benchmarks.bench_runner``.
+"""
+import os
+import time
+
+from vinte_uno import runner
+
+TABLES = 64
+SETTINGS = runner.TableSettings(rounds=200, seats=3)
+
+
+def main() -> None:
+    """Prints rounds per second and scaling for 1 to all cores."""
+    cores = os.cpu_count() or 1
+    single = 0.0
+    for workers in sorted({2 ** power for power in range(cores.bit_length())} | {cores}):
+        start = time.perf_counter()
+        runner.run(tables=TABLES, settings=SETTINGS, master_seed=21, workers=workers)
+        throughput = TABLES * SETTINGS.rounds / (time.perf_counter() - start)
+        single = single or throughput
+        print(  # noqa: WPS421
+            'workers: {0:3d} {1:12.0f} rounds/s {2:6.2f} x'.format(
+                workers, throughput, throughput / single,
+            ),
+        )
+
+
+if __name__ == '__main__':
+    main()
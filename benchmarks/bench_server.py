@@ -0,0 +1,63 @@
+"""Load generator for the asyncio table host.
+
+Hosts thousands of bots on a single event loop, bots thinking for a random
+while and a few of them never answering in time.
+
+Run it with ``python -m benchmarks.bench_server``.
+"""
+import asyncio
+import random
+import time
+
+from vinte_uno import server, vinte_uno
+
+TABLES = 1000
+SEATS = 5
+ROUNDS = 3
+THINK_TIME = 0.005
+TIMEOUT = 0.5
+SLOW_BOTS = 0.01
+
+
+async def bot(gambler: vinte_uno.Gambler, dealer: vinte_uno.Dealer) -> bool:
+    """Bot that stays from 17 points after thinking a while.
+
+    :param gambler: Gambler deciding
+    :param dealer: Dealer of the table
+    :return: If the gambler stays
+    :rtype: bool
+    """
+    if random.random() < SLOW_BOTS:
+        await asyncio.sleep(TIMEOUT * 2)
+    else:
+        await asyncio.sleep(random.random() * THINK_TIME)
+    return gambler.hand >= vinte_uno.DEALER_RANK_POINTS_LIMIT
+
+
+def main() -> None:
+    """Prints decisions per second and turn latencies."""
+    stats = server.TurnStats()
+    tables = [
+        server.AsyncTable(
+            names=['Bot {0}'.format(seat) for seat in range(SEATS)],
+            decide=bot,
+            deck=vinte_uno.Shoe(),
+            timeout=TIMEOUT,
+            stats=stats,
+        )
+        for _ in range(TABLES)
+    ]
+    start = time.perf_counter()
+    asyncio.run(server.TableHost(tables).serve(rounds=ROUNDS))
+    elapsed = time.perf_counter() - start
+
+    print('bots:          {0:10d}'.format(TABLES * SEATS))  # noqa: WPS421
+    print('turns:         {0:10d}'.format(stats.turns))  # noqa: WPS421
+    print('decisions/s:   {0:10.0f}'.format(stats.decisions / elapsed))  # noqa: WPS421
+    print('timeouts:      {0:10d}'.format(stats.timeouts))  # noqa: WPS421
+    print('p50 turn:      {0:10.2f} ms'.format(stats.percentile(50) * 1e3))  # noqa: WPS421
+    print('p99 turn:      {0:10.2f} ms'.format(stats.percentile(99) * 1e3))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Benchmarks settling a table of many gamblers.
+
+Compares ``Dealer.settle`` against the former ``after_stay`` settlement,
+copied as it was: stayed gamblers are taken out of the table through sets,
+the best hands earn their bet again, then the table is rebuilt sorted by
+name.
+
+Run it with ``python -m benchmarks.bench_settlement``.
+"""
+import time
+from typing import Callable
+
+from vinte_uno import vinte_uno
+
+GAMBLERS = 1000
+ROUNDS = 200
+CARDS = ('2', '3', '4', '5', '6', '7', '8', '9', '10')
+
+
+def table() -> vinte_uno.Dealer:
+    """Builds a table of stayed gamblers, the dealer holding eighteen.
+
+    :return: Dealer of the table
+    :rtype: vinte_uno.Dealer
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(GAMBLERS)]
+    for seat, gambler in enumerate(gamblers):
+        gambler.cards = [
+            vinte_uno.CARD_IDS['10', 'hearts'],
+            vinte_uno.CARD_IDS[CARDS[seat % len(CARDS)], 'spades'],
+        ]
+        gambler.to_STAYED()
+    dealer = vinte_uno.Dealer(gamblers=gamblers)
+    dealer.cards = [vinte_uno.CARD_IDS['10', 'clubs'], vinte_uno.CARD_IDS['8', 'clubs']]
+    dealer.to_EXPOSED()
+    return dealer
+
+
+def legacy(dealer: vinte_uno.Dealer) -> None:
+    """Settles stayed gamblers the way ``after_stay`` used to.
+
+    :param dealer: Dealer of the table
+    """
+    gamblers = [gamblr for gamblr in dealer.gamblers if gamblr.state == vinte_uno.STAYED]
+    if not gamblers:
+        return
+
+    max_score = max(gamblers, key=lambda element: element.hand).hand
+    dealer.gamblers = list(set(dealer.gamblers) - set(gamblers))
+    for idx, gambler in enumerate(gamblers):
+        if gambler.hand == max_score and max_score > dealer.hand:
+            gamblers[idx].credit += gambler.credit
+
+    dealer.gamblers += gamblers
+    dealer.gamblers.sort(key=lambda element: element.name)
+
+
+def measure(name: str, settle: Callable[[vinte_uno.Dealer], None]) -> None:
+    """Times settlements of a table and prints the time per gambler.
+
+    Seats and credits are put back after each settlement, untimed.
+
+    :param name: Approach name
+    :param settle: Settles the table
+    """
+    dealer = table()
+    gamblers = list(dealer.gamblers)
+    credits = [gambler.credit for gambler in gamblers]
+    seconds = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        settle(dealer)
+        seconds += time.perf_counter() - start
+        dealer.gamblers = list(gamblers)
+        for gambler, credit in zip(gamblers, credits):
+            gambler.credit = credit
+    print('{0:8} {1:10.3f} ms/round {2:10.1f} ns/gambler'.format(  # noqa: WPS421
+        name, seconds / ROUNDS * 1e3, seconds / ROUNDS / GAMBLERS * 1e9,
+    ))
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    measure('legacy', legacy)
+    measure('settle', vinte_uno.Dealer.settle)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Benchmarks freezing tables into snapshots.
+
+Compares ``TableSnapshot`` against pickling the whole dealer, in size and
+in time to capture a table.
+
+Run it with ``python -m benchmarks.bench_snapshot``.
+"""
+import pickle
+import random
+import timeit
+
+from vinte_uno import snapshot, vinte_uno
+
+NUMBER = 5000
+SEATS = 5
+
+
+def main() -> None:
+    """Prints size and capture time of both representations."""
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Shoe(rng=random.Random(21)))
+    dealer.turn()
+    dealer.turn()
+
+    frozen = snapshot.TableSnapshot.freeze(dealer)
+    pickled = pickle.dumps(dealer, protocol=pickle.HIGHEST_PROTOCOL)
+    freeze = min(timeit.repeat(
+        lambda: snapshot.TableSnapshot.freeze(dealer), number=NUMBER, repeat=5,
+    )) / NUMBER
+    dump = min(timeit.repeat(
+        lambda: pickle.dumps(dealer, protocol=pickle.HIGHEST_PROTOCOL), number=NUMBER, repeat=5,
+    )) / NUMBER
+    restore = min(timeit.repeat(frozen.restore, number=NUMBER, repeat=5)) / NUMBER
+
+    print('pickled dealer:  {0:10d} bytes'.format(len(pickled)))  # noqa: WPS421
+    print('pickled snapshot:{0:10d} bytes'.format(len(pickle.dumps(frozen))))  # noqa: WPS421
+    print('snapshot arrays: {0:10d} bytes'.format(frozen.nbytes))  # noqa: WPS421
+    print('pickle.dumps:    {0:10.2f} us'.format(dump * 1e6))  # noqa: WPS421
+    print('freeze:          {0:10.2f} us'.format(freeze * 1e6))  # noqa: WPS421
+    print('restore:         {0:10.2f} us'.format(restore * 1e6))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
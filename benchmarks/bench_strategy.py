@@ -0,0 +1,33 @@
+"""Benchmarks building, loading and querying strategy tables.
+
+Run it with ``python -m benchmarks.bench_strategy``.
+"""
+import tempfile
+import time
+import timeit
+
+from vinte_uno import strategy
+
+NUMBER = 1000000
+
+
+def main() -> None:
+    """Prints build, cached load and lookup time of the default rules."""
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        service = strategy.Strategy.load(directory=directory)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        strategy.Strategy.load(directory=directory)
+        load = time.perf_counter() - start
+    lookup = min(timeit.repeat(
+        lambda: service.values(16, False, 10), number=NUMBER, repeat=5,
+    )) / NUMBER
+
+    print('build:       {0:10.2f} ms'.format(build * 1e3))  # noqa: WPS421
+    print('cached load: {0:10.2f} ms'.format(load * 1e3))  # noqa: WPS421
+    print('lookup:      {0:10.2f} ns'.format(lookup * 1e9))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Benchmarks memory of long simulations.
+
+Compares keeping the result of every round until the end against
+streaming records into ``runner.aggregate``, printing the peak memory
+traced for a growing number of rounds.
+
+Run it with ``python -m benchmarks.bench_stream``.
+"""
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from vinte_uno import runner, simulation, vinte_uno
+
+SETTINGS = runner.TableSettings(seats=3)
+ROUNDS = (1000, 10000, 50000)
+
+
+def collected(rounds: int) -> None:
+    """Plays a new table per round, results kept to be counted at the end.
+
+    :param rounds: Number of rounds
+    """
+    shoe = vinte_uno.Shoe(rng=random.Random(21))
+    results: List[simulation.RoundResult] = []
+    for _ in range(rounds):
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+        results.append(simulation.play_round(vinte_uno.Dealer(gamblers=gamblers, deck=shoe)))
+    assert len(results) == rounds  # noqa: S101
+
+
+def streamed(rounds: int) -> None:
+    """Streams the rounds of a table into an aggregate.
+
+    :param rounds: Number of rounds
+    """
+    result = runner.aggregate(runner.stream_table(21, SETTINGS._replace(rounds=rounds)))
+    assert result.rounds == rounds  # noqa: S101
+
+
+def measure(name: str, play: Callable[[int], None], rounds: int) -> None:
+    """Prints peak memory and throughput of an approach.
+
+    :param name: Approach name
+    :param play: Plays rounds
+    :param rounds: Number of rounds
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    play(rounds)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('{0:10} {1:7} rounds {2:10.1f} KiB peak {3:10.0f} rounds/s'.format(  # noqa: WPS421
+        name, rounds, peak / 1024, rounds / seconds,
+    ))
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    for rounds in ROUNDS:
+        measure('collected', collected, rounds)
+        measure('streamed', streamed, rounds)
+
+
+if __name__ == '__main__':
+    main()
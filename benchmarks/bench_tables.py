@@ -0,0 +1,84 @@
+"""Benchmarks stepping many tables per tick.
+
+Compares ``Dealer.turn`` called table by table, skipping finished tables
+by hand, against ``simulation.step_tables``.
+
+Run it with ``python -m benchmarks.bench_tables``.
+"""
+import random
+import time
+from typing import List
+
+from vinte_uno import simulation, vinte_uno
+
+TABLES = 10000
+SEATS = 3
+
+
+def tables() -> List[vinte_uno.Dealer]:
+    """Builds tables with seeded decks.
+
+    :return: Dealers of the tables
+    :rtype: List[vinte_uno.Dealer]
+    """
+    dealers = []
+    for seed in range(TABLES):
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+        deck = vinte_uno.Deck(rng=random.Random(seed))
+        dealers.append(vinte_uno.Dealer(gamblers=gamblers, deck=deck))
+    return dealers
+
+
+def loop(dealers: List[vinte_uno.Dealer]) -> int:
+    """Plays tables to the end one turn call at a time.
+
+    :param dealers: Dealers of the tables
+    :return: Number of table steps
+    :rtype: int
+    """
+    steps = 0
+    pending = dealers
+    while pending:
+        for dealer in pending:
+            dealer.turn()
+            for gambler in dealer.gamblers:
+                if gambler.state == vinte_uno.GAMING and gambler.hand >= simulation.STAND_ON:
+                    gambler.stay()
+        steps += len(pending)
+        pending = [
+            dealer for dealer in pending
+            if dealer.state not in simulation.FINAL_DEALER_STATES
+        ]
+    return steps
+
+
+def batched(dealers: List[vinte_uno.Dealer]) -> int:
+    """Plays tables to the end with step_tables.
+
+    :param dealers: Dealers of the tables
+    :return: Number of table steps
+    :rtype: int
+    """
+    steps = 0
+    while True:
+        tick = simulation.step_tables(dealers)
+        if not tick.stepped:
+            return steps
+        steps += tick.stepped
+        print('tick: {0:6d} tables {1:12.0f} steps/s'.format(  # noqa: WPS421
+            tick.stepped, tick.steps_per_second,
+        ))
+
+
+def main() -> None:
+    """Prints table steps per second of both loops."""
+    for name, play in (('turn loop', loop), ('step_tables', batched)):
+        dealers = tables()
+        start = time.perf_counter()
+        steps = play(dealers)
+        elapsed = time.perf_counter() - start
+        print('{0:12} {1:12.0f} steps/s'.format(name, steps / elapsed))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
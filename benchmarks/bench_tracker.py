@@ -0,0 +1,59 @@
+"""Benchmarks shoe composition queries.
+
+Compares a ``CountTracker`` kept up to date by ``Deck.pick`` against
+rescanning the cards left on the shoe for every query.
+
+Run it with ``python -m benchmarks.bench_tracker``.
+"""
+import random
+import timeit
+
+from vinte_uno import cards, probability
+
+NUMBER = 20000
+
+
+def drain(shoe: cards.Shoe) -> float:
+    """Measures the best time per card drawn until a shoe is empty.
+
+    :param shoe: A shoe object
+    :return: Seconds per pick
+    :rtype: float
+    """
+    timings = timeit.repeat(
+        'while shoe.cards: shoe.pick()',
+        setup='shoe.reshuffle()',
+        globals={'shoe': shoe},
+        number=1,
+        repeat=200,
+    )
+    return min(timings) / len(shoe.composition)
+
+
+def main() -> None:
+    """Prints query time of both approaches and pick overhead of tracking."""
+    tracker = cards.CountTracker()
+    shoe = cards.Shoe(decks=6, rng=random.Random(21), tracker=tracker)
+    for _ in range(100):
+        shoe.pick()
+
+    rescan = min(timeit.repeat(
+        lambda: probability.composition(shoe.cards), number=NUMBER // 100, repeat=5,
+    )) / (NUMBER // 100)
+    tracked = min(timeit.repeat(
+        lambda: (tracker.composition(), tracker.true_count, tracker.ten_probability),
+        number=NUMBER,
+        repeat=5,
+    )) / NUMBER
+
+    plain = drain(cards.Shoe(decks=6, rng=random.Random(21)))
+    counted = drain(cards.Shoe(decks=6, rng=random.Random(21), tracker=cards.CountTracker()))
+
+    print('rescan query:   {0:10.2f} us'.format(rescan * 1e6))  # noqa: WPS421
+    print('tracked query:  {0:10.2f} us'.format(tracked * 1e6))  # noqa: WPS421
+    print('pick:           {0:10.2f} ns'.format(plain * 1e9))  # noqa: WPS421
+    print('tracked pick:   {0:10.2f} ns'.format(counted * 1e9))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Benchmarks the binary wire format.
+
+Compares encoding every hand of a table against JSON encoding the
+``Player.show`` output, and encoding table snapshots and round results.
+
+Run it with ``python -m benchmarks.bench_wire``.
+"""
+import json
+import random
+import timeit
+
+from vinte_uno import simulation, snapshot, vinte_uno, wire
+
+NUMBER = 5000
+SEATS = 5
+
+
+def main() -> None:
+    """Prints size and time per message of each encoding."""
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Deck(rng=random.Random(21)))
+    dealer.turn()
+    dealer.turn()
+    players = [dealer, *gamblers]
+    frozen = snapshot.TableSnapshot.freeze(dealer)
+    table = wire.encode_table(frozen)
+
+    def show_json() -> bytes:  # noqa: WPS430
+        return json.dumps([player.show() for player in players]).encode()
+
+    def hands_binary() -> bytes:  # noqa: WPS430
+        return b''.join(wire.encode_hand(player) for player in players)
+
+    timings = (
+        ('json show()', show_json, len(show_json())),
+        ('binary hands', hands_binary, len(hands_binary())),
+        ('binary table', lambda: wire.encode_table(frozen), len(table)),
+        ('decode table', lambda: wire.decode_table(table), len(table)),
+    )
+    for label, function, size in timings:
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+        line = '{0:14s} {1:6d} bytes {2:10.2f} us'.format(label, size, seconds * 1e6)
+        print(line)  # noqa: WPS421
+
+    result = simulation.play_round(dealer)
+    print('binary round   {0:6d} bytes'.format(len(wire.encode_round(result))))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
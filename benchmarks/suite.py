@@ -0,0 +1,268 @@
+"""Benchmark suite of the game engine hot paths.
+
+Every case is timed with ``timeit`` on seeded decks, keeping the best of
+``REPEAT`` runs. Results are stored as JSON, and ``compare`` fails when a
+case got slower than a baseline beyond a threshold, cases measured over
+the threshold being measured once more to rule out noise.
+
+Run it with ``python -m benchmarks.suite run --output results.json`` and
+``python -m benchmarks.suite compare benchmarks/baseline.json``.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess  # noqa: S404
+import sys
+import timeit
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence
+
+from vinte_uno import runner, simulation, vinte_uno
+
+REPEAT = 5
+THRESHOLD = 0.25
+SEATS = 3
+Case = Callable[[], Callable[[], object]]
+
+
+def _gamblers() -> List[vinte_uno.Gambler]:
+    return [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(SEATS)]
+
+
+def _holding(cards: Sequence[str]) -> vinte_uno.Gambler:
+    gambler = vinte_uno.Gambler(name='Gambler')
+    gambler.cards = [vinte_uno.CARD_IDS[rank, 'hearts'] for rank in cards]
+    return gambler
+
+
+def deck_construction() -> Callable[[], object]:
+    """Builds and shuffles a deck.
+
+    :return: Timed function
+    """
+    rng = random.Random(21)
+    return lambda: vinte_uno.Deck(rng=rng)
+
+
+def deck_pick() -> Callable[[], object]:
+    """Draws every card of a deck.
+
+    :return: Timed function
+    """
+    deck = vinte_uno.Deck(rng=random.Random(21))
+    cards = array('B', deck.cards)
+
+    def drain() -> None:  # noqa: WPS430
+        deck.cards[:] = cards
+        while deck.cards:
+            deck.pick()
+    return drain
+
+
+def player_hand() -> Callable[[], object]:
+    """Evaluates a soft hand.
+
+    :return: Timed function
+    """
+    gambler = _holding(('ace', '4', '3'))
+    return lambda: gambler.hand
+
+
+def player_show() -> Callable[[], object]:
+    """Shows a three cards hand.
+
+    :return: Timed function
+    """
+    gambler = _holding(('ace', '4', '3'))
+    return gambler.show
+
+
+def gambler_construction() -> Callable[[], object]:
+    """Builds a gambler.
+
+    :return: Timed function
+    """
+    return lambda: vinte_uno.Gambler(name='Gambler')
+
+
+def dealer_construction() -> Callable[[], object]:
+    """Builds a dealer, its gamblers and its deck.
+
+    :return: Timed function
+    """
+    rng = random.Random(21)
+    return lambda: vinte_uno.Dealer(gamblers=_gamblers(), deck=vinte_uno.Deck(rng=rng))
+
+
+def full_round() -> Callable[[], object]:
+    """Plays a round through ``Dealer.turn`` on a new table.
+
+    :return: Timed function
+    """
+    rng = random.Random(21)
+
+    def play() -> None:  # noqa: WPS430
+        dealer = vinte_uno.Dealer(gamblers=_gamblers(), deck=vinte_uno.Deck(rng=rng))
+        simulation.play_round(dealer)
+    return play
+
+
+def tables() -> Callable[[], object]:
+    """Plays ten tables of ten rounds on shoes.
+
+    :return: Timed function
+    """
+    settings = runner.TableSettings(rounds=10, seats=SEATS)
+    return lambda: runner.run_tables(range(10), settings)
+
+
+def _importing(statement: str) -> Callable[[], object]:
+    command = [sys.executable, '-c', statement]
+    return lambda: subprocess.run(command, check=True)  # noqa: S603
+
+
+def import_cards() -> Callable[[], object]:
+    """Starts an interpreter evaluating hands with ``vinte_uno.cards``.
+
+    :return: Timed function
+    """
+    return _importing('from vinte_uno.cards import Hand; Hand([0, 12]).hand')
+
+
+def import_engine() -> Callable[[], object]:
+    """Starts an interpreter building the player state machines.
+
+    :return: Timed function
+    """
+    return _importing('from vinte_uno import vinte_uno; vinte_uno.Gambler.machine')
+
+
+CASES: Dict[str, Case] = {
+    'deck_construction': deck_construction,
+    'deck_pick': deck_pick,
+    'player_hand': player_hand,
+    'player_show': player_show,
+    'gambler_construction': gambler_construction,
+    'dealer_construction': dealer_construction,
+    'full_round': full_round,
+    'tables': tables,
+    'import_cards': import_cards,
+    'import_engine': import_engine,
+}
+
+
+def measure(case: Case, repeat: int = REPEAT) -> float:
+    """Measures the best time per call of a case.
+
+    :param case: Builds the timed function
+    :type case: Case
+    :param repeat: Number of timed runs
+    :type repeat: int
+    :return: Seconds per call
+    :rtype: float
+    """
+    timer = timeit.Timer(case())
+    number, _ = timer.autorange()
+    return min(timer.repeat(number=number, repeat=repeat)) / number
+
+
+def run(names: Optional[Sequence[str]] = None) -> Dict[str, object]:
+    """Runs cases of the suite.
+
+    :param names: Cases to run, all of them by default
+    :type names: Optional[Sequence[str]]
+    :return: Results with the platform they were measured on
+    :rtype: Dict[str, object]
+    """
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'benchmarks': {name: measure(CASES[name]) for name in names or CASES},
+    }
+
+
+def compare(
+    baseline: Dict[str, float],
+    current: Dict[str, float],
+    threshold: float = THRESHOLD,
+) -> List[str]:
+    """Prints the ratio of each case to its baseline.
+
+    :param baseline: Seconds per call of stored cases
+    :type baseline: Dict[str, float]
+    :param current: Seconds per call of measured cases
+    :type current: Dict[str, float]
+    :param threshold: Slowdown tolerated, 0.25 for 25%
+    :type threshold: float
+    :return: Cases slower than tolerated
+    :rtype: List[str]
+    """
+    regressions = []
+    for name, seconds in current.items():
+        if name not in baseline:
+            print('{0:22} {1:12.3f} us   (no baseline)'.format(name, seconds * 1e6))  # noqa: WPS421
+            continue
+        ratio = seconds / baseline[name]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        print('{0:22} {1:12.3f} us {2:8.2f} x{3}'.format(  # noqa: WPS421
+            name, seconds * 1e6, ratio, '  REGRESSION' if regressed else '',
+        ))
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the command line interface.
+
+    :param argv: Command line arguments
+    :type argv: Optional[Sequence[str]]
+    :return: Exit status, 1 on regressions
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the suite')
+    run_parser.add_argument('--output', help='JSON file to store results to')
+    run_parser.add_argument('cases', nargs='*', help='cases to run, all by default')
+    compare_parser = commands.add_parser('compare', help='compare against a baseline')
+    compare_parser.add_argument('baseline', help='JSON file of stored results')
+    compare_parser.add_argument('current', nargs='?', help='JSON file, the suite runs when missing')
+    compare_parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == 'run':
+        unknown = sorted(set(arguments.cases) - set(CASES))
+        if unknown:
+            parser.error('unknown cases: {0}'.format(', '.join(unknown)))
+        results = run(arguments.cases)
+        for name, seconds in results['benchmarks'].items():  # type: ignore
+            print('{0:22} {1:12.3f} us'.format(name, seconds * 1e6))  # noqa: WPS421
+        if arguments.output:
+            with open(arguments.output, 'w') as output:
+                json.dump(results, output, indent=2, sort_keys=True)
+                output.write('\n')
+        return 0
+
+    with open(arguments.baseline) as stored:
+        baseline = json.load(stored)['benchmarks']
+    if arguments.current:
+        with open(arguments.current) as stored:
+            current = json.load(stored)['benchmarks']
+    else:
+        current = run()['benchmarks']  # type: ignore
+        for name, seconds in current.items():
+            if name in baseline and seconds > baseline[name] * (1 + arguments.threshold):
+                current[name] = min(seconds, measure(CASES[name]))
+    regressions = compare(baseline, current, arguments.threshold)
+    if regressions:
+        print('Regressed beyond {0:.0%}: {1}'.format(  # noqa: WPS421
+            arguments.threshold, ', '.join(regressions),
+        ))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
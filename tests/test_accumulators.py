@@ -0,0 +1,133 @@
+"""Tests for `vinte_uno.accumulators` module."""
+import pathlib
+import pickle
+import random
+import statistics
+
+import pytest
+
+from vinte_uno import accumulators, history, runner, simulation, vinte_uno
+
+
+def test_moments_should_merge_as_one_series() -> None:
+    """Test if merged moments match the moments of the whole series.
+    """
+    rng = random.Random(21)
+    values = [rng.randint(-5, 9) for _ in range(1000)]
+    whole = accumulators.Moments()
+    parts = [accumulators.Moments(), accumulators.Moments(), accumulators.Moments()]
+    for index, value in enumerate(values):
+        whole.add(value)
+        parts[index % 3].add(value)
+
+    merged = accumulators.Moments()
+    for part in parts:
+        merged.merge(part)
+
+    for moments in (whole, merged):
+        assert moments.count == 1000
+        assert moments.mean == pytest.approx(statistics.mean(values))
+        assert moments.variance == pytest.approx(statistics.variance(values))
+        assert (moments.minimum, moments.maximum) == (min(values), max(values))
+
+
+def test_quantile_sketch_should_be_relatively_accurate() -> None:
+    """Test if estimated quantiles are within the relative accuracy.
+    """
+    rng = random.Random(21)
+    values = sorted(rng.lognormvariate(0, 2) * rng.choice((-1, 1)) for _ in range(5000))
+    values.extend([0.0] * 100)
+    values.sort()
+    sketch = accumulators.QuantileSketch(relative_accuracy=0.02)
+    other = accumulators.QuantileSketch(relative_accuracy=0.02)
+    for index, value in enumerate(values):
+        (sketch if index % 2 else other).add(value)
+    sketch.merge(other)
+
+    for quantile in (0, 0.01, 0.25, 0.5, 0.75, 0.99, 1):
+        exact = values[int(quantile * (len(values) - 1))]
+        assert sketch.quantile(quantile) == pytest.approx(exact, rel=0.02)
+    assert accumulators.QuantileSketch().quantile(0.5) is None
+    with pytest.raises(ValueError, match='same relative accuracy'):
+        sketch.merge(accumulators.QuantileSketch())
+
+
+def test_quantile_sketch_should_bound_buckets() -> None:
+    """Test if a sketch collapses its smallest buckets past its limit.
+    """
+    sketch = accumulators.QuantileSketch(max_buckets=16)
+    for exponent in range(100):
+        sketch.add(1.5 ** exponent)
+
+    assert len(sketch.positive) == 16
+    assert sketch.count == 100
+    assert sketch.quantile(1) == pytest.approx(1.5 ** 99, rel=0.01)
+
+
+def test_round_statistics_should_merge_tables() -> None:
+    """Test if statistics of tables merge as the statistics of all rounds.
+    """
+    settings = runner.TableSettings(rounds=100, seats=3)
+    tables = [accumulators.collect(runner.stream_table(seed, settings)) for seed in range(4)]
+    records = [record for seed in range(4) for record in runner.stream_table(seed, settings)]
+    whole = accumulators.collect(records)
+
+    merged = pickle.loads(pickle.dumps(tables[0]))
+    for table in tables[1:]:
+        merged.merge(table)
+
+    aggregate = runner.aggregate(records)
+    assert merged.rounds == whole.rounds == 400
+    assert merged.gambler_states == whole.gambler_states == list(aggregate.gambler_states)
+    assert merged.dealer_states == whole.dealer_states == list(aggregate.dealer_states)
+    assert merged.credits.mean == pytest.approx(whole.credits.mean)
+    assert merged.credits.variance == pytest.approx(whole.credits.variance)
+    assert merged.quantiles.quantile(0.5) == whole.quantiles.quantile(0.5)
+    assert sum(merged.frequencies().values()) == pytest.approx(1)
+
+
+def test_statistics_listener_should_add_finished_rounds() -> None:
+    """Test if a dealer listener adds each round once its dealer is done.
+    """
+    stats = accumulators.RoundStatistics()
+    deck = vinte_uno.Shoe(rng=random.Random(21))
+    results = []
+    for _ in range(20):
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(2)]
+        dealer = vinte_uno.Dealer(gamblers=gamblers, deck=deck)
+        dealer.listener = accumulators.StatisticsListener(stats)
+        results.append(simulation.play_round(dealer))
+
+    assert stats.rounds == 20
+    assert stats.credits.count == 40
+    assert stats.credits.mean == pytest.approx(
+        statistics.mean(credit - 1 for result in results for credit in result.credits),
+    )
+    assert stats.dealer_states[vinte_uno.DEALER_STATES.index(vinte_uno.BUSTED)] == sum(
+        result.dealer_state == vinte_uno.BUSTED for result in results
+    )
+
+
+def test_statistics_listener_should_share_dealer_with_history(tmp_path: pathlib.Path) -> None:
+    """Test if statistics and history both follow a dealer.
+
+    :param tmp_path: Temporary directory
+    :type tmp_path: pathlib.Path
+    """
+    stats = accumulators.RoundStatistics()
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(2)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Shoe(rng=random.Random(21)))
+    listener = accumulators.StatisticsListener(stats)
+    dealer.listener = listener
+    with history.HistoryLog(str(tmp_path)) as log:
+        recorder = history.HistoryRecorder(log)
+        recorder.attach(dealer)
+        simulation.play_round(dealer)
+        recorder.detach(dealer)
+
+    seats = history.HistoryReplay(str(tmp_path)).rebuild(0)
+
+    assert stats.rounds == 1
+    assert seats[history.DEALER_SEAT].cards == list(dealer.cards)
+    assert dealer.listener is listener
+    assert all(gambler.listener is None for gambler in gamblers)
@@ -0,0 +1,54 @@
+"""Tests for `vinte_uno.events` module."""
+import random
+
+import pytest
+
+from vinte_uno import events, simulation, vinte_uno
+
+
+def _table(seats: int, seed: int) -> vinte_uno.Dealer:
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(seats)]
+    return vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Shoe(rng=random.Random(seed)))
+
+
+@pytest.mark.parametrize('seats', [0, 1, 3, 40])
+def test_play_should_end_as_turns(seats: int) -> None:
+    """Test if rounds played on events end as rounds played by turns.
+
+    :param seats: Number of gamblers
+    :type seats: int
+    """
+    for seed in range(30):
+        expected = simulation.play_round(_table(seats, seed))
+
+        result = events.play(_table(seats, seed))
+
+        assert result == expected
+
+
+def test_event_table_should_apply_queued_actions() -> None:
+    """Test if queued actions advance the table, the dealer playing last.
+    """
+    gambler1 = vinte_uno.Gambler(name='Gambler 1')
+    gambler2 = vinte_uno.Gambler(name='Gambler 2')
+    deck = simulation.stacked_deck([
+        vinte_uno.CARD_IDS[rank, 'hearts']
+        for rank in ('10', '9', '10', '9', '4', '8', 'Jack', '2')
+    ])
+    table = events.EventTable(vinte_uno.Dealer(gamblers=[gambler1, gambler2], deck=deck))
+    table.start()
+
+    assert table.gaming == 2
+    assert table.dealer.state == vinte_uno.HIDING
+    table.push(0, events.STAY)
+    table.push(1, events.HIT)
+    table.push(1, events.HIT)
+
+    assert table.process() == 2
+    assert (gambler1.state, gambler2.state) == (vinte_uno.STAYED, vinte_uno.BUSTED)
+    assert table.gaming == 0
+    assert table.finished
+    assert (table.dealer.state, table.dealer.hand) == (vinte_uno.STAYED, 18)
+    assert (gambler1.credit, gambler2.credit) == (2, 0)
+    with pytest.raises(ValueError, match='Unknown action'):
+        table.push(0, 'double')
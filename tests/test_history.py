@@ -0,0 +1,151 @@
+"""Tests for `vinte_uno.history` module."""
+import os
+import pathlib
+import random
+
+from vinte_uno import history, simulation, vinte_uno
+
+
+def play_recorded_round(
+    recorder: history.HistoryRecorder,
+    seed: int,
+    seats: int = 3,
+) -> vinte_uno.Dealer:
+    """Plays a round of a recorded table.
+
+    :param recorder: History recorder
+    :type recorder: history.HistoryRecorder
+    :param seed: Seed of the deck
+    :type seed: int
+    :param seats: Number of gamblers
+    :type seats: int
+    :return: Dealer of the finished round
+    :rtype: vinte_uno.Dealer
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(seats)]
+    deck = vinte_uno.Shoe(decks=seats // 10 + 1, rng=random.Random(seed))
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=deck)
+    recorder.attach(dealer)
+    simulation.play_round(dealer)
+    recorder.detach(dealer)
+    return dealer
+
+
+def test_replay_should_rebuild_finished_tables(tmp_path: pathlib.Path) -> None:
+    """Test if replay rebuilds every recorded table.
+
+    :param tmp_path: Temporary directory
+    :type tmp_path: pathlib.Path
+    """
+    with history.HistoryLog(str(tmp_path)) as log:
+        recorder = history.HistoryRecorder(log)
+        dealers = [play_recorded_round(recorder, seed) for seed in range(20)]
+
+    replay = history.HistoryReplay(str(tmp_path))
+    for table, dealer in enumerate(dealers):
+        seats = replay.rebuild(table)
+        assert seats[history.DEALER_SEAT].state == dealer.state
+        assert seats[history.DEALER_SEAT].cards == list(dealer.cards)
+        assert seats[history.DEALER_SEAT].credit == dealer.credit
+        for seat, gambler in enumerate(dealer.gamblers):
+            assert seats[seat].state == gambler.state
+            assert seats[seat].cards == list(gambler.cards)
+            assert seats[seat].credit == gambler.credit
+
+
+def test_replay_should_rebuild_tables_of_many_seats(tmp_path: pathlib.Path) -> None:
+    """Test if replay keeps the dealer apart from gambler seats past 255.
+
+    :param tmp_path: Temporary directory
+    :type tmp_path: pathlib.Path
+    """
+    with history.HistoryLog(str(tmp_path)) as log:
+        dealer = play_recorded_round(history.HistoryRecorder(log), seed=21, seats=300)
+
+    seats = history.HistoryReplay(str(tmp_path)).rebuild(0)
+
+    assert len(seats) == 301
+    assert seats[history.DEALER_SEAT].cards == list(dealer.cards)
+    assert seats[history.DEALER_SEAT].credit == dealer.credit
+    for seat, gambler in enumerate(dealer.gamblers):
+        assert seats[seat].state == gambler.state
+        assert seats[seat].cards == list(gambler.cards)
+        assert seats[seat].credit == gambler.credit
+
+
+def test_replay_should_rebuild_tables_at_any_turn(tmp_path: pathlib.Path) -> None:
+    """Test if replay rebuilds a table after a given number of turns.
+
+    :param tmp_path: Temporary directory
+    :type tmp_path: pathlib.Path
+    """
+    with history.HistoryLog(str(tmp_path)) as log:
+        play_recorded_round(history.HistoryRecorder(log), seed=21)
+
+    replay = history.HistoryReplay(str(tmp_path))
+    start = replay.rebuild(0, turns=0)
+    first = replay.rebuild(0, turns=1)
+    second = replay.rebuild(0, turns=2)
+
+    assert [seat.cards for seat in start.values()] == [[], [], [], []]
+    assert all(len(seat.cards) == 1 for seat in first.values())
+    assert first[0].state == vinte_uno.GAMING
+    assert first[history.DEALER_SEAT].state == vinte_uno.STARTED
+    assert len(second[history.DEALER_SEAT].cards) == 2
+    assert second[history.DEALER_SEAT].state == vinte_uno.HIDING
+
+
+def test_replay_should_rebuild_reset_tables(tmp_path: pathlib.Path) -> None:
+    """Test if replay starts a seat over when its table is reset.
+
+    :param tmp_path: Temporary directory
+    :type tmp_path: pathlib.Path
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Shoe(rng=random.Random(5)))
+    with history.HistoryLog(str(tmp_path)) as log:
+        history.HistoryRecorder(log).attach(dealer)
+        simulation.play_round(dealer)
+        dealer.reset(credit=3, gambler_credit=2)
+        log.flush()
+        reset = history.HistoryReplay(str(tmp_path)).rebuild(0)
+        simulation.play_round(dealer)
+
+    seats = history.HistoryReplay(str(tmp_path)).rebuild(0)
+
+    assert reset[history.DEALER_SEAT].cards == []
+    assert reset[history.DEALER_SEAT].credit == 3
+    assert reset[history.DEALER_SEAT].state == vinte_uno.DEAL_PENDING
+    assert all(reset[seat].cards == [] for seat in range(3))
+    assert all(reset[seat].credit == 2 for seat in range(3))
+    assert seats[history.DEALER_SEAT].state == dealer.state
+    assert seats[history.DEALER_SEAT].cards == list(dealer.cards)
+    assert seats[history.DEALER_SEAT].credit == dealer.credit
+    for seat, gambler in enumerate(dealer.gamblers):
+        assert seats[seat].state == gambler.state
+        assert seats[seat].cards == list(gambler.cards)
+        assert seats[seat].credit == gambler.credit
+
+
+def test_log_should_split_fixed_size_segments(tmp_path: pathlib.Path) -> None:
+    """Test if log rolls segments holding fixed-size records.
+
+    :param tmp_path: Temporary directory
+    :type tmp_path: pathlib.Path
+    """
+    with history.HistoryLog(str(tmp_path), segment_records=10) as log:
+        recorder = history.HistoryRecorder(log)
+        for seed in range(5):
+            play_recorded_round(recorder, seed)
+
+    names = history.segments(str(tmp_path))
+    records = list(history.HistoryReplay(str(tmp_path)).records())
+    sizes = [os.path.getsize(os.path.join(str(tmp_path), name)) for name in names]
+
+    assert len(names) == (len(records) + 9) // 10
+    assert all(size == 10 * history.RECORD.size for size in sizes[:-1])
+    assert [record.sequence for record in records if record.table == 0] == list(
+        range(sum(record.table == 0 for record in records)),
+    )
+    with history.HistoryLog(str(tmp_path), segment_records=10) as log:
+        assert log.segment == len(names)
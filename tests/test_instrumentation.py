@@ -0,0 +1,70 @@
+"""Tests for `vinte_uno.instrumentation` module."""
+import random
+from pathlib import Path
+
+import pytest
+
+from vinte_uno import instrumentation, simulation, vinte_uno
+
+
+def play(seed: int) -> vinte_uno.Dealer:
+    """Plays a round of a seeded table.
+
+    :param seed: Seed of the deck
+    :type seed: int
+    :return: Dealer of the finished round
+    :rtype: vinte_uno.Dealer
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Deck(rng=random.Random(seed)))
+    simulation.play_round(dealer)
+    return dealer
+
+
+def test_profiler_should_time_engine_calls() -> None:
+    """Test if calls are counted while enabled only.
+    """
+    turn = vars(vinte_uno.Dealer)['turn']
+    hand = vars(vinte_uno.Hand)['hand']
+    profiler = instrumentation.Profiler()
+
+    with profiler:
+        play(1)
+    play(2)
+    timings = profiler.snapshot()
+
+    assert vars(vinte_uno.Dealer)['turn'] is turn
+    assert vars(vinte_uno.Hand)['hand'] is hand
+    assert timings['Dealer.turn'].calls == timings['Dealer._hit'].calls > 1
+    assert timings['Dealer.deal'].calls == 1
+    assert timings['Gambler.play'].calls == 3
+    assert timings['Hand.value'].calls > 0
+    assert sum(timings['Deck.pick'].buckets) == timings['Deck.pick'].calls
+    assert timings['Dealer.turn'].seconds >= timings['Dealer._hit'].seconds
+    profiler.reset()
+    assert profiler.snapshot() == {}
+
+
+def test_profiler_should_raises_value_error() -> None:
+    """Test if only one profiler is enabled at once.
+    """
+    with instrumentation.Profiler():
+        with pytest.raises(ValueError, match='Another profiler is enabled!'):
+            instrumentation.Profiler().enable()
+    assert instrumentation.Profiler.active is None
+
+
+def test_write_prometheus_should_export_histograms(tmp_path: Path) -> None:
+    """Test if histograms are written in the Prometheus text format.
+    """
+    path = tmp_path / 'vinte_uno.prom'
+    with instrumentation.Profiler() as profiler:
+        play(3)
+
+    profiler.write_prometheus(str(path))
+    lines = path.read_text().splitlines()
+
+    assert lines[1] == '# TYPE vinte_uno_call_seconds histogram'
+    assert 'vinte_uno_call_seconds_bucket{name="Dealer.deal",le="+Inf"} 1' in lines
+    assert 'vinte_uno_call_seconds_count{name="Dealer.deal"} 1' in lines
+    assert list(tmp_path.iterdir()) == [path]
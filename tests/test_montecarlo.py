@@ -0,0 +1,90 @@
+"""Tests for `vinte_uno.montecarlo` module."""
+import pytest
+
+from vinte_uno import simulation, vinte_uno
+
+np = pytest.importorskip('numpy')
+montecarlo = pytest.importorskip('vinte_uno.montecarlo')
+
+
+@pytest.mark.parametrize(('seats', 'stand_on'), [
+    (1, 17),
+    (3, 15),
+    (5, 19),
+    (2, 10),
+])
+def test_play_should_match_object_engine(seats: int, stand_on: int) -> None:
+    """Test if batch rounds have the same outcome as the object engine.
+
+    :param seats: Number of gamblers per table
+    :type seats: int
+    :param stand_on: Points from which gamblers stay
+    :type stand_on: int
+    """
+    shoes = montecarlo.deal_shoes(300, seed=21)
+
+    outcomes = montecarlo.play(shoes, seats=seats, stand_on=stand_on)
+
+    for index, shoe in enumerate(shoes):
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(seats)]
+        dealer = vinte_uno.Dealer(gamblers=gamblers, deck=simulation.stacked_deck(shoe))
+        result = simulation.play_round(dealer, stand_on=stand_on)
+        assert result == (
+            vinte_uno.DEALER_STATES[outcomes.dealer_states[index]],
+            outcomes.dealer_hands[index],
+            tuple(vinte_uno.GAMBLER_STATES[state] for state in outcomes.gambler_states[index]),
+            tuple(outcomes.gambler_hands[index]),
+            tuple(outcomes.credits[index]),
+        )
+
+
+def test_play_should_match_object_engine_payouts() -> None:
+    """Test if batch rounds follow the payout ratios of the object engine.
+    """
+    payouts = vinte_uno.Payouts(win=1.5, twenty_one=2, push=0.5, loss=0.5, bust=0.75)
+    shoes = montecarlo.deal_shoes(300, seed=7)
+
+    outcomes = montecarlo.play(shoes, seats=3, bet=4, payouts=payouts)
+
+    for index, shoe in enumerate(shoes):
+        gamblers = [
+            vinte_uno.Gambler(name='Gambler {0}'.format(seat), credit=4) for seat in range(3)
+        ]
+        dealer = vinte_uno.Dealer(
+            gamblers=gamblers, deck=simulation.stacked_deck(shoe), payouts=payouts,
+        )
+        result = simulation.play_round(dealer)
+        assert result.credits == tuple(outcomes.credits[index])
+
+
+def test_deal_shoes_should_be_seeded() -> None:
+    """Test if shoes are full, shuffled and reproducible.
+    """
+    shoes = montecarlo.deal_shoes(10, decks=2, seed=21)
+
+    assert shoes.shape == (10, 104)
+    assert np.array_equal(shoes, montecarlo.deal_shoes(10, decks=2, seed=21))
+    assert np.array_equal(np.sort(shoes[0]), np.repeat(np.arange(52), 2))
+    assert not np.array_equal(shoes[0], shoes[1])
+
+
+def test_simulate_should_summarize_rounds() -> None:
+    """Test if simulation returns consistent and reproducible statistics.
+    """
+    summary = montecarlo.simulate(2000, seats=2, seed=21)
+
+    assert summary == montecarlo.simulate(2000, seats=2, seed=21)
+    assert summary.rounds == 2000
+    assert summary.hands == 4000
+    assert 0 < summary.dealer_bust_rate < 1
+    assert 0 < summary.gambler_bust_rate < 1
+    assert summary.payout_variance > 0
+
+
+def test_play_should_raises_value_error() -> None:
+    """Test if playing raises ValueError when a shoe runs out of cards.
+    """
+    shoes = montecarlo.deal_shoes(10, seed=21)[:, :3]
+
+    with pytest.raises(ValueError, match="Doesn't have enough cards!"):
+        montecarlo.play(shoes, seats=2)
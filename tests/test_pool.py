@@ -0,0 +1,35 @@
+"""Tests for `vinte_uno.pool` module."""
+import random
+
+from vinte_uno import pool, simulation, vinte_uno
+
+
+def test_pool_should_reuse_released_tables() -> None:
+    """Test if released tables are reset and lent again.
+    """
+    tables = pool.TablePool(seats=2, bet=3, size=1)
+    dealer = tables.acquire()
+    gamblers = list(dealer.gamblers)
+
+    simulation.play_round(dealer)
+    tables.release(dealer)
+
+    assert len(tables) == 1
+    assert tables.acquire() is dealer
+    assert dealer.state == vinte_uno.DEAL_PENDING
+    assert [gambler.credit for gambler in dealer.gamblers] == [3, 3]
+    assert all(gambler in gamblers for gambler in dealer.gamblers)
+    assert len(dealer.deck.cards) == 52
+
+
+def test_pool_should_keep_shoes_until_cut_card() -> None:
+    """Test if shoes are not refilled on release.
+    """
+    tables = pool.TablePool(deck_factory=lambda: vinte_uno.Shoe(rng=random.Random(1)))
+    dealer = tables.acquire()
+
+    simulation.play_round(dealer)
+    remaining = len(dealer.deck.cards)
+    tables.release(dealer)
+
+    assert len(tables.acquire().deck.cards) == remaining < 312
@@ -0,0 +1,76 @@
+"""Tests for `vinte_uno.probability` module."""
+import itertools
+from collections import Counter
+from typing import List
+
+import pytest
+
+from vinte_uno import probability, vinte_uno
+
+
+def enumerate_dealer(up_card: int, cards: List[int]) -> Counter:
+    """Plays the dealer over every ordering of a small shoe.
+
+    :param up_card: Card id of the dealer up-card
+    :type up_card: int
+    :param cards: Card ids left on the shoe
+    :type cards: List[int]
+    :return: Number of orderings ending on each final hand, 22 for bust
+    :rtype: Counter
+    """
+    outcomes: Counter = Counter()
+    for order in itertools.permutations(cards):
+        dealer = vinte_uno.Dealer(gamblers=[])
+        dealer.add_card(up_card)
+        for card_id in order:
+            if dealer.hand >= vinte_uno.DEALER_RANK_POINTS_LIMIT:
+                break
+            dealer.add_card(card_id)
+        outcomes[min(dealer.hand, 22)] += 1
+    return outcomes
+
+
+def test_dealer_odds_should_match_enumeration() -> None:
+    """Test if odds match every ordering of a small shoe.
+    """
+    cards = [
+        vinte_uno.CARD_IDS[rank, 'hearts'] for rank in ('ace', '2', '5', '6', '10', 'King', '4')
+    ]
+    up_card = vinte_uno.CARD_IDS['6', 'spades']
+    outcomes = enumerate_dealer(up_card, cards)
+    orderings = sum(outcomes.values())
+
+    result = probability.dealer_odds(6, probability.composition(cards))
+
+    assert result == pytest.approx([outcomes[total] / orderings for total in range(17, 23)])
+
+
+def test_dealer_odds_should_sum_to_one() -> None:
+    """Test if odds on a full shoe sum to one for every up-card.
+    """
+    counts = probability.shoe_composition(decks=6)
+
+    for weight in probability.WEIGHTS:
+        assert sum(probability.dealer_odds(weight, counts)) == pytest.approx(1)
+    assert counts == (24,) * 9 + (96,)
+
+
+def test_dealer_odds_should_be_cached() -> None:
+    """Test if a query is answered from cache once warm.
+    """
+    probability.clear_cache()
+    counts = probability.shoe_composition()
+    result = probability.dealer_odds(10, counts)
+    misses = probability.dealer_odds.cache_info().misses
+
+    assert probability.dealer_odds(10, counts) is result
+    assert probability.dealer_odds.cache_info().misses == misses
+
+
+def test_dealer_odds_should_raises_value_error() -> None:
+    """Test if odds raise ValueError on unknown weights or empty shoes.
+    """
+    with pytest.raises(ValueError, match='Unknown card weight 11!'):
+        probability.dealer_odds(11, probability.shoe_composition())
+    with pytest.raises(ValueError, match="Doesn't have enough cards!"):
+        probability.dealer_odds(2, (0,) * 9 + (1,))
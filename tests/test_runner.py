@@ -0,0 +1,74 @@
+"""Tests for `vinte_uno.runner` module."""
+import io
+
+from vinte_uno import runner, vinte_uno
+
+
+def test_table_seed_should_be_deterministic() -> None:
+    """Test if table seeds derive from master seed only.
+    """
+    assert runner.table_seed(21, 3) == runner.table_seed(21, 3)
+    assert runner.table_seed(21, 3) != runner.table_seed(21, 4)
+    assert runner.table_seed(21, 3) != runner.table_seed(22, 3)
+
+
+def test_aggregate_should_merge() -> None:
+    """Test if aggregates merge all counters.
+    """
+    aggregate = runner.Aggregate(
+        rounds=1,
+        credits_won=2,
+        credits_lost=3,
+        gambler_states=(1, 0, 0, 0, 2),
+        dealer_states=(0, 0, 0, 0, 1, 0),
+    )
+
+    result = aggregate.merge(aggregate).merge(runner.Aggregate())
+
+    assert result == (2, 4, 6, (2, 0, 0, 0, 4), (0, 0, 0, 0, 2, 0))
+
+
+def test_run_should_not_depend_on_workers() -> None:
+    """Test if a run is reproduced whatever the number of workers.
+    """
+    settings = runner.TableSettings(rounds=20, seats=2)
+
+    result1 = runner.run(tables=6, settings=settings, master_seed=21, workers=1)
+    result2 = runner.run(tables=6, settings=settings, master_seed=21, workers=2)
+    result3 = runner.run(tables=6, settings=settings, master_seed=22, workers=2)
+
+    assert result1 == result2
+    assert result1 != result3
+    assert result1.rounds == 120
+    assert sum(result1.gambler_states) == 240
+    assert sum(result1.dealer_states) == 120
+    assert result1.gambler_states[vinte_uno.GAMBLER_STATES.index(vinte_uno.GAMING)] == 0
+
+
+def test_stream_table_should_yield_records_until_stopped() -> None:
+    """Test if a streamed table yields a record per round and stops early.
+    """
+    settings = runner.TableSettings(rounds=50, seats=2)
+
+    records = list(runner.stream_table(21, settings))
+    stopped = list(runner.stream_table(21, settings, stop=lambda record: record.number == 9))
+
+    assert [record.number for record in records] == list(range(50))
+    assert stopped == records[:10]
+    assert all(len(record.deltas) == len(record.gambler_hands) == 2 for record in records)
+    assert runner.aggregate(records) == runner.run_table(21, settings)
+
+
+def test_write_csv_should_write_a_row_per_record() -> None:
+    """Test if records are written with a header naming every seat.
+    """
+    output = io.StringIO()
+    records = runner.stream_table(21, runner.TableSettings(rounds=4, seats=2))
+
+    written = runner.write_csv(records, output)
+
+    lines = output.getvalue().splitlines()
+    assert written == 4
+    assert len(lines) == 5
+    assert lines[0].split(',')[-3:] == ['gambler_1_state', 'gambler_1_hand', 'gambler_1_delta']
+    assert lines[1].startswith('0,')
@@ -0,0 +1,97 @@
+"""Tests for `vinte_uno.server` module."""
+import asyncio
+import random
+
+from vinte_uno import server, vinte_uno
+
+
+async def stand_on_seventeen(gambler: vinte_uno.Gambler, dealer: vinte_uno.Dealer) -> bool:
+    """Bot that stays from 17 points.
+
+    :param gambler: Gambler deciding
+    :type gambler: vinte_uno.Gambler
+    :param dealer: Dealer of the table
+    :type dealer: vinte_uno.Dealer
+    :return: If the gambler stays
+    :rtype: bool
+    """
+    await asyncio.sleep(0)
+    return gambler.hand >= 17
+
+
+async def never_decides(gambler: vinte_uno.Gambler, dealer: vinte_uno.Dealer) -> bool:
+    """Bot that never answers in time.
+
+    :param gambler: Gambler deciding
+    :type gambler: vinte_uno.Gambler
+    :param dealer: Dealer of the table
+    :type dealer: vinte_uno.Dealer
+    :return: Never returns before being cancelled
+    :rtype: bool
+    """
+    await asyncio.sleep(60)
+    return False
+
+
+def test_turn_stats_should_compute_percentiles() -> None:
+    """Test if turn stats compute latency percentiles.
+    """
+    stats = server.TurnStats()
+    percentile = stats.percentile(99)
+    for latency in range(100):
+        stats.record(latency, 2)
+
+    assert percentile == 0
+    assert stats.turns == 100
+    assert stats.decisions == 200
+    assert stats.percentile(99) == 99
+    assert stats.percentile(50) == 50
+
+
+def test_table_host_should_play_tables_concurrently() -> None:
+    """Test if host plays every round of all tables.
+    """
+    stats = server.TurnStats()
+    tables = [
+        server.AsyncTable(
+            names=['Gambler 1', 'Gambler 2'],
+            decide=stand_on_seventeen,
+            deck=vinte_uno.Shoe(rng=random.Random(table)),
+            stats=stats,
+        )
+        for table in range(10)
+    ]
+
+    results = asyncio.run(server.TableHost(tables).serve(rounds=3))
+
+    assert len(results) == 10
+    assert all(len(rounds) == 3 for rounds in results)
+    assert all(
+        result.dealer_state in {vinte_uno.BUSTED, vinte_uno.STAYED}
+        for rounds in results
+        for result in rounds
+    )
+    assert stats.decisions > 0
+    assert stats.timeouts == 0
+
+
+def test_table_should_stay_slow_gamblers() -> None:
+    """Test if a gambler not deciding in time stays.
+    """
+    table = server.AsyncTable(names=['Gambler 1'], decide=never_decides, timeout=0.001)
+
+    result = asyncio.run(table.play_round())
+
+    assert table.stats.timeouts == 1
+    assert result.gambler_states[0] in {vinte_uno.STAYED, vinte_uno.TWENTY_ONE}
+
+
+def test_table_should_play_many_rounds_with_default_deck() -> None:
+    """Test if the default deck lasts across rounds.
+    """
+    table = server.AsyncTable(names=['Gambler 1', 'Gambler 2'], decide=stand_on_seventeen)
+
+    results = asyncio.run(table.play(100))
+
+    assert len(results) == 100
+    assert isinstance(table.deck, vinte_uno.Shoe)
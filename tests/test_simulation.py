@@ -0,0 +1,60 @@
+"""Tests for `vinte_uno.simulation` module."""
+import random
+
+from vinte_uno import simulation, vinte_uno
+
+
+def test_stacked_deck_should_deal_in_order() -> None:
+    """Test if stacked deck deals cards in the given order.
+    """
+    deck = simulation.stacked_deck([3, 1, 4])
+
+    assert [deck.pick(), deck.pick(), deck.pick()] == [3, 1, 4]
+
+
+def test_play_round_should_settle_round() -> None:
+    """Test if a round is played until the dealer stays.
+    """
+    cards = [
+        vinte_uno.CARD_IDS['10', 'hearts'],
+        vinte_uno.CARD_IDS['ace', 'hearts'],
+        vinte_uno.CARD_IDS['9', 'spades'],
+        vinte_uno.CARD_IDS['Queen', 'hearts'],
+        vinte_uno.CARD_IDS['8', 'spades'],
+        vinte_uno.CARD_IDS['King', 'hearts'],
+        vinte_uno.CARD_IDS['Jack', 'diamonds'],
+        vinte_uno.CARD_IDS['9', 'clubs'],
+    ]
+    gamblers = [
+        vinte_uno.Gambler(name='Gambler 1'),
+        vinte_uno.Gambler(name='Gambler 2'),
+        vinte_uno.Gambler(name='Gambler 3'),
+    ]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=simulation.stacked_deck(cards))
+
+    result = simulation.play_round(dealer)
+
+    assert result.dealer_state == vinte_uno.STAYED
+    assert result.dealer_hand == 19
+    assert result.gambler_states == (vinte_uno.STAYED, vinte_uno.TWENTY_ONE, vinte_uno.STAYED)
+    assert result.gambler_hands == (18, 21, 19)
+    assert result.credits == (1, 3, 1)
+
+
+def test_step_tables_should_match_play_round() -> None:
+    """Test if stepping tables together plays the same rounds as play_round.
+    """
+    def table(seed: int) -> vinte_uno.Dealer:
+        gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+        return vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Deck(rng=random.Random(seed)))
+
+    tables = [table(seed) for seed in range(20)]
+    ticks = []
+    while not ticks or ticks[-1].stepped:
+        ticks.append(simulation.step_tables(tables))
+
+    assert sum(tick.finished for tick in ticks) == len(tables)
+    assert ticks[0].stepped == len(tables)
+    for seed, dealer in enumerate(tables):
+        expected = simulation.play_round(table(seed))
+        assert simulation.round_result(dealer, dealer.gamblers) == expected
@@ -0,0 +1,96 @@
+"""Tests for `vinte_uno.snapshot` module."""
+import pickle
+import random
+
+import pytest
+
+from vinte_uno import simulation, snapshot, vinte_uno
+
+
+def new_table(deck: vinte_uno.Deck) -> vinte_uno.Dealer:
+    """Builds a table with three gamblers.
+
+    :param deck: Deck of the table
+    :type deck: vinte_uno.Deck
+    :return: Dealer of the table
+    :rtype: vinte_uno.Dealer
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    return vinte_uno.Dealer(gamblers=gamblers, deck=deck)
+
+
+@pytest.mark.parametrize('deck', [
+    vinte_uno.Deck(rng=random.Random(21)),
+    vinte_uno.Shoe(decks=2, penetration=0.5, rng=random.Random(21)),
+    vinte_uno.Deck(rng=random.Random(21), exhaustion=vinte_uno.RESHUFFLE_DISCARDS),
+    vinte_uno.Shoe(decks=2, rng=random.Random(21), exhaustion=vinte_uno.RESERVE),
+])
+def test_snapshot_should_restore_table(deck: vinte_uno.Deck) -> None:
+    """Test if a restored table plays on as the original one.
+
+    :param deck: Deck of the table
+    :type deck: vinte_uno.Deck
+    """
+    dealer = new_table(deck)
+    dealer.turn()
+    dealer.turn()
+    dealer.gamblers[0].stay()
+
+    frozen = snapshot.TableSnapshot.freeze(dealer)
+    restored = frozen.restore()
+
+    assert snapshot.TableSnapshot.freeze(restored) == frozen
+    assert type(restored.deck) is type(deck)
+    assert [gambler.hand for gambler in restored.gamblers] == [
+        gambler.hand for gambler in dealer.gamblers
+    ]
+    assert simulation.play_round(restored) == simulation.play_round(dealer)
+
+
+def test_snapshot_should_be_compact() -> None:
+    """Test if a snapshot is smaller than a pickled dealer.
+    """
+    dealer = new_table(vinte_uno.Deck(rng=random.Random(21)))
+    dealer.turn()
+
+    frozen = snapshot.TableSnapshot.freeze(dealer)
+
+    assert frozen.nbytes < 128
+    assert not hasattr(frozen, '__dict__')
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert len(pickle.dumps(frozen)) < len(pickle.dumps(dealer))
+
+
+@pytest.mark.parametrize('exhaustion', [vinte_uno.RESHUFFLE_DISCARDS, vinte_uno.RESERVE])
+def test_snapshot_should_restore_exhaustion(exhaustion: str) -> None:
+    """Test if the exhaustion policy and its cards are restored.
+
+    :param exhaustion: Exhaustion policy of the deck
+    :type exhaustion: str
+    """
+    dealer = new_table(vinte_uno.Deck(rng=random.Random(21), exhaustion=exhaustion))
+    dealer.turn()
+    dealer.turn()
+
+    deck = snapshot.TableSnapshot.freeze(dealer).restore().deck
+
+    assert deck.exhaustion == exhaustion
+    assert deck.dealt == dealer.deck.dealt
+    assert deck.reserve == dealer.deck.reserve
+    assert deck.unshuffled == dealer.deck.unshuffled
+
+
+def test_snapshot_should_reset_given_tracker() -> None:
+    """Test if a tracker given on restore follows the restored deck.
+    """
+    shoe = vinte_uno.Shoe(decks=2, rng=random.Random(21), tracker=vinte_uno.CountTracker())
+    dealer = new_table(shoe)
+    dealer.turn()
+    dealer.turn()
+    tracker = vinte_uno.CountTracker()
+
+    restored = snapshot.TableSnapshot.freeze(dealer).restore(tracker=tracker)
+
+    assert restored.deck.tracker is tracker
+    assert tracker.composition() == shoe.tracker.composition()
+    assert tracker.remaining == len(shoe.cards)
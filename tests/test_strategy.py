@@ -0,0 +1,110 @@
+"""Tests for `vinte_uno.strategy` module."""
+import os
+import random
+from array import array
+from pathlib import Path
+
+import pytest
+
+from vinte_uno import simulation, strategy, vinte_uno
+
+
+@pytest.fixture(scope='module')
+def table() -> array:
+    """Builds the table of default rules once.
+
+    :return: Expected values
+    :rtype: array
+    """
+    return strategy.build()
+
+
+def test_values_should_follow_basic_strategy() -> None:
+    """Test if stand and hit values rank decisions sensibly on even money.
+    """
+    rules = strategy.Rules(loss=1.0)
+    table = strategy.build(rules)
+    service = strategy.Strategy(table, rules)
+
+    stand, hit = service.values(20, False, 10)
+    assert stand > hit
+    stand, hit = service.values(8, False, 6)
+    assert hit > stand
+    stand, hit = service.values(16, False, 10)
+    assert hit > stand
+    stand, hit = service.values(13, False, 6)
+    assert stand > hit
+    assert len(table) == strategy.TABLE_SIZE
+
+
+def test_load_should_cache_table_on_disk(tmp_path: Path, table: array) -> None:
+    """Test if a loaded table is written once and read back.
+    """
+    path = strategy.cache_path(strategy.Rules(), str(tmp_path))
+
+    built = strategy.Strategy.load(directory=str(tmp_path))
+    assert os.path.getsize(path) == strategy.TABLE_SIZE * table.itemsize
+    loaded = strategy.Strategy.load(directory=str(tmp_path))
+
+    assert built.table == loaded.table == table
+    assert os.listdir(str(tmp_path)) == [os.path.basename(path)]
+
+
+@pytest.mark.parametrize('size', [8, 3])
+def test_load_should_rebuild_invalid_cache(tmp_path: Path, table: array, size: int) -> None:
+    """Test if a truncated cache file is rebuilt and written back.
+
+    :param size: Size of the truncated file
+    :type size: int
+    """
+    path = Path(strategy.cache_path(strategy.Rules(), str(tmp_path)))
+    path.write_bytes(b'\0' * size)
+
+    assert strategy.Strategy.load(directory=str(tmp_path)).table == table
+    assert path.stat().st_size == strategy.TABLE_SIZE * table.itemsize
+
+
+def test_load_should_keep_table_in_memory_on_unwritable_cache(
+    tmp_path: Path,
+    table: array,
+) -> None:
+    """Test if a table is still served when its cache cannot be written.
+    """
+    blocker = tmp_path / 'file'
+    blocker.write_bytes(b'')
+
+    assert strategy.Strategy.load(directory=str(blocker / 'cache')).table == table
+    assert os.listdir(str(tmp_path)) == ['file']
+
+
+def test_rules_should_default_to_table_payouts() -> None:
+    """Test if default rules settle as default payouts.
+    """
+    assert strategy.Rules() == strategy.Rules.from_payouts(vinte_uno.Payouts())
+
+
+def test_rules_should_follow_payouts() -> None:
+    """Test if rules built from payouts value ties as pushes.
+    """
+    payouts = vinte_uno.Payouts(win=1.5, push=0.5, loss=1.0)
+    rules = strategy.Rules.from_payouts(payouts, decks=2)
+
+    pushing = strategy.Strategy(strategy.build(rules), rules)
+    losing = strategy.Strategy(strategy.build(rules._replace(push=0.0)), rules)
+
+    assert rules == strategy.Rules(decks=2, win=1.5, loss=1.0, push=0.5)
+    assert pushing.values(18, False, 10)[0] > losing.values(18, False, 10)[0]
+    assert pushing.values(4, False, 10)[0] == losing.values(4, False, 10)[0]
+
+
+def test_should_stay_should_be_a_round_policy(table: array) -> None:
+    """Test if a strategy plays rounds through play_round.
+    """
+    service = strategy.Strategy(table)
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Deck(rng=random.Random(7)))
+
+    result = simulation.play_round(dealer, policy=service.should_stay)
+
+    assert result.dealer_state in simulation.FINAL_DEALER_STATES
+    assert vinte_uno.GAMING not in result.gambler_states
@@ -1,10 +1,15 @@
 """Tests for `vinte_uno` package."""
-from typing import Dict, List
+import random
+import subprocess  # noqa: S404
+import sys
+from array import array
+from typing import Dict, List, Tuple
 
 import pytest
 import pytest_mock
 
-from vinte_uno import vinte_uno
+import vinte_uno as package
+from vinte_uno import cards, vinte_uno
 
 
 @pytest.fixture(name='fixture_deck')
@@ -71,14 +76,30 @@ def test_deck_should_arranged_properly(fixture_deck: Dict[str, int]) -> None:
     """
     deck1 = vinte_uno.Deck()
 
-    result1 = tuple(deck1.cards)[0]
+    result1 = vinte_uno.CARDS[deck1.cards[0]]
 
-    assert isinstance(deck1.cards, list)
+    assert isinstance(deck1.cards, array)
     assert isinstance(result1.image, str)
     assert len(result1.image) > 1
     assert len(deck1.cards) == fixture_deck.get('length')
 
 
+def test_cards_should_be_interned() -> None:
+    """Test if every card is interned once and referenced by its id.
+    """
+    deck1 = vinte_uno.Deck()
+    deck2 = vinte_uno.Deck()
+
+    assert len(vinte_uno.CARDS) == 52
+    assert all(
+        card is vinte_uno.CARDS[card_id]
+        for card_id, card in enumerate(vinte_uno.Cards().generate())
+    )
+    assert sorted(deck1.cards) == sorted(deck2.cards) == list(range(52))
+    assert vinte_uno.CARDS[vinte_uno.CARD_IDS['ace', 'spades']].weight == 1
+    assert vinte_uno.CARD_WEIGHTS[vinte_uno.CARD_IDS['King', 'hearts']] == 10
+
+
 def test_deck_card_should_picked(fixture_deck: Dict[str, int]) -> None:
     """Test if deck card should be picked.
 
@@ -90,18 +111,207 @@ def test_deck_card_should_picked(fixture_deck: Dict[str, int]) -> None:
     result1 = deck1.pick()
 
     assert len(deck1.cards) == (fixture_deck.get('length') - 1)
-    assert isinstance(result1, vinte_uno.Card)
+    assert vinte_uno.CARDS[result1] in set(vinte_uno.Cards().generate())
 
 
 def test_deck_pick_should_raises_value_error() -> None:
     """Test if deck raises ValueError when try to pick a card.
     """
     deck1 = vinte_uno.Deck()
-    deck1.cards = []
+    deck1.cards = array('B')
     with pytest.raises(ValueError, match="Doesn't have enough cards!"):
         deck1.pick()
 
 
+def test_deck_should_draw_reproducibly_with_seeded_rng() -> None:
+    """Test if decks sharing a seed draw the same cards.
+    """
+    deck1 = vinte_uno.Deck(rng=random.Random(21))
+    deck2 = vinte_uno.Deck(rng=random.Random(21))
+    top = deck1.cards[-1]
+
+    result1 = [deck1.pick() for _ in range(len(deck1.cards))]
+    result2 = [deck2.pick() for _ in range(len(deck2.cards))]
+
+    assert result1[0] == top
+    assert result1 == result2
+    assert len(set(result1)) == 52
+    assert not deck1.cards
+
+
+def test_shoe_should_hold_many_decks() -> None:
+    """Test if shoe holds the cards of all its decks.
+    """
+    shoe = vinte_uno.Shoe(decks=6, penetration=0.75, rng=random.Random(21))
+
+    assert len(shoe.cards) == 312
+    assert shoe.cut_card == 78
+    assert len(set(shoe.cards)) == 52
+    assert not shoe.cut_card_out
+
+
+@pytest.mark.parametrize(('decks', 'penetration'), [
+    (0, 0.75),
+    (6, 0),
+    (6, 1.5),
+])
+def test_shoe_should_raises_value_error(decks: int, penetration: float) -> None:
+    """Test if shoe raises ValueError with invalid settings.
+
+    :param decks: Number of decks in the shoe
+    :type decks: int
+    :param penetration: Fraction of the shoe dealt before the cut card
+    :type penetration: float
+    """
+    with pytest.raises(ValueError, match='must'):
+        vinte_uno.Shoe(decks=decks, penetration=penetration)
+
+
+def test_shoe_should_reshuffle_after_cut_card() -> None:
+    """Test if shoe reshuffles in place once the cut card came out.
+    """
+    shoe = vinte_uno.Shoe(decks=2, penetration=0.5, rng=random.Random(21))
+    cards = shoe.cards
+    shoe.start_round()
+    while not shoe.cut_card_out:
+        shoe.pick()
+
+    remaining = len(shoe.cards)
+    shoe.pick()
+    shoe.start_round()
+
+    assert remaining == 52
+    assert shoe.cards is cards
+    assert len(shoe.cards) == 104
+
+
+def test_count_tracker_should_follow_shoe() -> None:
+    """Test if tracked counts match the cards left across reshuffles.
+    """
+    tracker = cards.CountTracker()
+    shoe = vinte_uno.Shoe(decks=2, penetration=0.5, rng=random.Random(21), tracker=tracker)
+    drawn = [shoe.pick() for _ in range(60)]
+
+    weights = [vinte_uno.CARD_WEIGHTS[card_id] for card_id in shoe.cards]
+    assert tracker.composition() == tuple(weights.count(weight) for weight in range(1, 11))
+    assert tracker.remaining == len(shoe.cards) == 44
+    assert tracker.running_count == sum(cards.HI_LO_TAGS[card_id] for card_id in drawn)
+    assert tracker.true_count == pytest.approx(tracker.running_count / (44 / 52))
+    assert tracker.ten_probability == pytest.approx(weights.count(10) / 44)
+
+    shoe.start_round()
+
+    assert tracker.composition() == (8,) * 9 + (32,)
+    assert (tracker.remaining, tracker.running_count) == (104, 0)
+
+
+def test_deck_should_reshuffle_discards() -> None:
+    """Test if an exhausted deck refills with discards, cards in play left out.
+    """
+    tracker = cards.CountTracker()
+    deck = vinte_uno.Deck(
+        rng=random.Random(21), tracker=tracker, exhaustion=vinte_uno.RESHUFFLE_DISCARDS,
+    )
+    discarded = [deck.pick() for _ in range(47)]
+    deck.start_round()
+    in_play = [deck.pick() for _ in range(5)]
+
+    deck.pick()
+
+    assert sorted([*deck.cards, *deck.dealt[5:]]) == sorted(discarded)
+    assert not set(deck.cards) & set(in_play)
+    assert tracker.remaining == len(deck.cards) == 46
+    deck.start_round()
+    deck.cards = array('B')
+    deck.dealt.extend(deck.composition)
+    with pytest.raises(ValueError, match="Doesn't have enough cards!"):
+        deck.pick()
+
+
+def test_deck_should_refill_from_reserve() -> None:
+    """Test if an exhausted deck refills from its reserve, shuffled by picks.
+    """
+    deck = vinte_uno.Deck(rng=random.Random(21), exhaustion=vinte_uno.RESERVE)
+    result1 = [deck.pick() for _ in range(52)]
+
+    assert deck.unshuffled == 0
+    result2 = [deck.pick() for _ in range(52)]
+
+    assert sorted(result2) == list(range(52))
+    assert result2 != result1
+    assert deck.unshuffled == 0
+    with pytest.raises(ValueError, match='Unknown exhaustion policy'):
+        vinte_uno.Deck(exhaustion='NEVER')
+
+
+def test_dealer_should_fail_fast_before_dealing() -> None:
+    """Test if a turn the deck cannot complete fails before dealing a card.
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    deck = vinte_uno.Deck(rng=random.Random(21))
+    deck.cards = deck.cards[:3]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=deck)
+
+    with pytest.raises(ValueError, match="Doesn't have enough cards!"):
+        dealer.turn()
+    assert len(deck.cards) == 3
+    assert not any(gambler.cards for gambler in gamblers)
+
+
+def test_dealer_should_keep_shoe_across_rounds() -> None:
+    """Test if a shoe lives across rounds of many dealers.
+    """
+    shoe = vinte_uno.Shoe(decks=1, penetration=1, rng=random.Random(21))
+    gambler1 = vinte_uno.Gambler(name='Gambler')
+    dealer1 = vinte_uno.Dealer(gamblers=[gambler1], deck=shoe)
+    dealer1.turn()
+    dealer2 = vinte_uno.Dealer(gamblers=[vinte_uno.Gambler(name='Gambler')], deck=shoe)
+
+    assert dealer2.deck is shoe
+    assert len(shoe.cards) == 50
+    assert len(gambler1.cards) == 1
+
+
+def test_dealer_reset_should_reuse_table() -> None:
+    """Test if a reset table is back to its initial state, objects kept.
+    """
+    deck = vinte_uno.Deck(rng=random.Random(21))
+    gambler = vinte_uno.Gambler(name='Gambler', credit=3)
+    dealer = vinte_uno.Dealer(gamblers=[gambler], deck=deck)
+    dealer.turn()
+    dealer.turn()
+    hand = gambler.cards
+    cards = deck.cards
+
+    dealer.reset(gambler_credit=2, reshuffle=True)
+
+    assert (dealer.state, gambler.state) == (vinte_uno.DEAL_PENDING, vinte_uno.READY_TO_GAME)
+    assert (len(dealer.cards), dealer.hand, dealer.credit) == (0, 0, 1)
+    assert (len(gambler.cards), gambler.hand, gambler.credit) == (0, 0, 2)
+    assert gambler.cards is hand
+    assert deck.cards is cards
+    assert sorted(deck.cards) == list(range(52))
+
+
+def test_hand_value_should_be_looked_up_by_key() -> None:
+    """Test if hand keys follow cards and look their evaluation up.
+    """
+    hand = cards.Hand()
+    for rank in ('ace', '9', 'ace', '10', 'King', 'Queen', 'Jack', '10', '10', '10', '10', '10'):
+        hand.add_card(vinte_uno.CARD_IDS[rank, 'spades'])
+        expected = cards.hand_value(hand.hard_total * 2 + (hand.aces > 0))
+        assert hand.key == hand.hard_total * 2 + 1
+        assert hand.value == expected
+        assert (hand.hand, hand.soft) == (expected.total, expected.soft)
+
+    assert hand.key >= cards.HAND_KEYS
+    assert hand.value == (101, False, True, False)
+    assert cards.HAND_VALUES[21 * 2] == (21, False, False, True)
+    assert cards.HAND_VALUES[11 * 2 + 1] == (21, True, False, True)
+    hand.clear()
+    assert (hand.key, hand.value) == (0, (0, False, False, False))
+
+
 def test_player_should_not_hit() -> None:
     """Test if player should not hit.
     """
@@ -118,6 +328,40 @@ def test_player_should_not_hit() -> None:
     assert dealer.hand == 0
 
 
+@pytest.mark.parametrize(('ranks', 'expected', 'soft'), [
+    ((), 0, False),
+    (('ace',), 11, True),
+    (('ace', '5'), 16, True),
+    (('ace', '6', '10'), 17, False),
+    (('ace', 'ace', '9'), 21, True),
+    (('ace', 'King'), 21, True),
+    (('Queen', '9', '5'), 24, False),
+])
+def test_player_hand_should_count_aces(
+    ranks: Tuple[str, ...],
+    expected: int,
+    soft: bool,
+) -> None:
+    """Test if player hand counts an ace as eleven whenever it does not bust.
+
+    :param ranks: Ranks of cards on hand
+    :type ranks: Tuple[str, ...]
+    :param expected: Expected hand total
+    :type expected: int
+    :param soft: If the hand is expected to be soft
+    :type soft: bool
+    """
+    gambler = vinte_uno.Gambler(name='Gambler')
+    for rank in ranks:
+        gambler.add_card(vinte_uno.CARD_IDS[rank, 'hearts'])
+    dealer = vinte_uno.Dealer(gamblers=[gambler])
+    dealer.cards = gambler.cards
+
+    assert gambler.hand == dealer.hand == expected
+    assert gambler.soft is dealer.soft is soft
+    assert gambler.aces == ranks.count('ace')
+
+
 def test_gambler_should_play_game() -> None:
     """Test if gambler should change from ready to game to gaming state.
     """
@@ -217,14 +461,14 @@ def test_dealer_turn_should_stay_by_points(
     """
     dealer = vinte_uno.Dealer(gamblers=fixture_gamblers)
     fixture_deck_pick.side_effect = [
-        vinte_uno.Card(rank='10', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='ace', weight=1, suit='hearts', image=''),
-        vinte_uno.Card(rank='9', weight=9, suit='nine', image=''),
-        vinte_uno.Card(rank='queen', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='10', weight=10, suit='spades', image=''),
-        vinte_uno.Card(rank='king', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='jack', weight=10, suit='diamonds', image=''),
-        vinte_uno.Card(rank='9', weight=9, suit='clubs', image=''),
+        vinte_uno.CARD_IDS['10', 'hearts'],
+        vinte_uno.CARD_IDS['ace', 'hearts'],
+        vinte_uno.CARD_IDS['9', 'spades'],
+        vinte_uno.CARD_IDS['Queen', 'hearts'],
+        vinte_uno.CARD_IDS['10', 'spades'],
+        vinte_uno.CARD_IDS['King', 'hearts'],
+        vinte_uno.CARD_IDS['Jack', 'diamonds'],
+        vinte_uno.CARD_IDS['9', 'clubs'],
     ]
     dealer.turn()
     dealer.turn()
@@ -250,16 +494,16 @@ def test_dealer_turn_should_stay_by_gamblers(
     """
     dealer = vinte_uno.Dealer(gamblers=fixture_gamblers)
     fixture_deck_pick.side_effect = [
-        vinte_uno.Card(rank='10', weight=10, suit='diamonds', image=''),
-        vinte_uno.Card(rank='ace', weight=1, suit='diamonds', image=''),
-        vinte_uno.Card(rank='jack', weight=10, suit='diamonds', image=''),
-        vinte_uno.Card(rank='queen', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='10', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='king', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='10', weight=10, suit='clubs', image=''),
-        vinte_uno.Card(rank='6', weight=6, suit='clubs', image=''),
-        vinte_uno.Card(rank='2', weight=2, suit='clubs', image=''),
-        vinte_uno.Card(rank='2', weight=2, suit='spades', image=''),
+        vinte_uno.CARD_IDS['10', 'diamonds'],
+        vinte_uno.CARD_IDS['ace', 'diamonds'],
+        vinte_uno.CARD_IDS['Jack', 'diamonds'],
+        vinte_uno.CARD_IDS['Queen', 'hearts'],
+        vinte_uno.CARD_IDS['10', 'hearts'],
+        vinte_uno.CARD_IDS['King', 'hearts'],
+        vinte_uno.CARD_IDS['10', 'clubs'],
+        vinte_uno.CARD_IDS['6', 'clubs'],
+        vinte_uno.CARD_IDS['2', 'clubs'],
+        vinte_uno.CARD_IDS['2', 'spades'],
     ]
     dealer.turn()
     dealer.turn()
@@ -284,16 +528,16 @@ def test_dealer_turn_should_bust(  # noqa:WPS218
     """
     dealer = vinte_uno.Dealer(gamblers=fixture_gamblers)
     fixture_deck_pick.side_effect = [
-        vinte_uno.Card(rank='10', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='ace', weight=1, suit='hearts', image=''),
-        vinte_uno.Card(rank='jack', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='queen', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='5', weight=5, suit='hearts', image=''),
-        vinte_uno.Card(rank='king', weight=10, suit='hearts', image=''),
-        vinte_uno.Card(rank='10', weight=10, suit='diamonds', image=''),
-        vinte_uno.Card(rank='6', weight=6, suit='diamonds', image=''),
-        vinte_uno.Card(rank='2', weight=2, suit='diamonds', image=''),
-        vinte_uno.Card(rank='8', weight=8, suit='diamonds', image=''),
+        vinte_uno.CARD_IDS['10', 'hearts'],
+        vinte_uno.CARD_IDS['ace', 'hearts'],
+        vinte_uno.CARD_IDS['Jack', 'hearts'],
+        vinte_uno.CARD_IDS['Queen', 'hearts'],
+        vinte_uno.CARD_IDS['5', 'hearts'],
+        vinte_uno.CARD_IDS['King', 'hearts'],
+        vinte_uno.CARD_IDS['10', 'diamonds'],
+        vinte_uno.CARD_IDS['6', 'diamonds'],
+        vinte_uno.CARD_IDS['2', 'diamonds'],
+        vinte_uno.CARD_IDS['8', 'diamonds'],
     ]
     dealer.turn()
     dealer.turn()
@@ -309,6 +553,44 @@ def test_dealer_turn_should_bust(  # noqa:WPS218
     assert fixture_gamblers[2].credit == 0
 
 
+def test_dealer_settle_should_resolve_every_gambler() -> None:
+    """Test if every stayed gambler is resolved against the dealer, seats kept.
+    """
+    payouts = vinte_uno.Payouts(win=1, push=0, loss=0.5)
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat), credit=4) for seat in range(12)]
+    dealer = vinte_uno.Dealer(gamblers=list(gamblers), payouts=payouts)
+    dealer.cards = [vinte_uno.CARD_IDS['10', 'spades'], vinte_uno.CARD_IDS['8', 'spades']]
+    dealer.state = vinte_uno.STAYED
+    for seat, gambler in enumerate(gamblers):
+        gambler.state = vinte_uno.STAYED
+        rank = str(7 + seat % 4)
+        gambler.cards = [vinte_uno.CARD_IDS['10', 'hearts'], vinte_uno.CARD_IDS[rank, 'hearts']]
+    gamblers[11].state = vinte_uno.BUSTED
+
+    dealer.settle()
+
+    assert dealer.gamblers == gamblers
+    assert [gambler.credit for gambler in gamblers] == [2, 4, 8, 8] * 2 + [2, 4, 8, 4]
+
+
+def test_payouts_should_pay_twenty_one_and_bust() -> None:
+    """Test if twenty one and bust follow the payout ratios of the table.
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler 1', credit=2), vinte_uno.Gambler(name='Gambler 2')]
+    vinte_uno.Dealer(gamblers=gamblers, payouts=vinte_uno.Payouts(twenty_one=1.5, bust=0.5))
+    for gambler in gamblers:
+        gambler.state = vinte_uno.GAMING
+    gamblers[0].cards = [vinte_uno.CARD_IDS['ace', 'hearts'], vinte_uno.CARD_IDS['King', 'hearts']]
+    gamblers[1].credit = 4
+    gamblers[1].cards = [vinte_uno.CARD_IDS['King', 'spades']] * 3
+
+    gamblers[0].win()
+    gamblers[1].bust()
+
+    assert [gamblers[0].credit, gamblers[1].credit] == [5, 2]
+    assert vinte_uno.Gambler(name='Gambler 3').payouts == vinte_uno.Payouts()
+
+
 def test_dealer_show_cards_correctly(
     fixture_gamblers: List[vinte_uno.Gambler],
 ) -> None:
@@ -318,14 +600,111 @@ def test_dealer_show_cards_correctly(
     :type fixture_gamblers: List[vinte_uno.Gambler]
     """
     dealer = vinte_uno.Dealer(gamblers=fixture_gamblers)
-    dealer.cards = [
-        vinte_uno.Card(rank='8', weight=8, suit='diamonds', image=''),
-        vinte_uno.Card(rank='10', weight=10, suit='spades', image=''),
-    ]
+    dealer.cards = array('B', [
+        vinte_uno.CARD_IDS['8', 'diamonds'],
+        vinte_uno.CARD_IDS['10', 'spades'],
+    ])
     dealer.state = vinte_uno.HIDING
     assert dealer.show() == [{
         'suit': 'diamonds',
         'rank': '8',
         'weight': 8,
-        'image': '',
+        'image': '8-diamonds.png',
     }]
+
+
+def test_players_should_share_class_state_machine(
+    fixture_gamblers: List[vinte_uno.Gambler],
+) -> None:
+    """Test if players share a single state machine per class.
+
+    :param fixture_gamblers: A tuple with gambler objects in initial state
+    :type fixture_gamblers: List[vinte_uno.Gambler]
+    """
+    dealer = vinte_uno.Dealer(gamblers=fixture_gamblers)
+
+    assert fixture_gamblers[0].machine is fixture_gamblers[1].machine
+    assert fixture_gamblers[0].machine is not dealer.machine
+    assert 'stay' not in vars(fixture_gamblers[0])
+    assert vinte_uno.Gambler.machine.models == []
+    assert dealer.state == vinte_uno.DEAL_PENDING
+    assert fixture_gamblers[0].state == vinte_uno.READY_TO_GAME
+
+
+def test_cards_should_not_import_state_machine() -> None:
+    """Test if hands are evaluated without importing transitions.
+    """
+    statement = '; '.join((
+        'import sys',
+        'import vinte_uno',
+        'assert vinte_uno.Hand([0, 12]).hand == 21',
+        "assert 'transitions' not in sys.modules",
+        'from vinte_uno import vinte_uno',
+        "assert 'transitions' not in sys.modules",
+        'vinte_uno.Gambler.machine',
+        "assert 'transitions' in sys.modules",
+    ))
+
+    subprocess.run([sys.executable, '-c', statement], check=True)  # noqa: S603
+
+
+def test_package_should_export_lazily() -> None:
+    """Test if the package exports cards and players.
+    """
+    assert package.Hand is cards.Hand
+    assert package.Dealer is vinte_uno.Dealer
+    assert vinte_uno.Deck is cards.Deck
+    assert 'Gambler' in dir(package)
+    with pytest.raises(AttributeError):
+        package.Machine  # noqa: B018, WPS428
+
+
+def test_players_should_keep_model_api(
+    fixture_gamblers: List[vinte_uno.Gambler],
+) -> None:
+    """Test if players still answer state checks and named triggers.
+
+    :param fixture_gamblers: A tuple with gambler objects in initial state
+    :type fixture_gamblers: List[vinte_uno.Gambler]
+    """
+    gambler = fixture_gamblers[0]
+    gambler.hit(deck=vinte_uno.Deck())
+
+    assert gambler.is_READY_TO_GAME()
+    assert not gambler.is_GAMING()
+    assert gambler.trigger('play')
+    assert gambler.is_GAMING()
+    with pytest.raises(AttributeError):
+        gambler.trigger('deal')
+
+
+def test_listeners_should_forward_every_event(
+    fixture_gamblers: List[vinte_uno.Gambler],
+) -> None:
+    """Test if a fan-out listener notifies each of its listeners.
+
+    :param fixture_gamblers: A tuple with gambler objects in initial state
+    :type fixture_gamblers: List[vinte_uno.Gambler]
+    """
+    class Counter(vinte_uno.Listener):  # noqa: WPS431
+        def __init__(self) -> None:
+            self.events: List[str] = []
+
+        def on_pick(self, player: vinte_uno.Player, card_id: int) -> None:
+            self.events.append('pick')
+
+        def on_trigger(self, player: vinte_uno.Player, trigger: str, succeeded: bool) -> None:
+            self.events.append(trigger)
+
+        def on_reset(self, player: vinte_uno.Player) -> None:
+            self.events.append('reset')
+
+    first, second = Counter(), Counter()
+    gambler = fixture_gamblers[0]
+    gambler.listener = vinte_uno.Listeners(first, None, second)
+    gambler.hit(deck=vinte_uno.Deck())
+    gambler.play()
+    gambler.reset()
+
+    assert first.events == second.events == ['pick', 'play', 'reset']
+    assert package.Listeners is vinte_uno.Listeners
@@ -0,0 +1,180 @@
+"""Tests for `vinte_uno.wire` module."""
+import random
+
+import pytest
+
+from vinte_uno import simulation, snapshot, vinte_uno, wire
+
+
+@pytest.fixture(name='fixture_dealer')
+def dealer() -> vinte_uno.Dealer:
+    """Dealer of a table in the middle of a round.
+
+    :return: A dealer with three gamblers
+    :rtype: vinte_uno.Dealer
+    """
+    gamblers = [vinte_uno.Gambler(name='Gambler {0}'.format(seat)) for seat in range(3)]
+    dealer = vinte_uno.Dealer(
+        gamblers=gamblers,
+        deck=vinte_uno.Shoe(decks=2, rng=random.Random(21)),
+    )
+    dealer.turn()
+    dealer.turn()
+    return dealer
+
+
+def test_hand_should_round_trip(fixture_dealer: vinte_uno.Dealer) -> None:
+    """Test if hands are decoded as views on the message.
+
+    :param fixture_dealer: A dealer in the middle of a round
+    :type fixture_dealer: vinte_uno.Dealer
+    """
+    message = wire.encode_hand(fixture_dealer)
+
+    result = wire.decode_hand(message)
+
+    assert isinstance(result, memoryview)
+    assert result.obj is message
+    assert list(result) == list(fixture_dealer.cards)
+    assert len(message) == 5 + len(fixture_dealer.cards)
+
+
+def test_table_should_round_trip(fixture_dealer: vinte_uno.Dealer) -> None:
+    """Test if table snapshots are decoded back.
+
+    :param fixture_dealer: A dealer in the middle of a round
+    :type fixture_dealer: vinte_uno.Dealer
+    """
+    frozen = snapshot.TableSnapshot.freeze(fixture_dealer)
+
+    result = wire.decode_table(wire.encode_table(frozen))
+
+    assert result == frozen
+    assert isinstance(result.deck, memoryview)
+    assert simulation.play_round(result.restore()) == simulation.play_round(fixture_dealer)
+
+
+def test_table_should_keep_exhaustion() -> None:
+    """Test if the exhaustion policy and reserve of a deck are encoded.
+    """
+    deck = vinte_uno.Shoe(decks=2, rng=random.Random(21), exhaustion=vinte_uno.RESERVE)
+    dealer = vinte_uno.Dealer(gamblers=[vinte_uno.Gambler(name='Gambler')], deck=deck)
+    dealer.turn()
+    frozen = snapshot.TableSnapshot.freeze(dealer)
+
+    result = wire.decode_table(wire.encode_table(frozen))
+
+    assert result == frozen
+    assert result.restore().deck.exhaustion == vinte_uno.RESERVE
+    message = bytearray(wire.encode_table(frozen))
+    message[wire.HEADER.size + wire.TABLE_FIXED.size + wire.PAYOUTS.size] = 3
+    with pytest.raises(ValueError, match='Unknown exhaustion policy 3'):
+        wire.decode_table(bytes(message))
+
+
+def test_table_should_keep_payouts() -> None:
+    """Test if table payouts are encoded and restored.
+    """
+    payouts = vinte_uno.Payouts(win=1.5, push=0.5, loss=1.0)
+    dealer = vinte_uno.Dealer(gamblers=[vinte_uno.Gambler(name='Gambler')], payouts=payouts)
+
+    restored = wire.decode_table(wire.encode_table(snapshot.TableSnapshot.freeze(dealer))).restore()
+
+    assert restored.payouts == payouts
+    assert restored.gamblers[0].payouts == payouts
+
+
+def test_round_should_round_trip(fixture_dealer: vinte_uno.Dealer) -> None:
+    """Test if round results are decoded back.
+
+    :param fixture_dealer: A dealer in the middle of a round
+    :type fixture_dealer: vinte_uno.Dealer
+    """
+    result = simulation.play_round(fixture_dealer)
+
+    assert wire.decode_round(wire.encode_round(result)) == result
+
+
+@pytest.mark.parametrize(('message', 'error'), [
+    (b'', 'Truncated'),
+    (b'XX' + bytes([wire.VERSION]) + b'\x01\x00', 'Not a vinte_uno'),
+    (b'VU\xff\x01\x00', 'Unsupported wire version 255'),
+    (b'VU' + bytes([wire.VERSION]) + b'\x02\x00', 'Unexpected message kind 2'),
+    (b'VU' + bytes([wire.VERSION]) + b'\x01\x05\x01', 'Truncated'),
+])
+def test_decode_should_raises_value_error(message: bytes, error: str) -> None:
+    """Test if decoding raises ValueError on invalid messages.
+
+    :param message: An invalid hand message
+    :type message: bytes
+    :param error: Expected error message
+    :type error: str
+    """
+    with pytest.raises(ValueError, match=error):
+        wire.decode_hand(message)
+
+
+def test_table_should_round_trip_many_seats() -> None:
+    """Test if tables of more than 255 gamblers are encoded.
+    """
+    gamblers = [vinte_uno.Gambler(name=str(seat)) for seat in range(300)]
+    dealer = vinte_uno.Dealer(gamblers=gamblers, deck=vinte_uno.Shoe(decks=8))
+    dealer.turn()
+    frozen = snapshot.TableSnapshot.freeze(dealer)
+
+    result = wire.decode_table(wire.encode_table(frozen))
+
+    assert result == frozen
+    assert len(result.names) == 300
+
+
+def test_decode_should_raises_value_error_on_unknown_state(
+    fixture_dealer: vinte_uno.Dealer,
+) -> None:
+    """Test if decoding raises ValueError on out of range states.
+
+    :param fixture_dealer: A dealer in the middle of a round
+    :type fixture_dealer: vinte_uno.Dealer
+    """
+    table = bytearray(wire.encode_table(snapshot.TableSnapshot.freeze(fixture_dealer)))
+    table[wire.HEADER.size] = len(vinte_uno.DEALER_STATES)
+    message = bytearray(wire.encode_round(simulation.play_round(fixture_dealer)))
+    message[wire.HEADER.size + wire.ROUND_FIXED.size] = len(vinte_uno.GAMBLER_STATES)
+
+    with pytest.raises(ValueError, match='Unknown state'):
+        wire.decode_table(bytes(table))
+    with pytest.raises(ValueError, match='Unknown state'):
+        wire.decode_round(bytes(message))
+
+
+def test_decode_should_raises_value_error_on_unknown_card(
+    fixture_dealer: vinte_uno.Dealer,
+) -> None:
+    """Test if decoding raises ValueError on out of range card ids.
+
+    :param fixture_dealer: A dealer in the middle of a round
+    :type fixture_dealer: vinte_uno.Dealer
+    """
+    hand = bytearray(wire.encode_hand(fixture_dealer))
+    hand[-1] = len(vinte_uno.CARDS)
+    table = bytearray(wire.encode_table(snapshot.TableSnapshot.freeze(fixture_dealer)))
+    table[-1] = len(vinte_uno.CARDS)
+
+    with pytest.raises(ValueError, match='Unknown card id'):
+        wire.decode_hand(bytes(hand))
+    with pytest.raises(ValueError, match='Unknown card id'):
+        wire.decode_table(bytes(table))
+
+
+def test_encode_should_raises_value_error_on_long_name(
+    fixture_dealer: vinte_uno.Dealer,
+) -> None:
+    """Test if encoding raises ValueError on names not fitting their size field.
+
+    :param fixture_dealer: A dealer in the middle of a round
+    :type fixture_dealer: vinte_uno.Dealer
+    """
+    fixture_dealer.name = 'é' * 128
+
+    with pytest.raises(ValueError, match='Names hold up to 255 bytes'):
+        wire.encode_table(snapshot.TableSnapshot.freeze(fixture_dealer))
@@ -1,5 +1,52 @@
-"""Top-level package for Vinte Uno."""
+"""Top-level package for Vinte Uno.
+
+Cards, decks and players are exported here and imported on first access,
+so importing the package does not load the player state machines.
+"""
+import importlib
 
 __author__ = 'Fred Campos'
 __email__ = 'fred.tecnologia@gmail.com'
 __version__ = '0.1.0'
+
+_EXPORTS = {
+    'CARDS': 'vinte_uno.cards',
+    'CARD_IDS': 'vinte_uno.cards',
+    'CARD_WEIGHTS': 'vinte_uno.cards',
+    'Card': 'vinte_uno.cards',
+    'Cards': 'vinte_uno.cards',
+    'CountTracker': 'vinte_uno.cards',
+    'Deck': 'vinte_uno.cards',
+    'Hand': 'vinte_uno.cards',
+    'Shoe': 'vinte_uno.cards',
+    'Dealer': 'vinte_uno.vinte_uno',
+    'Gambler': 'vinte_uno.vinte_uno',
+    'Listener': 'vinte_uno.vinte_uno',
+    'Listeners': 'vinte_uno.vinte_uno',
+    'Player': 'vinte_uno.vinte_uno',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Imports an exported name on first access.
+
+    :param name: Attribute name
+    :type name: str
+    :raises AttributeError: When the name is not exported
+    :return: The exported object
+    :rtype: object
+    """
+    if name not in _EXPORTS:
+        raise AttributeError("module 'vinte_uno' has no attribute '{0}'".format(name))
+    exported = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = exported
+    return exported
+
+
+def __dir__() -> list:
+    """Lists attributes of the package, exported names included.
+
+    :return: Attribute names
+    :rtype: list
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
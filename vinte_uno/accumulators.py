@@ -0,0 +1,333 @@
+"""
+This module summarizes round outcomes in constant memory.
+
+``Moments`` keeps the mean and variance of a series with Welford updates,
+``QuantileSketch`` estimates its quantiles within a relative error from
+logarithmic buckets, as DDSketch does, and ``RoundStatistics`` combines
+both for gambler credit deltas with counters of final states. All of them
+merge, so workers summarize their own tables and a parent merges them.
+
+Statistics are fed with ``runner.RoundRecord`` from a streamed table, or
+live by a ``StatisticsListener`` when a dealer busts or stays.
+"""
+import itertools
+import math
+from typing import Dict, Iterable, Optional, Sequence
+
+from vinte_uno.runner import RoundRecord
+from vinte_uno.vinte_uno import DEALER_STATES, GAMBLER_STATES, Dealer, Listener, Player
+
+RELATIVE_ACCURACY = 0.01
+MAX_BUCKETS = 2048
+
+
+class Moments:
+    """Count, mean and variance of a series, updated a value at a time."""
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self) -> None:
+        """Instantiates this class."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        """Adds a value to the series.
+
+        :param value: A value
+        :type value: float
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: 'Moments') -> None:
+        """Adds the values of another series, in place.
+
+        :param other: Moments of another series
+        :type other: Moments
+        """
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """A property that contains the sample variance of the series.
+
+        :return: Variance, zero under two values
+        :rtype: float
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """A property that contains the sample standard deviation of the series.
+
+        :return: Standard deviation
+        :rtype: float
+        """
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """Mergeable sketch of a series answering quantiles.
+
+    Values are counted in buckets growing geometrically, so an estimated
+    quantile is within ``relative_accuracy`` of a value of the series.
+    Positive and negative values have their own buckets, zeros a counter.
+    Past ``max_buckets`` on a side, the smallest buckets are collapsed.
+    """
+
+    __slots__ = ('relative_accuracy', 'max_buckets', 'log_gamma', 'positive', 'negative', 'zeros')
+
+    def __init__(
+        self,
+        relative_accuracy: float = RELATIVE_ACCURACY,
+        max_buckets: int = MAX_BUCKETS,
+    ) -> None:
+        """Instantiates this class.
+
+        :param relative_accuracy: Relative error of estimated quantiles
+        :type relative_accuracy: float
+        :param max_buckets: Number of buckets kept on each side of zero
+        :type max_buckets: int
+        :raises ValueError: When the relative accuracy is out of bounds
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('Relative accuracy must be greater than 0 and lower than 1!')
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zeros = 0
+
+    @property
+    def count(self) -> int:
+        """A property that contains the number of values added.
+
+        :return: Number of values
+        :rtype: int
+        """
+        return self.zeros + sum(self.positive.values()) + sum(self.negative.values())
+
+    def add(self, value: float) -> None:
+        """Adds a value to the sketch.
+
+        :param value: A value
+        :type value: float
+        """
+        if value > 0:
+            buckets = self.positive
+        elif value < 0:
+            buckets = self.negative
+            value = -value
+        else:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Adds the values of another sketch, in place.
+
+        :param other: A sketch with the same relative accuracy
+        :type other: QuantileSketch
+        :raises ValueError: When relative accuracies differ
+        """
+        if other.log_gamma != self.log_gamma:
+            raise ValueError('Sketches must have the same relative accuracy!')
+        self.zeros += other.zeros
+        for buckets, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for index, count in theirs.items():
+                buckets[index] = buckets.get(index, 0) + count
+            while len(buckets) > self.max_buckets:
+                self._collapse(buckets)
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Estimates a quantile of the series.
+
+        :param quantile: Quantile, from 0 to 1
+        :type quantile: float
+        :raises ValueError: When the quantile is out of bounds
+        :return: Estimated value, None for an empty sketch
+        :rtype: Optional[float]
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError('Quantile must be between 0 and 1!')
+        count = self.count
+        if not count:
+            return None
+        rank = quantile * (count - 1)
+        buckets = itertools.chain(
+            ((-self._value(index), self.negative[index]) for index in sorted(self.negative)[::-1]),
+            ((0.0, self.zeros),),
+            ((self._value(index), self.positive[index]) for index in sorted(self.positive)),
+        )
+        seen = 0
+        for value, bucket_count in buckets:
+            seen += bucket_count
+            if seen > rank:
+                return value
+        return None
+
+    def _value(self, index: int) -> float:
+        """Value representing a bucket, within the relative accuracy.
+
+        :param index: Bucket index
+        :return: Bucket value
+        """
+        return 2 * math.exp(index * self.log_gamma) / (1 + math.exp(self.log_gamma))
+
+    def _collapse(self, buckets: Dict[int, int]) -> None:
+        """Merges the two smallest buckets of a side.
+
+        :param buckets: Buckets of a side
+        """
+        smallest, second = sorted(buckets)[:2]
+        buckets[second] += buckets.pop(smallest)
+
+
+class RoundStatistics:
+    """Summary of gambler credit deltas and final states over rounds.
+
+    States are counted in the order of ``GAMBLER_STATES`` and
+    ``DEALER_STATES``.
+    """
+
+    __slots__ = ('rounds', 'credits', 'quantiles', 'gambler_states', 'dealer_states')
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY) -> None:
+        """Instantiates this class.
+
+        :param relative_accuracy: Relative error of estimated quantiles
+        :type relative_accuracy: float
+        """
+        self.rounds = 0
+        self.credits = Moments()
+        self.quantiles = QuantileSketch(relative_accuracy)
+        self.gambler_states = [0] * len(GAMBLER_STATES)
+        self.dealer_states = [0] * len(DEALER_STATES)
+
+    def add(self, dealer_state: str, gambler_states: Sequence[str], deltas: Sequence[int]) -> None:
+        """Adds the outcome of a round.
+
+        :param dealer_state: Final dealer state
+        :type dealer_state: str
+        :param gambler_states: Final gambler states in seat order
+        :type gambler_states: Sequence[str]
+        :param deltas: Credits won by each gambler, negative when lost
+        :type deltas: Sequence[int]
+        """
+        self.rounds += 1
+        self.dealer_states[DEALER_STATES.index(dealer_state)] += 1
+        for state, delta in zip(gambler_states, deltas):
+            self.gambler_states[GAMBLER_STATES.index(state)] += 1
+            self.credits.add(delta)
+            self.quantiles.add(delta)
+
+    def observe(self, record: RoundRecord) -> None:
+        """Adds a streamed round.
+
+        :param record: Record of a round
+        :type record: RoundRecord
+        """
+        self.add(record.dealer_state, record.gambler_states, record.deltas)
+
+    def merge(self, other: 'RoundStatistics') -> None:
+        """Adds the rounds of other statistics, in place.
+
+        :param other: Statistics of other rounds
+        :type other: RoundStatistics
+        """
+        self.rounds += other.rounds
+        self.credits.merge(other.credits)
+        self.quantiles.merge(other.quantiles)
+        for index, count in enumerate(other.gambler_states):
+            self.gambler_states[index] += count
+        for index, count in enumerate(other.dealer_states):
+            self.dealer_states[index] += count
+
+    def frequencies(self) -> Dict[str, float]:
+        """Frequency of each final gambler state.
+
+        :return: Share of gamblers ending in each state, by state
+        :rtype: Dict[str, float]
+        """
+        total = sum(self.gambler_states)
+        return {
+            state: count / total if total else 0.0
+            for state, count in zip(GAMBLER_STATES, self.gambler_states)
+        }
+
+
+class StatisticsListener(Listener):
+    """Listener adding a round to statistics once its dealer busts or stays.
+
+    Set it as the ``listener`` of a dealer, credits are final when the
+    dealer trigger returns. A dealer holds a single listener, use
+    ``Listeners`` to notify others too; a ``HistoryRecorder`` attached
+    afterwards keeps it.
+    """
+
+    def __init__(self, statistics: RoundStatistics, bet: int = 1) -> None:
+        """Instantiates this class.
+
+        :param statistics: Statistics fed by this listener
+        :type statistics: RoundStatistics
+        :param bet: Credit gamblers start rounds with
+        :type bet: int
+        """
+        self.statistics: RoundStatistics = statistics
+        self.bet: int = bet
+
+    def on_trigger(self, player: Player, trigger: str, succeeded: bool) -> None:
+        """Adds the round of a dealer that busted or stayed.
+
+        :param player: Player whose trigger was fired
+        :type player: Player
+        :param trigger: Trigger name
+        :type trigger: str
+        :param succeeded: If the transition happened
+        :type succeeded: bool
+        """
+        if succeeded and trigger in {'bust', 'stay'} and isinstance(player, Dealer):
+            self.statistics.add(
+                player.state,
+                [gambler.state for gambler in player.gamblers],
+                [gambler.credit - self.bet for gambler in player.gamblers],
+            )
+
+
+def collect(
+    records: Iterable[RoundRecord],
+    relative_accuracy: float = RELATIVE_ACCURACY,
+) -> RoundStatistics:
+    """Summarizes streamed rounds.
+
+    :param records: Records of any number of rounds
+    :type records: Iterable[RoundRecord]
+    :param relative_accuracy: Relative error of estimated quantiles
+    :type relative_accuracy: float
+    :return: Statistics of the rounds
+    :rtype: RoundStatistics
+    """
+    statistics = RoundStatistics(relative_accuracy)
+    for record in records:
+        statistics.observe(record)
+    return statistics
@@ -0,0 +1,494 @@
+"""
+This module contains cards, decks and hand evaluation.
+
+It does not depend on the state machine of the players, so hands can be
+evaluated without importing ``vinte_uno.vinte_uno``.
+"""
+import random
+from array import array
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+TWENTY_ONE_RANK_POINTS = 21
+ACE_RANK_POINTS = 11
+DEALER_RANK_POINTS_LIMIT = 17
+
+
+class Card(NamedTuple):  # noqa: H601
+    """Object that contains cards properties."""
+
+    rank: str
+    suit: str
+    weight: int
+    image: str
+
+
+SUITS: Tuple[str, ...] = ('spades', 'clubs', 'diamonds', 'hearts')
+RANKS: Tuple[Tuple[str, int], ...] = (
+    ('ace', 1),
+    ('2', 2),
+    ('3', 3),
+    ('4', 4),
+    ('5', 5),
+    ('6', 6),
+    ('7', 7),
+    ('8', 8),
+    ('9', 9),
+    ('10', 10),
+    ('Jack', 10),
+    ('Queen', 10),
+    ('King', 10),
+)
+CARDS: Tuple[Card, ...] = tuple(
+    Card(rank=rank, suit=suit, weight=weight, image='{0}-{1}.png'.format(rank, suit))
+    for suit in SUITS
+    for rank, weight in RANKS
+)
+CARD_WEIGHTS: bytes = bytes(card.weight for card in CARDS)
+CARD_IDS: Dict[Tuple[str, str], int] = {
+    (card.rank, card.suit): card_id for card_id, card in enumerate(CARDS)
+}
+ACE_WEIGHT = 1
+TEN_WEIGHT = 10
+DECK_SIZE = len(CARDS)
+HI_LO_TAGS: Tuple[int, ...] = tuple(
+    1 if 2 <= weight <= 6 else -1 if weight in {ACE_WEIGHT, TEN_WEIGHT} else 0
+    for weight in CARD_WEIGHTS
+)
+HAND_KEYS = 128
+FAIL_FAST = 'FAIL_FAST'
+RESHUFFLE_DISCARDS = 'RESHUFFLE_DISCARDS'
+RESERVE = 'RESERVE'
+EXHAUSTION_POLICIES = (
+    FAIL_FAST,
+    RESHUFFLE_DISCARDS,
+    RESERVE,
+)
+
+
+class HandValue(NamedTuple):  # noqa: H601
+    """Evaluation of a hand."""
+
+    total: int
+    soft: bool
+    bust: bool
+    twenty_one: bool
+
+
+def hand_value(key: int) -> HandValue:
+    """Evaluates a hand from its key.
+
+    A hand value only depends on its hard total and on holding an ace, so
+    hands are keyed by the hard total shifted left of an ace flag.
+
+    :param key: Hand key, see ``Hand.key``
+    :type key: int
+    :return: Evaluation of the hand
+    :rtype: HandValue
+    """
+    hard = key >> 1
+    soft = bool(key & 1) and hard + ACE_RANK_POINTS - ACE_WEIGHT <= TWENTY_ONE_RANK_POINTS
+    total = hard + ACE_RANK_POINTS - ACE_WEIGHT if soft else hard
+    return HandValue(
+        total=total,
+        soft=soft,
+        bust=total > TWENTY_ONE_RANK_POINTS,
+        twenty_one=total == TWENTY_ONE_RANK_POINTS,
+    )
+
+
+HAND_VALUES: Tuple[HandValue, ...] = tuple(hand_value(key) for key in range(HAND_KEYS))
+HAND_TOTALS: Tuple[int, ...] = tuple(value.total for value in HAND_VALUES)
+
+
+class Cards:
+    """Object that generates set of cards.
+
+    Cards are interned on the ``CARDS`` table and referenced elsewhere by
+    their integer ids, the index of each card in that table.
+    """
+
+    def __init__(self) -> None:
+        """Initializes Cards class.
+        """
+        self.suits: Tuple[str, ...] = SUITS
+        self.ranks: Tuple[Tuple[str, int], ...] = RANKS
+
+    def generate(self) -> Iterator[Card]:
+        """Generates deck cards.
+
+        :yield: A generator with Card objects
+        :rtype: Iterator[Card]
+        """
+        yield from CARDS
+
+    def ids(self) -> array:
+        """Returns the ids of deck cards.
+
+        :return: A compact buffer with card ids
+        :rtype: array
+        """
+        return array('B', range(len(CARDS)))
+
+
+class CountTracker:
+    """Class that tracks the composition of the cards left on a deck.
+
+    Counts are kept per weight, aces first, and updated as cards are drawn,
+    along with the Hi-Lo running count of drawn cards.
+    """
+
+    __slots__ = ('counts', 'remaining', 'running_count')
+
+    def __init__(self, cards: Iterable[int] = ()) -> None:
+        """Instantiates this class.
+
+        :param cards: Card ids left on the deck
+        :type cards: Iterable[int]
+        """
+        self.counts = array('L', bytes(TEN_WEIGHT * array('L').itemsize))
+        self.remaining = 0
+        self.running_count = 0
+        self.reset(cards)
+
+    def reset(self, cards: Iterable[int]) -> None:
+        """Starts tracking a refilled deck, the running count back to zero.
+
+        :param cards: Card ids left on the deck
+        :type cards: Iterable[int]
+        """
+        counts = [0] * TEN_WEIGHT
+        for card_id in cards:
+            counts[CARD_WEIGHTS[card_id] - ACE_WEIGHT] += 1
+        self.counts[:] = array('L', counts)
+        self.remaining = sum(counts)
+        self.running_count = 0
+
+    def remove(self, card_id: int) -> None:
+        """Counts a card drawn from the deck.
+
+        :param card_id: Card id, see ``CARDS``
+        :type card_id: int
+        """
+        self.counts[CARD_WEIGHTS[card_id] - ACE_WEIGHT] -= 1
+        self.remaining -= 1
+        self.running_count += HI_LO_TAGS[card_id]
+
+    def composition(self) -> Tuple[int, ...]:
+        """Number of cards of each weight left, aces first.
+
+        :return: Composition, as ``vinte_uno.probability`` takes it
+        :rtype: Tuple[int, ...]
+        """
+        return tuple(self.counts)
+
+    @property
+    def true_count(self) -> float:
+        """A property that contains the running count per deck left.
+
+        :return: True count, zero on an empty deck
+        :rtype: float
+        """
+        if not self.remaining:
+            return 0.0
+        return self.running_count * DECK_SIZE / self.remaining
+
+    @property
+    def ten_probability(self) -> float:
+        """A property that contains the odds of the next card being ten-valued.
+
+        :return: Probability, zero on an empty deck
+        :rtype: float
+        """
+        if not self.remaining:
+            return 0.0
+        return self.counts[TEN_WEIGHT - ACE_WEIGHT] / self.remaining
+
+
+class Deck:
+    """Class that represents deck aggregating cards.
+
+    Cards are shuffled once, when the deck is built, and drawn from its top.
+    The deck holds card ids only, see ``CARDS``, ``composition`` keeping
+    every card it was built with. A ``tracker`` follows the cards drawn
+    with ``pick`` and restored with ``reshuffle``; cards assigned directly
+    call for ``tracker.reset``.
+
+    The ``exhaustion`` policy tells what ``pick`` does once the cards are
+    gone: ``FAIL_FAST`` raises, ``RESHUFFLE_DISCARDS`` shuffles back the
+    cards dealt before the current round, the ones still in play being
+    left out, and ``RESERVE`` refills from a reserve holding every card,
+    shuffled a step per pick so refilling never stalls a turn.
+    """
+
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        tracker: Optional[CountTracker] = None,
+        exhaustion: str = FAIL_FAST,
+    ) -> None:
+        """Instantiates this class.
+
+        :param rng: Random generator used to shuffle cards, a seedable
+            ``random.Random`` fits simulations, defaults to ``random.SystemRandom``
+        :type rng: Optional[random.Random]
+        :param tracker: Tracker of the cards left, none by default
+        :type tracker: Optional[CountTracker]
+        :param exhaustion: Exhaustion policy, see ``EXHAUSTION_POLICIES``
+        :type exhaustion: str
+        :raises ValueError: When the exhaustion policy is unknown
+        """
+        if exhaustion not in EXHAUSTION_POLICIES:
+            raise ValueError('Unknown exhaustion policy {0}!'.format(exhaustion))
+        self.rng: random.Random = rng if rng is not None else random.SystemRandom()
+        self.composition: array = Cards().ids()
+        self.cards: array = array('B', self.composition)
+        self.tracker: Optional[CountTracker] = tracker
+        self.exhaustion: str = exhaustion
+        self.refills: bool = exhaustion != FAIL_FAST
+        self.dealt: Optional[array] = array('B') if exhaustion == RESHUFFLE_DISCARDS else None
+        self.reserve: Optional[array] = array('B') if exhaustion == RESERVE else None
+        self.unshuffled: int = 0
+        self.shuffle()
+        if tracker is not None:
+            tracker.reset(self.cards)
+        self._fill_reserve()
+
+    def shuffle(self) -> None:
+        """Shuffles remaining cards in place."""
+        self.rng.shuffle(self.cards)
+
+    def reshuffle(self) -> None:
+        """Puts every card back on the deck and shuffles it in place."""
+        self.cards[:] = self.composition
+        self.shuffle()
+        if self.tracker is not None:
+            self.tracker.reset(self.composition)
+
+    def pick(self) -> int:
+        """Returns a card randomly and pick from deck.
+
+        :raises ValueError: When not have cards on deck and cannot refill it
+        :return: A random card id
+        :rtype: int
+        """
+        if not self.cards:
+            self.refill()
+        card_id: int = self.cards.pop()
+        if self.refills:
+            if self.dealt is not None:
+                self.dealt.append(card_id)
+            elif self.unshuffled:
+                self._shuffle_reserve(1)
+        if self.tracker is not None:
+            self.tracker.remove(card_id)
+        return card_id
+
+    def refill(self) -> None:
+        """Refills an empty deck following its exhaustion policy.
+
+        :raises ValueError: When failing fast or when every card is in play
+        """
+        if self.reserve is not None:
+            self._shuffle_reserve(self.unshuffled)
+            self.cards[:] = self.reserve
+            self._fill_reserve()
+        elif self.dealt is not None:
+            composition = self.composition.tobytes()
+            held = self.dealt.tobytes() + self.cards.tobytes()
+            for card_id in range(DECK_SIZE):
+                card = bytes((card_id,))
+                self.cards.frombytes(card * (composition.count(card) - held.count(card)))
+            self.shuffle()
+        if not self.cards:
+            raise ValueError("Doesn't have enough cards!")
+        if self.tracker is not None:
+            self.tracker.reset(self.cards)
+
+    def ensure(self, count: int) -> None:
+        """Fails before a deal that a deck failing fast cannot complete.
+
+        Decks with another policy refill when they run out.
+
+        :param count: Number of cards about to be picked
+        :type count: int
+        :raises ValueError: When failing fast with fewer cards left
+        """
+        if not self.refills and len(self.cards) < count:
+            raise ValueError("Doesn't have enough cards!")
+
+    def start_round(self) -> None:
+        """Hook called by the dealer before dealing a round.
+
+        Cards dealt so far are discarded, the ones of the new round being
+        the only cards in play.
+        """
+        if self.dealt is not None:
+            del self.dealt[:]  # noqa: WPS420
+
+    def _fill_reserve(self) -> None:
+        """Puts every card on the reserve, its shuffle left to picks."""
+        if self.reserve is not None:
+            self.reserve[:] = self.composition
+            self.unshuffled = len(self.reserve) - 1
+
+    def _shuffle_reserve(self, steps: int) -> None:
+        """Runs Fisher-Yates steps on the reserve, from its last card down.
+
+        :param steps: Number of cards to put in place
+        """
+        reserve = self.reserve
+        index = self.unshuffled
+        stop = max(index - steps, 0)
+        randrange = self.rng.randrange
+        while index > stop:
+            other = randrange(index + 1)
+            reserve[index], reserve[other] = reserve[other], reserve[index]  # type: ignore
+            index -= 1
+        self.unshuffled = index
+
+
+class Shoe(Deck):
+    """Class that represents a dealing shoe holding several decks.
+
+    Cards are drawn until the cut card comes out, the shoe is then refilled
+    and reshuffled in place before the next round is dealt.
+    """
+
+    def __init__(
+        self,
+        decks: int = 6,
+        penetration: float = 0.75,
+        rng: Optional[random.Random] = None,
+        tracker: Optional[CountTracker] = None,
+        exhaustion: str = FAIL_FAST,
+    ) -> None:
+        """Instantiates this class.
+
+        :param decks: Number of decks in the shoe
+        :param penetration: Fraction of the shoe dealt before the cut card
+        :param rng: Random generator used to shuffle cards
+        :param tracker: Tracker of the cards left, none by default
+        :param exhaustion: Exhaustion policy, see ``EXHAUSTION_POLICIES``
+        :type decks: int
+        :type penetration: float
+        :type rng: Optional[random.Random]
+        :type tracker: Optional[CountTracker]
+        :type exhaustion: str
+        :raises ValueError: When decks or penetration are out of bounds
+        """
+        if decks < 1:
+            raise ValueError('A shoe must have at least one deck!')
+        if not 0 < penetration <= 1:
+            raise ValueError('Penetration must be greater than 0 and up to 1!')
+        super().__init__(rng=rng, tracker=tracker, exhaustion=exhaustion)
+        self.composition = self.cards * decks
+        self.cut_card: int = len(self.composition) - int(len(self.composition) * penetration)
+        self.reshuffle()
+        self._fill_reserve()
+
+    @property
+    def cut_card_out(self) -> bool:
+        """A property that tells if the cut card has been reached.
+
+        :return: If the shoe should be reshuffled
+        :rtype: bool
+        """
+        return len(self.cards) <= self.cut_card
+
+    def start_round(self) -> None:
+        """Reshuffles the shoe when the cut card came out on last round."""
+        if self.cut_card_out:
+            self.reshuffle()
+        super().start_round()
+
+
+class Hand:
+    """Class that evaluates the cards on a hand.
+
+    Hand totals and the hand ``key`` are kept up to date as cards are added,
+    evaluating a hand being a lookup of its key on ``HAND_VALUES``, keys
+    beyond the table being evaluated by ``hand_value``.
+    """
+
+    def __init__(self, cards: Iterable[int] = ()) -> None:
+        """Instantiates this class.
+
+        :param cards: Card ids on hand, see ``CARDS``
+        :type cards: Iterable[int]
+        """
+        self.cards = cards
+
+    @property
+    def cards(self) -> array:
+        """A property that contains card ids on Player hand.
+
+        Cards must be added through ``hit`` or ``add_card`` to keep hand
+        totals up to date, assigning a new hand recomputes them.
+
+        :return: card ids
+        :rtype: array
+        """
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: Iterable[int]) -> None:
+        self._cards: array = array('B')
+        self.hard_total: int = 0
+        self.aces: int = 0
+        self.key: int = 0
+        for card_id in cards:
+            self.add_card(card_id)
+
+    @property
+    def soft(self) -> bool:
+        """A property that tells if an ace counts as eleven on Player hand.
+
+        :return: If the hand is soft
+        :rtype: bool
+        """
+        return self.value.soft
+
+    @property
+    def hand(self) -> int:
+        """A property that contains total rank points on Player hand.
+
+        :return: total rank points
+        :rtype: int
+        """
+        key = self.key
+        if key < HAND_KEYS:
+            return HAND_TOTALS[key]
+        return hand_value(key).total
+
+    @property
+    def value(self) -> HandValue:
+        """A property that contains the evaluation of Player hand.
+
+        :return: Hand total, softness, bust and twenty one flags
+        :rtype: HandValue
+        """
+        key = self.key
+        if key < HAND_KEYS:
+            return HAND_VALUES[key]
+        return hand_value(key)
+
+    def add_card(self, card_id: int) -> None:
+        """Adds a card to Player hand, updating hand totals.
+
+        :param card_id: Card id, see ``CARDS``
+        :type card_id: int
+        """
+        weight = CARD_WEIGHTS[card_id]
+        self._cards.append(card_id)
+        self.hard_total += weight
+        self.key += weight << 1
+        if weight == ACE_WEIGHT:
+            self.aces += 1
+            self.key |= 1
+
+    def clear(self) -> None:
+        """Removes every card from the hand, in place."""
+        del self._cards[:]  # noqa: WPS420
+        self.hard_total = 0
+        self.aces = 0
+        self.key = 0
@@ -0,0 +1,153 @@
+"""
+This module advances tables on gambler actions instead of dealer turns.
+
+An ``EventTable`` deals the opening cards once, then applies the actions
+pushed on its queue, a hit or a stay of a seat, one at a time. It counts
+the gamblers still gaming, and the dealer exposes and plays its hand as
+soon as that counter reaches zero. Work follows the actions taken, not
+the seats of the table times the number of turns.
+
+Cards are dealt in the order ``Dealer.turn`` deals them when gamblers act
+in seat order, so a round played with ``play`` ends as ``play_round``
+ends it, given the same deck and policy.
+"""
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from vinte_uno.simulation import STAND_ON, Policy, RoundResult, round_result
+from vinte_uno.vinte_uno import BUSTED, EXPOSED, GAMING, STAYED, Dealer, Gambler
+
+HIT = 'hit'
+STAY = 'stay'
+ACTIONS = (HIT, STAY)
+
+
+class EventTable:
+    """Class that plays a round of a dealer from queued gambler actions."""
+
+    def __init__(self, dealer: Dealer) -> None:
+        """Instantiates this class.
+
+        :param dealer: A dealer with its gamblers, before dealing
+        :type dealer: Dealer
+        """
+        self.dealer: Dealer = dealer
+        self.queue: Deque[Tuple[int, str]] = deque()
+        self.gaming: int = 0
+
+    @property
+    def finished(self) -> bool:
+        """A property that tells if the dealer busted or stayed.
+
+        :return: If the round is over
+        :rtype: bool
+        """
+        return self.dealer.state in {BUSTED, STAYED}
+
+    def start(self) -> None:
+        """Deals two cards to every gambler and to the dealer, one hidden.
+
+        Gamblers reaching twenty one or busting on their second card are
+        resolved right away, as ``Dealer.turn`` does.
+        """
+        dealer = self.dealer
+        deck = dealer.deck
+        deck.ensure(len(dealer.gamblers) + 1)
+        for gambler in dealer.gamblers:
+            gambler.hit(deck=deck)
+        dealer.hit(deck=deck)
+        dealer.deal()
+        deck.ensure(len(dealer.gamblers) + 1)
+        self.gaming = 0
+        for gambler in dealer.gamblers:
+            gambler.hit(deck=deck)
+            if gambler.state == GAMING:
+                dealer.resolve(gambler)
+            self.gaming += gambler.state == GAMING
+        dealer.hit(deck=deck)
+        dealer.hide()
+        if not self.gaming:
+            self._finish()
+
+    def push(self, seat: int, action: str) -> None:
+        """Queues an action of a gambler.
+
+        :param seat: Seat of the gambler on the dealer gamblers
+        :type seat: int
+        :param action: ``HIT`` or ``STAY``
+        :type action: str
+        :raises ValueError: When the action is unknown
+        """
+        if action not in ACTIONS:
+            raise ValueError('Unknown action {0}!'.format(action))
+        self.queue.append((seat, action))
+
+    def process(self) -> int:
+        """Applies queued actions in the order they were pushed.
+
+        Actions of gamblers no longer gaming are dropped.
+
+        :return: Number of actions applied
+        :rtype: int
+        """
+        applied = 0
+        dealer = self.dealer
+        gamblers = dealer.gamblers
+        while self.queue:
+            seat, action = self.queue.popleft()
+            gambler = gamblers[seat]
+            if gambler.state != GAMING:
+                continue
+            if action == HIT:
+                gambler.hit(deck=dealer.deck)
+                dealer.resolve(gambler)
+            else:
+                gambler.stay()
+            applied += 1
+            if gambler.state != GAMING:
+                self.gaming -= 1
+                if not self.gaming:
+                    self._finish()
+        return applied
+
+    def _finish(self) -> None:
+        """Exposes the dealer hand, the dealer hitting until it busts or stays."""
+        dealer = self.dealer
+        dealer.expose()
+        while dealer.state == EXPOSED:
+            dealer.hit(deck=dealer.deck)
+            getattr(dealer, 'bust' if dealer.value.bust else 'stay')()
+
+
+def play(
+    dealer: Dealer,
+    stand_on: int = STAND_ON,
+    policy: Optional[Policy] = None,
+) -> RoundResult:
+    """Plays a round on an event table, as ``simulation.play_round`` does.
+
+    Gaming gamblers act in seat order, staying as soon as their hand
+    reaches ``stand_on`` points or when the given policy tells so, hitting
+    otherwise. Only gamblers still gaming are asked.
+
+    :param dealer: A dealer with its gamblers, before dealing
+    :type dealer: Dealer
+    :param stand_on: Points from which gamblers stay
+    :type stand_on: int
+    :param policy: Function telling if a gaming gambler stays
+    :type policy: Optional[Policy]
+    :return: Outcome of the round, gamblers in seat order
+    :rtype: RoundResult
+    """
+    gamblers: List[Gambler] = list(dealer.gamblers)
+    table = EventTable(dealer)
+    table.start()
+    seats = [seat for seat, gambler in enumerate(gamblers) if gambler.state == GAMING]
+    while seats:
+        for seat in seats:
+            gambler = gamblers[seat]
+            stays = policy(gambler, dealer) if policy is not None else gambler.hand >= stand_on
+            table.push(seat, STAY if stays else HIT)
+        table.process()
+        seats = [seat for seat in seats if gamblers[seat].state == GAMING]
+    return round_result(dealer, gamblers)
@@ -0,0 +1,343 @@
+"""
+This module keeps an append-only history of played hands.
+
+A ``HistoryRecorder`` listens to the players of a table and appends one
+fixed-size binary record per event to a ``HistoryLog``: cards picked,
+triggers fired, credit changes, turns and resets. Gamblers are recorded on
+their seat index and the dealer on ``DEALER_SEAT``, past the last gambler
+seat a record holds. The log is split in segment files
+of a fixed number of records. A ``HistoryReplay`` maps those segments in
+memory and rebuilds tables from their records.
+"""
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from vinte_uno.vinte_uno import (
+    DEALER_STATES,
+    GAMBLER_STATES,
+    Dealer,
+    Listener,
+    Listeners,
+    Player,
+)
+
+RECORD = struct.Struct('<IIBHBBq')
+SEGMENT_RECORDS = 1 << 20
+SEGMENT_NAME = 'history-{0:06d}.seg'
+SEAT = 0
+PICK = 1
+TRIGGER = 2
+CREDIT = 3
+TURN = 4
+RESET = 5
+DEALER_SEAT = 0xFFFF
+TRIGGERS: Tuple[str, ...] = ('play', 'win', 'stay', 'bust', 'deal', 'hide', 'expose')
+SETTLE_TRIGGERS = frozenset(('bust', 'stay'))
+
+
+class Record(NamedTuple):  # noqa: H601
+    """A record of the history log.
+
+    ``code`` holds the card id of a pick or the index of a trigger on
+    ``TRIGGERS``, ``state`` the state index of the seat after the event and
+    ``value`` a credit, the bet value of a reset or a turn number.
+    """
+
+    table: int
+    sequence: int
+    kind: int
+    seat: int
+    code: int
+    state: int
+    value: int
+
+
+class SeatState:
+    """State of a seat rebuilt from the history."""
+
+    __slots__ = ('state', 'cards', 'credit')
+
+    def __init__(self, state: str, credit: int) -> None:
+        """Instantiates this class.
+
+        :param state: Player state
+        :param credit: Player bet value
+        """
+        self.state = state
+        self.cards: List[int] = []
+        self.credit = credit
+
+
+class HistoryLog:
+    """Append-only log of records split in segment files."""
+
+    def __init__(self, directory: str, segment_records: int = SEGMENT_RECORDS) -> None:
+        """Opens a log, new records go to a new segment.
+
+        :param directory: Directory of segment files, created when missing
+        :type directory: str
+        :param segment_records: Number of records per segment
+        :type segment_records: int
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.segment_records: int = segment_records
+        self.segment: int = len(segments(directory))
+        self.records: int = 0
+        self._file = open(self._path(), 'ab')  # noqa: WPS515
+
+    def append(self, *fields: int) -> None:
+        """Appends a record, rolling to a new segment when the current is full.
+
+        :param fields: Record fields, see ``Record``
+        :type fields: int
+        """
+        if self.records == self.segment_records:
+            self._file.close()
+            self.segment += 1
+            self.records = 0
+            self._file = open(self._path(), 'ab')  # noqa: WPS515
+        self._file.write(RECORD.pack(*fields))
+        self.records += 1
+
+    def flush(self) -> None:
+        """Flushes buffered records to the current segment."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes the current segment."""
+        self._file.close()
+
+    def __enter__(self) -> 'HistoryLog':
+        """Enters a context closing the log on exit.
+
+        :return: This log
+        :rtype: HistoryLog
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the log.
+
+        :param exc_info: Exception information
+        """
+        self.close()
+
+    def _path(self) -> str:
+        return os.path.join(self.directory, SEGMENT_NAME.format(self.segment))
+
+
+class _TableListener(Listener):
+    """Listener writing events of a table to the log.
+
+    Credits are checked on the player an event touched only. A gambler
+    reaching twenty one takes the dealer bet once its trigger returned, so
+    both credits are checked on the next event, and every gambler is checked
+    when the dealer busts or stays, gamblers being settled then.
+    """
+
+    def __init__(self, log: HistoryLog, table: int, dealer: Dealer) -> None:
+        """Instantiates this class.
+
+        :param log: History log
+        :param table: Table id
+        :param dealer: Dealer of the table
+        :raises ValueError: When the table has more gambler seats than a record holds
+        """
+        if len(dealer.gamblers) > DEALER_SEAT:
+            raise ValueError('Tables hold up to {0} gamblers!'.format(DEALER_SEAT))
+        self.log = log
+        self.table = table
+        self.sequence = 0
+        self.turns = 0
+        self.dealer = dealer
+        self.players: List[Player] = list(dealer.gamblers)
+        self.players.append(dealer)
+        self.seats: Dict[int, int] = {
+            id(gambler): seat for seat, gambler in enumerate(dealer.gamblers)
+        }
+        self.seats[id(dealer)] = DEALER_SEAT
+        self.credits: Dict[int, int] = {id(player): player.credit for player in self.players}
+        self.transfers: List[Player] = []
+        for player in self.players:
+            self._write(SEAT, player, 0, player.credit)
+
+    def on_pick(self, player: Player, card_id: int) -> None:
+        """Records a picked card.
+
+        :param player: Player that hit
+        :param card_id: Card id
+        """
+        self._write(PICK, player, card_id, 0)
+        self._record_credits(player)
+
+    def on_trigger(self, player: Player, trigger: str, succeeded: bool) -> None:
+        """Records a fired trigger.
+
+        :param player: Player whose trigger was fired
+        :param trigger: Trigger name
+        :param succeeded: If the transition happened
+        """
+        if succeeded and trigger in TRIGGERS:
+            self._write(TRIGGER, player, TRIGGERS.index(trigger), 0)
+        if succeeded and player is self.dealer and trigger in SETTLE_TRIGGERS:
+            self._record_credits(*self.players)
+        else:
+            self._record_credits(player)
+        if succeeded and trigger == 'win':
+            self.transfers.extend((player, self.dealer))
+
+    def on_turn(self, dealer: Dealer) -> None:
+        """Records the start of a turn.
+
+        :param dealer: Dealer of the table
+        """
+        self.turns += 1
+        self._write(TURN, dealer, 0, self.turns)
+        self._record_credits(dealer)
+
+    def on_reset(self, player: Player) -> None:
+        """Records a player reset for a new round.
+
+        :param player: Player that was reset
+        """
+        self.credits[id(player)] = player.credit
+        self._record_credits()
+        self._write(RESET, player, 0, player.credit)
+
+    def _record_credits(self, *players: Player) -> None:
+        if self.transfers:
+            players = (*players, *self.transfers)
+            self.transfers = []
+        for player in players:
+            if player.credit != self.credits[id(player)]:
+                self.credits[id(player)] = player.credit
+                self._write(CREDIT, player, 0, player.credit)
+
+    def _write(self, kind: int, player: Player, code: int, value: int) -> None:
+        self.log.append(
+            self.table,
+            self.sequence,
+            kind,
+            self.seats[id(player)],
+            code,
+            player.states.index(player.state),
+            value,
+        )
+        self.sequence += 1
+
+
+class HistoryRecorder:
+    """Class that records the history of the tables attached to it."""
+
+    def __init__(self, log: HistoryLog) -> None:
+        """Instantiates this class.
+
+        :param log: History log
+        :type log: HistoryLog
+        """
+        self.log: HistoryLog = log
+        self.tables: int = 0
+        self.previous: Dict[int, List[Tuple[Player, Optional[Listener]]]] = {}
+
+    def attach(self, dealer: Dealer) -> int:
+        """Starts recording a table, before or during its round.
+
+        Listeners already set on the players keep being notified, first.
+
+        :param dealer: Dealer of the table
+        :type dealer: Dealer
+        :return: Table id of the records
+        :rtype: int
+        """
+        table = self.tables
+        self.tables += 1
+        listener = _TableListener(self.log, table, dealer)
+        previous = [(player, player.listener) for player in listener.players]
+        self.previous[id(dealer)] = previous
+        for player, kept in previous:
+            player.listener = listener if kept is None else Listeners(kept, listener)
+        return table
+
+    def detach(self, dealer: Dealer) -> None:
+        """Stops recording a table, putting back the listeners it had.
+
+        :param dealer: Dealer of the table
+        :type dealer: Dealer
+        """
+        for player, kept in self.previous.pop(id(dealer), ()):
+            player.listener = kept
+
+
+class HistoryReplay:
+    """Class that replays the records of a log from its segments."""
+
+    def __init__(self, directory: str) -> None:
+        """Instantiates this class.
+
+        :param directory: Directory of segment files
+        :type directory: str
+        """
+        self.directory: str = directory
+
+    def records(self, table: Optional[int] = None) -> Iterator[Record]:
+        """Iterates over records in the order they were appended.
+
+        :param table: Only yields records of this table when given
+        :type table: Optional[int]
+        :yield: Records of the log
+        :rtype: Iterator[Record]
+        """
+        for name in segments(self.directory):
+            path = os.path.join(self.directory, name)
+            if not os.path.getsize(path):
+                continue
+            with open(path, 'rb') as segment:
+                with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    for fields in RECORD.iter_unpack(buffer):
+                        if table is None or fields[0] == table:
+                            yield Record(*fields)
+
+    def rebuild(self, table: int, turns: Optional[int] = None) -> Dict[int, SeatState]:
+        """Rebuilds the seats of a table after a number of turns.
+
+        :param table: Table id
+        :type table: int
+        :param turns: Number of turns played, up to the last record by default
+        :type turns: Optional[int]
+        :return: State of each seat, the dealer on ``DEALER_SEAT``
+        :rtype: Dict[int, SeatState]
+        """
+        seats: Dict[int, SeatState] = {}
+        for record in self.records(table):
+            if record.kind == TURN and turns is not None and record.value > turns:
+                break
+            states = DEALER_STATES if record.seat == DEALER_SEAT else GAMBLER_STATES
+            if record.kind == SEAT:
+                seats[record.seat] = SeatState(states[record.state], record.value)
+                continue
+            seat = seats[record.seat]
+            seat.state = states[record.state]
+            if record.kind == PICK:
+                seat.cards.append(record.code)
+            elif record.kind == CREDIT:
+                seat.credit = record.value
+            elif record.kind == RESET:
+                seat.cards.clear()
+                seat.credit = record.value
+        return seats
+
+
+def segments(directory: str) -> List[str]:
+    """Lists segment files of a log directory in append order.
+
+    :param directory: Directory of segment files
+    :type directory: str
+    :return: Segment file names
+    :rtype: List[str]
+    """
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name for name in os.listdir(directory) if name.startswith('history-'))
@@ -0,0 +1,250 @@
+"""
+This module measures where time goes inside the game engine.
+
+A ``Profiler`` wraps hot functions of the engine, triggers and state
+machine callbacks included, with timers feeding one latency histogram per
+function. Wrappers are installed on the classes when the profiler is
+enabled and removed when it is disabled, so a disabled profiler costs
+nothing. Histograms count calls in power of two buckets of nanoseconds.
+"""
+import os
+import tempfile
+import time
+from array import array
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, cast
+
+from vinte_uno.cards import Deck, Hand
+from vinte_uno.vinte_uno import Dealer, Gambler
+
+BUCKETS = 32
+METRIC = 'vinte_uno_call_seconds'
+HOT_FUNCTIONS: Tuple[Tuple[type, str], ...] = (
+    (Dealer, 'turn'),
+    (Dealer, '_hit'),
+    (Deck, 'pick'),
+    (Hand, 'hand'),
+    (Hand, 'value'),
+)
+
+
+class Timing(NamedTuple):  # noqa: H601
+    """Calls of an instrumented function.
+
+    ``buckets[index]`` counts calls lasting less than ``2 ** index``
+    nanoseconds and at least half of it, the last bucket every longer call.
+    """
+
+    calls: int
+    seconds: float
+    buckets: Tuple[int, ...]
+
+
+class Histogram:
+    """Latency histogram of an instrumented function."""
+
+    __slots__ = ('calls', 'nanoseconds', 'buckets')
+
+    def __init__(self) -> None:
+        """Instantiates this class."""
+        self.calls = 0
+        self.nanoseconds = 0
+        self.buckets = array('Q', bytes(BUCKETS * array('Q').itemsize))
+
+    def clear(self) -> None:
+        """Forgets every counted call."""
+        self.calls = 0
+        self.nanoseconds = 0
+        self.buckets[:] = array('Q', bytes(BUCKETS * array('Q').itemsize))
+
+    def observe(self, nanoseconds: int) -> None:
+        """Counts a call.
+
+        :param nanoseconds: Call latency
+        :type nanoseconds: int
+        """
+        self.calls += 1
+        self.nanoseconds += nanoseconds
+        self.buckets[min(nanoseconds.bit_length(), BUCKETS - 1)] += 1
+
+    def timing(self) -> Timing:
+        """Copies the counters of this histogram.
+
+        :return: Calls counted so far
+        :rtype: Timing
+        """
+        return Timing(self.calls, self.nanoseconds / 1e9, tuple(self.buckets))
+
+
+def _timed(function: Callable[..., object], histogram: Histogram) -> Callable[..., object]:
+    """Wraps a function with a timer.
+
+    :param function: Function to be timed
+    :param histogram: Histogram of the function
+    :return: The timed function
+    """
+    clock = time.perf_counter_ns
+
+    def timed(*args: object, **kwargs: object) -> object:  # noqa: WPS430
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            histogram.observe(clock() - start)
+
+    timed.__name__ = function.__name__
+    timed.__qualname__ = function.__qualname__
+    timed.__doc__ = function.__doc__
+    return timed
+
+
+def _owner(cls: type, name: str) -> type:
+    """Finds the class defining an attribute.
+
+    :param cls: Class looking the attribute up
+    :param name: Attribute name
+    :return: First class of the MRO holding the attribute
+    """
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+
+def targets() -> List[Tuple[type, str]]:
+    """Lists functions instrumented by a profiler.
+
+    Hot functions come first, then triggers and callbacks of the player
+    state machines, each function once under the class defining it.
+
+    :return: Classes and attribute names
+    :rtype: List[Tuple[type, str]]
+    """
+    found = list(HOT_FUNCTIONS)
+    for cls in (Gambler, Dealer):
+        names: List[str] = []
+        for transition in cls.transitions:
+            names.append(cast(str, transition['trigger']))
+            for key in ('conditions', 'after'):
+                names.extend(cast(Tuple[str, ...], transition.get(key, ())))
+        for name in names:
+            target = (_owner(cls, name), name)
+            if target not in found:
+                found.append(target)
+    return found
+
+
+class Profiler:
+    """Class that times engine functions while it is enabled."""
+
+    active: Optional['Profiler'] = None
+
+    def __init__(self) -> None:
+        """Instantiates this class."""
+        self.histograms: Dict[str, Histogram] = {}
+        self._originals: List[Tuple[type, str, object]] = []
+
+    @property
+    def enabled(self) -> bool:
+        """A property that tells if this profiler is timing the engine.
+
+        :return: If wrappers are installed
+        :rtype: bool
+        """
+        return Profiler.active is self
+
+    def enable(self) -> None:
+        """Installs timers on the engine classes.
+
+        :raises ValueError: When another profiler is enabled
+        """
+        if self.enabled:
+            return
+        if Profiler.active is not None:
+            raise ValueError('Another profiler is enabled!')
+        for cls, name in targets():
+            original = vars(cls)[name]
+            label = '{0}.{1}'.format(cls.__name__, name)
+            histogram = self.histograms.setdefault(label, Histogram())
+            if isinstance(original, property):
+                wrapper: object = property(_timed(original.fget, histogram), original.fset)
+            else:
+                wrapper = _timed(original, histogram)
+            self._originals.append((cls, name, original))
+            setattr(cls, name, wrapper)
+        Profiler.active = self
+
+    def disable(self) -> None:
+        """Removes timers, putting the engine functions back."""
+        if not self.enabled:
+            return
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+        Profiler.active = None
+
+    def reset(self) -> None:
+        """Clears every histogram."""
+        for histogram in self.histograms.values():
+            histogram.clear()
+
+    def snapshot(self) -> Dict[str, Timing]:
+        """Copies the calls counted so far.
+
+        :return: Timing of each called function, by ``Class.function`` label
+        :rtype: Dict[str, Timing]
+        """
+        return {
+            label: histogram.timing()
+            for label, histogram in self.histograms.items()
+            if histogram.calls
+        }
+
+    def prometheus(self) -> str:
+        """Formats histograms in the Prometheus text format.
+
+        :return: Metrics text
+        :rtype: str
+        """
+        lines = [
+            '# HELP {0} Latency of instrumented vinte_uno calls.'.format(METRIC),
+            '# TYPE {0} histogram'.format(METRIC),
+        ]
+        for label, timing in sorted(self.snapshot().items()):
+            cumulative = 0
+            for index, count in enumerate(timing.buckets[:-1]):
+                cumulative += count
+                lines.append('{0}_bucket{{name="{1}",le="{2:.9g}"}} {3}'.format(
+                    METRIC, label, 2 ** index / 1e9, cumulative,
+                ))
+            lines.append('{0}_bucket{{name="{1}",le="+Inf"}} {2}'.format(
+                METRIC, label, timing.calls,
+            ))
+            lines.append('{0}_sum{{name="{1}"}} {2:.9g}'.format(METRIC, label, timing.seconds))
+            lines.append('{0}_count{{name="{1}"}} {2}'.format(METRIC, label, timing.calls))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        """Writes histograms to a file for a Prometheus textfile collector.
+
+        The file is replaced atomically, scrapers never read half of it.
+
+        :param path: Metrics file path
+        :type path: str
+        """
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        with os.fdopen(descriptor, 'w') as metrics:
+            metrics.write(self.prometheus())
+        os.replace(temporary, path)
+
+    def __enter__(self) -> 'Profiler':
+        """Enables this profiler for a block.
+
+        :return: This profiler
+        :rtype: Profiler
+        """
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Disables this profiler.
+
+        :param exc_info: Exception information
+        """
+        self.disable()
@@ -0,0 +1,319 @@
+"""
+This module simulates the dealer policy over batches of rounds with NumPy.
+
+Rounds are played as arrays: each row of a shoe matrix holds the card ids of
+one round in dealing order, hands are integer totals and states are indexes
+on ``GAMBLER_STATES`` and ``DEALER_STATES``. Rules follow the object engine,
+see ``vinte_uno.simulation.play_round``, so both play the same rounds from
+the same shoes.
+
+It requires the ``simulation`` extra (numpy).
+"""
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from vinte_uno.simulation import STAND_ON
+from vinte_uno.vinte_uno import (
+    ACE_RANK_POINTS,
+    ACE_WEIGHT,
+    BUSTED,
+    CARD_WEIGHTS,
+    CARDS,
+    DEALER_RANK_POINTS_LIMIT,
+    DEALER_STATES,
+    GAMBLER_STATES,
+    GAMING,
+    READY_TO_GAME,
+    STAYED,
+    TWENTY_ONE,
+    TWENTY_ONE_RANK_POINTS,
+    Payouts,
+)
+
+WEIGHTS = np.frombuffer(CARD_WEIGHTS, dtype=np.uint8).astype(np.int16)
+SOFT_BONUS = ACE_RANK_POINTS - ACE_WEIGHT
+CHUNK = 100000
+GAMBLER_READY = GAMBLER_STATES.index(READY_TO_GAME)
+GAMBLER_GAMING = GAMBLER_STATES.index(GAMING)
+GAMBLER_TWENTY_ONE = GAMBLER_STATES.index(TWENTY_ONE)
+GAMBLER_BUSTED = GAMBLER_STATES.index(BUSTED)
+GAMBLER_STAYED = GAMBLER_STATES.index(STAYED)
+DEALER_BUSTED = DEALER_STATES.index(BUSTED)
+DEALER_STAYED = DEALER_STATES.index(STAYED)
+
+
+class Outcomes(NamedTuple):  # noqa: H601
+    """Arrays with the outcome of every simulated round."""
+
+    dealer_states: np.ndarray
+    dealer_hands: np.ndarray
+    gambler_states: np.ndarray
+    gambler_hands: np.ndarray
+    credits: np.ndarray
+
+
+class Summary(NamedTuple):  # noqa: H601
+    """Statistics of a simulation, per gambler hand and bet unit."""
+
+    rounds: int
+    hands: int
+    house_edge: float
+    dealer_bust_rate: float
+    gambler_bust_rate: float
+    payout_variance: float
+
+
+class _Table:
+    """Arrays holding a batch of tables while rounds are played."""
+
+    def __init__(self, shoes: np.ndarray, seats: int, bet: int, payouts: Payouts) -> None:
+        """Instantiates this class.
+
+        :param shoes: Card ids of each round in dealing order
+        :param seats: Number of gamblers per table
+        :param bet: Credit bet by each gambler
+        :param payouts: Payout ratios of the tables
+        """
+        rounds = shoes.shape[0]
+        self.shoes = shoes
+        self.payouts = payouts
+        self.rows = np.arange(rounds)
+        self.position = np.zeros(rounds, dtype=np.int64)
+        self.hard = np.zeros((rounds, seats), dtype=np.int16)
+        self.aces = np.zeros((rounds, seats), dtype=np.int16)
+        self.states = np.full((rounds, seats), GAMBLER_READY, dtype=np.int8)
+        self.credits = np.full((rounds, seats), bet, dtype=np.int64)
+        self.dealer_hard = np.zeros(rounds, dtype=np.int16)
+        self.dealer_aces = np.zeros(rounds, dtype=np.int16)
+        self.dealer_states = np.zeros(rounds, dtype=np.int8)
+        self.dealer_credits = np.ones(rounds, dtype=np.int64)
+
+    def draw(self, mask: np.ndarray) -> np.ndarray:
+        """Draws the next card of each round selected by mask.
+
+        :param mask: Rounds drawing a card
+        :raises ValueError: When a shoe runs out of cards
+        :return: Weight of drawn cards, zero where mask is unset
+        """
+        if np.any(self.position[mask] >= self.shoes.shape[1]):
+            raise ValueError("Doesn't have enough cards!")
+        index = np.minimum(self.position, self.shoes.shape[1] - 1)
+        weights: np.ndarray = np.where(mask, WEIGHTS[self.shoes[self.rows, index]], 0)
+        self.position += mask
+        return weights
+
+    def hit(self, seat: int, mask: np.ndarray) -> None:
+        """Hits a gambler seat, as ``Player.hit``.
+
+        :param seat: Gambler seat
+        :param mask: Rounds where the gambler hits
+        """
+        weights = self.draw(mask)
+        self.hard[:, seat] += weights
+        self.aces[:, seat] += weights == ACE_WEIGHT
+
+    def dealer_hit(self, mask: np.ndarray) -> None:
+        """Hits the dealer, as ``Player.hit``.
+
+        :param mask: Rounds where the dealer hits
+        """
+        weights = self.draw(mask)
+        self.dealer_hard += weights
+        self.dealer_aces += weights == ACE_WEIGHT
+
+    def hit_gamblers(self) -> None:
+        """Hits every gaming gambler in seat order, as ``Dealer._hit``."""
+        for seat in range(self.states.shape[1]):
+            gaming = self.states[:, seat] == GAMBLER_GAMING
+            self.hit(seat, gaming)
+            hand = hands(self.hard[:, seat], self.aces[:, seat])
+            busted = gaming & (hand > TWENTY_ONE_RANK_POINTS)
+            self.states[busted, seat] = GAMBLER_BUSTED
+            self.credits[busted, seat] -= _payout(self.credits[busted, seat], self.payouts.bust)
+            won = gaming & (hand == TWENTY_ONE_RANK_POINTS)
+            self.states[won, seat] = GAMBLER_TWENTY_ONE
+            self.credits[won, seat] += (
+                _payout(self.credits[won, seat], self.payouts.twenty_one) + self.dealer_credits[won]
+            )
+            self.dealer_credits[won] = 0
+
+    def decide(self, stand_on: int) -> None:
+        """Gaming gamblers stay once their hand reaches stand_on points.
+
+        :param stand_on: Points from which gamblers stay
+        """
+        staying = (self.states == GAMBLER_GAMING) & (hands(self.hard, self.aces) >= stand_on)
+        self.states[staying] = GAMBLER_STAYED
+
+    def settle_stay(self, mask: np.ndarray) -> None:
+        """Dealer stays, as ``Dealer.after_stay``.
+
+        :param mask: Rounds where the dealer stays
+        """
+        self.dealer_states[mask] = DEALER_STAYED
+        self.settle(mask)
+
+    def settle_bust(self, mask: np.ndarray) -> None:
+        """Dealer busts, as ``Dealer.after_bust``.
+
+        :param mask: Rounds where the dealer busts
+        """
+        self.dealer_states[mask] = DEALER_BUSTED
+        self.settle(mask)
+
+    def settle(self, mask: np.ndarray) -> None:
+        """Resolves stayed gamblers against the dealer, as ``Dealer.settle``.
+
+        :param mask: Rounds where the dealer busts or stays
+        """
+        stayed = (self.states == GAMBLER_STAYED) & mask[:, None]
+        hand = hands(self.hard, self.aces)
+        dealer_hand = hands(self.dealer_hard, self.dealer_aces)[:, None]
+        won = (self.dealer_states == DEALER_BUSTED)[:, None] | (hand > dealer_hand)
+        ratios = np.select(
+            (won, hand == dealer_hand),
+            (self.payouts.win, self.payouts.push),
+            -self.payouts.loss,
+        )
+        self.credits[stayed] += _payout(self.credits[stayed], ratios[stayed])
+
+
+def _payout(credits: np.ndarray, ratio: object) -> np.ndarray:
+    """Truncates payouts to whole credits, as ``Payouts`` does.
+
+    :param credits: Gambler credits
+    :param ratio: Payout ratios
+    :return: Credits won, negative when lost
+    """
+    payouts: np.ndarray = (credits * ratio).astype(np.int64)
+    return payouts
+
+
+def hands(hard: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """Evaluates hands as ``Player.hand``.
+
+    :param hard: Hard totals, aces counting as one
+    :param aces: Number of aces on each hand
+    :return: Total rank points of each hand
+    """
+    soft = (aces > 0) & (hard + SOFT_BONUS <= TWENTY_ONE_RANK_POINTS)
+    totals: np.ndarray = np.where(soft, hard + SOFT_BONUS, hard)
+    return totals
+
+
+def deal_shoes(rounds: int, decks: int = 1, seed: Optional[int] = None) -> np.ndarray:
+    """Shuffles a fresh shoe for every round.
+
+    :param rounds: Number of rounds
+    :param decks: Number of decks in each shoe
+    :param seed: Seed of the random generator
+    :return: A (rounds, decks * 52) matrix of card ids in dealing order
+    """
+    generator = np.random.default_rng(seed)
+    shoe = np.tile(np.arange(len(CARDS), dtype=np.uint8), decks)
+    shoes: np.ndarray = generator.permuted(np.broadcast_to(shoe, (rounds, shoe.size)), axis=1)
+    return shoes
+
+
+def play(
+    shoes: np.ndarray,
+    seats: int = 1,
+    stand_on: int = STAND_ON,
+    bet: int = 1,
+    payouts: Payouts = Payouts(),
+) -> Outcomes:
+    """Plays one round per shoe.
+
+    :param shoes: Card ids of each round in dealing order
+    :param seats: Number of gamblers per table
+    :param stand_on: Points from which gamblers stay
+    :param bet: Credit bet by each gambler
+    :param payouts: Payout ratios of the tables
+    :return: Arrays with the outcome of each round
+    """
+    table = _Table(shoes, seats, bet, payouts)
+    everyone = np.ones(shoes.shape[0], dtype=bool)
+
+    for seat in range(seats):
+        table.hit(seat, everyone)
+    table.dealer_hit(everyone)
+    table.states[:] = GAMBLER_GAMING
+    table.decide(stand_on)
+
+    table.hit_gamblers()
+    table.dealer_hit(everyone)
+    table.decide(stand_on)
+
+    while np.any(table.states == GAMBLER_GAMING):
+        table.hit_gamblers()
+        table.decide(stand_on)
+
+    anyone_stayed = np.any(table.states == GAMBLER_STAYED, axis=1)
+    dealer_hand = hands(table.dealer_hard, table.dealer_aces)
+    staying = (dealer_hand >= DEALER_RANK_POINTS_LIMIT) | ~anyone_stayed
+    table.settle_stay(staying)
+    exposed = ~staying
+    while np.any(exposed):
+        table.dealer_hit(exposed)
+        dealer_hand = hands(table.dealer_hard, table.dealer_aces)
+        busting = exposed & (dealer_hand > TWENTY_ONE_RANK_POINTS)
+        table.settle_bust(busting)
+        staying = exposed & ~busting & (dealer_hand >= DEALER_RANK_POINTS_LIMIT)
+        table.settle_stay(staying)
+        exposed &= ~(busting | staying)
+
+    return Outcomes(
+        dealer_states=table.dealer_states,
+        dealer_hands=hands(table.dealer_hard, table.dealer_aces),
+        gambler_states=table.states,
+        gambler_hands=hands(table.hard, table.aces),
+        credits=table.credits,
+    )
+
+
+def simulate(
+    rounds: int,
+    seats: int = 1,
+    stand_on: int = STAND_ON,
+    decks: int = 1,
+    bet: int = 1,
+    seed: Optional[int] = None,
+    payouts: Payouts = Payouts(),
+) -> Summary:
+    """Simulates rounds in chunks and summarizes their outcomes.
+
+    :param rounds: Number of rounds
+    :param seats: Number of gamblers per table
+    :param stand_on: Points from which gamblers stay
+    :param decks: Number of decks shuffled for each round
+    :param bet: Credit bet by each gambler
+    :param seed: Seed of the random generator
+    :param payouts: Payout ratios of the tables
+    :return: House edge, bust rates and payout variance
+    """
+    generator = np.random.default_rng(seed)
+    dealer_busts = 0
+    gambler_busts = 0
+    net_sum = 0
+    net_squares = 0
+    for start in range(0, rounds, CHUNK):
+        size = min(CHUNK, rounds - start)
+        chunk_seed = int(generator.integers(np.iinfo(np.int64).max))
+        outcomes = play(deal_shoes(size, decks, chunk_seed), seats, stand_on, bet, payouts)
+        net: np.ndarray = outcomes.credits - bet
+        dealer_busts += int(np.count_nonzero(outcomes.dealer_states == DEALER_BUSTED))
+        gambler_busts += int(np.count_nonzero(outcomes.gambler_states == GAMBLER_BUSTED))
+        net_sum += int(net.sum())
+        net_squares += int(np.square(net).sum())
+
+    total = rounds * seats
+    mean = net_sum / total
+    return Summary(
+        rounds=rounds,
+        hands=total,
+        house_edge=-mean / bet,
+        dealer_bust_rate=dealer_busts / rounds,
+        gambler_bust_rate=gambler_busts / total,
+        payout_variance=net_squares / total - mean ** 2,
+    )
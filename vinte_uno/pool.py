@@ -0,0 +1,75 @@
+"""
+This module keeps a pool of tables reused from round to round.
+
+Tables are reset when released instead of being built again, so their
+players, hands and decks are recycled in place.
+"""
+from typing import Callable, List
+
+from vinte_uno.vinte_uno import Dealer, Deck, Gambler, Shoe
+
+DeckFactory = Callable[[], Deck]
+
+
+class TablePool:
+    """Class that lends ready tables and takes them back between rounds."""
+
+    def __init__(
+        self,
+        seats: int = 3,
+        bet: int = 1,
+        deck_factory: DeckFactory = Deck,
+        size: int = 0,
+    ) -> None:
+        """Instantiates this class.
+
+        :param seats: Number of gamblers per table
+        :type seats: int
+        :param bet: Credit bet by each gambler
+        :type bet: int
+        :param deck_factory: Builds the deck of a new table
+        :type deck_factory: DeckFactory
+        :param size: Number of tables built upfront
+        :type size: int
+        """
+        self.seats: int = seats
+        self.bet: int = bet
+        self.deck_factory: DeckFactory = deck_factory
+        self.free: List[Dealer] = [self._build() for _ in range(size)]
+
+    def __len__(self) -> int:
+        """Number of tables ready to be acquired.
+
+        :return: Free tables
+        :rtype: int
+        """
+        return len(self.free)
+
+    def acquire(self) -> Dealer:
+        """Lends a table ready to deal, building one when the pool is empty.
+
+        :return: Dealer of the table
+        :rtype: Dealer
+        """
+        if self.free:
+            return self.free.pop()
+        return self._build()
+
+    def release(self, dealer: Dealer) -> None:
+        """Takes a table back, resetting it for its next round.
+
+        Single decks are refilled and reshuffled, shoes are kept until
+        their cut card comes out.
+
+        :param dealer: Dealer of a table lent by this pool
+        :type dealer: Dealer
+        """
+        dealer.reset(gambler_credit=self.bet, reshuffle=not isinstance(dealer.deck, Shoe))
+        self.free.append(dealer)
+
+    def _build(self) -> Dealer:
+        gamblers = [
+            Gambler(name='Gambler {0}'.format(seat), credit=self.bet)
+            for seat in range(self.seats)
+        ]
+        return Dealer(gamblers=gamblers, deck=self.deck_factory())
@@ -0,0 +1,133 @@
+"""
+This module computes exact odds of the dealer final hand.
+
+The dealer draws until its hand reaches ``DEALER_RANK_POINTS_LIMIT``, an ace
+counting as eleven whenever it does not bust the hand, as ``Player.hand``.
+Shoes are described by their composition: how many cards of each weight,
+from ace (1) to ten-valued cards (10), are left. Odds are computed by
+recursion over compositions, memoized under bounded LRU caches.
+"""
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Tuple
+
+from vinte_uno.cards import (
+    ACE_RANK_POINTS,
+    ACE_WEIGHT,
+    CARD_WEIGHTS,
+    DEALER_RANK_POINTS_LIMIT,
+    TWENTY_ONE_RANK_POINTS,
+)
+
+Composition = Tuple[int, ...]
+WEIGHTS: Tuple[int, ...] = tuple(range(ACE_WEIGHT, 11))
+SOFT_BONUS = ACE_RANK_POINTS - ACE_WEIGHT
+CACHE_SIZE = 1 << 16
+DRAW_CACHE_SIZE = 1 << 20
+_OUTCOMES = TWENTY_ONE_RANK_POINTS - DEALER_RANK_POINTS_LIMIT + 2
+
+
+class DealerOdds(NamedTuple):  # noqa: H601
+    """Probabilities of the dealer final hand."""
+
+    seventeen: float
+    eighteen: float
+    nineteen: float
+    twenty: float
+    twenty_one: float
+    bust: float
+
+
+def composition(cards: Iterable[int]) -> Composition:
+    """Counts cards of each weight.
+
+    :param cards: Card ids, see ``CARDS``
+    :type cards: Iterable[int]
+    :return: Number of cards of each weight, aces first
+    :rtype: Composition
+    """
+    counts = [0] * len(WEIGHTS)
+    for card_id in cards:
+        counts[CARD_WEIGHTS[card_id] - ACE_WEIGHT] += 1
+    return tuple(counts)
+
+
+def hand_total(hard: int, has_ace: bool) -> int:
+    """Evaluates a hand as ``Player.hand``.
+
+    :param hard: Hand total, aces counting as one
+    :type hard: int
+    :param has_ace: If there is an ace on hand
+    :type has_ace: bool
+    :return: total rank points
+    :rtype: int
+    """
+    if has_ace and hard + SOFT_BONUS <= TWENTY_ONE_RANK_POINTS:
+        return hard + SOFT_BONUS
+    return hard
+
+
+@lru_cache(maxsize=DRAW_CACHE_SIZE)
+def _draw(hard: int, has_ace: bool, counts: Composition) -> Tuple[float, ...]:
+    """Odds of the final hand of a dealer holding hard points.
+
+    :param hard: Hand total, aces counting as one
+    :param has_ace: If there is an ace on hand
+    :param counts: Remaining shoe composition
+    :raises ValueError: When the shoe runs out before the dealer stands
+    :return: Probability of each outcome, see ``DealerOdds``
+    """
+    total = hand_total(hard, has_ace)
+    outcomes = [0.0] * _OUTCOMES
+    if total > TWENTY_ONE_RANK_POINTS:
+        outcomes[-1] = 1.0
+        return tuple(outcomes)
+    if total >= DEALER_RANK_POINTS_LIMIT:
+        outcomes[total - DEALER_RANK_POINTS_LIMIT] = 1.0
+        return tuple(outcomes)
+
+    remaining = sum(counts)
+    if not remaining:
+        raise ValueError("Doesn't have enough cards!")
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        weight = WEIGHTS[index]
+        drawn = counts[:index] + (count - 1,) + counts[index + 1:]
+        odds = _draw(hard + weight, has_ace or weight == ACE_WEIGHT, drawn)
+        for outcome, probability in enumerate(odds):
+            outcomes[outcome] += probability * count / remaining
+    return tuple(outcomes)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def dealer_odds(up_weight: int, counts: Composition) -> DealerOdds:
+    """Odds of the dealer final hand given its up-card.
+
+    :param up_weight: Weight of the dealer up-card, 1 for an ace
+    :type up_weight: int
+    :param counts: Composition of the shoe the hole card is drawn from
+    :type counts: Composition
+    :raises ValueError: When the up-card weight is unknown
+    :return: Probability of each final hand
+    :rtype: DealerOdds
+    """
+    if up_weight not in WEIGHTS:
+        raise ValueError('Unknown card weight {0}!'.format(up_weight))
+    return DealerOdds(*_draw(up_weight, up_weight == ACE_WEIGHT, tuple(counts)))
+
+
+def shoe_composition(decks: int = 1) -> Composition:
+    """Composition of a full shoe.
+
+    :param decks: Number of decks
+    :type decks: int
+    :return: Number of cards of each weight, aces first
+    :rtype: Composition
+    """
+    return tuple(count * decks for count in composition(range(len(CARD_WEIGHTS))))
+
+
+def clear_cache() -> None:
+    """Clears memoized odds."""
+    _draw.cache_clear()
+    dealer_odds.cache_clear()
@@ -0,0 +1,265 @@
+"""
+This module runs independent tables on a pool of processes.
+
+Every table gets its own seed derived from a master seed, so a run is
+reproduced exactly whatever the number of workers. Workers send back small
+aggregates of counters only, never ``Player`` objects.
+
+A table can also be streamed, ``stream_table`` yielding a small record per
+round from a table reused across rounds, so memory does not grow with the
+number of rounds. Records feed ``aggregate`` or ``write_csv``.
+"""
+import csv
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from vinte_uno.simulation import STAND_ON, play_round
+from vinte_uno.vinte_uno import DEALER_STATES, GAMBLER_STATES, Dealer, Gambler, Shoe
+
+TASKS_PER_WORKER = 4
+
+
+class Aggregate(NamedTuple):  # noqa: H601
+    """Counters merged from any number of rounds.
+
+    States are counted in the order of ``GAMBLER_STATES`` and
+    ``DEALER_STATES``.
+    """
+
+    rounds: int = 0
+    credits_won: int = 0
+    credits_lost: int = 0
+    gambler_states: Tuple[int, ...] = (0,) * len(GAMBLER_STATES)
+    dealer_states: Tuple[int, ...] = (0,) * len(DEALER_STATES)
+
+    def merge(self, other: 'Aggregate') -> 'Aggregate':
+        """Merges counters of another aggregate.
+
+        :param other: Another aggregate
+        :type other: Aggregate
+        :return: A new aggregate with counters of both
+        :rtype: Aggregate
+        """
+        return Aggregate(
+            rounds=self.rounds + other.rounds,
+            credits_won=self.credits_won + other.credits_won,
+            credits_lost=self.credits_lost + other.credits_lost,
+            gambler_states=tuple(
+                mine + theirs for mine, theirs in zip(self.gambler_states, other.gambler_states)
+            ),
+            dealer_states=tuple(
+                mine + theirs for mine, theirs in zip(self.dealer_states, other.dealer_states)
+            ),
+        )
+
+
+class RoundRecord(NamedTuple):  # noqa: H601
+    """Outcome of a streamed round, gamblers in seat order.
+
+    ``deltas`` holds the credits each gambler won on its bet, negative when
+    lost. ``number`` counts rounds of the table from zero.
+    """
+
+    number: int
+    dealer_state: str
+    dealer_hand: int
+    gambler_states: Tuple[str, ...]
+    gambler_hands: Tuple[int, ...]
+    deltas: Tuple[int, ...]
+
+
+class TableSettings(NamedTuple):  # noqa: H601
+    """Settings shared by every table of a run."""
+
+    rounds: int = 1000
+    seats: int = 3
+    stand_on: int = STAND_ON
+    bet: int = 1
+    decks: int = 6
+    penetration: float = 0.75
+
+
+def table_seed(master_seed: int, table: int) -> int:
+    """Derives the seed of a table from the master seed.
+
+    :param master_seed: Seed of the whole run
+    :type master_seed: int
+    :param table: Table index
+    :type table: int
+    :return: A 64 bits seed
+    :rtype: int
+    """
+    key = '{0}:{1}'.format(master_seed, table).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big')
+
+
+def stream_table(
+    seed: int,
+    settings: TableSettings = TableSettings(),
+    stop: Optional[Callable[[RoundRecord], bool]] = None,
+) -> Iterator[RoundRecord]:
+    """Plays the rounds of a table one record at a time.
+
+    A single table and shoe are reused across rounds. The next round is
+    only played when the consumer asks for its record, closing the
+    generator leaves the table there.
+
+    :param seed: Seed of the table
+    :type seed: int
+    :param settings: Settings of the run
+    :type settings: TableSettings
+    :param stop: Ends the stream after the first record it returns True for
+    :type stop: Optional[Callable[[RoundRecord], bool]]
+    :yield: A record per round
+    :rtype: Iterator[RoundRecord]
+    """
+    shoe = Shoe(decks=settings.decks, penetration=settings.penetration, rng=random.Random(seed))
+    gamblers = [
+        Gambler(name='Gambler {0}'.format(seat), credit=settings.bet)
+        for seat in range(settings.seats)
+    ]
+    dealer = Dealer(gamblers=gamblers, deck=shoe)
+    for number in range(settings.rounds):
+        result = play_round(dealer, stand_on=settings.stand_on)
+        dealer.reset(gambler_credit=settings.bet)
+        record = RoundRecord(
+            number=number,
+            dealer_state=result.dealer_state,
+            dealer_hand=result.dealer_hand,
+            gambler_states=result.gambler_states,
+            gambler_hands=result.gambler_hands,
+            deltas=tuple(credit - settings.bet for credit in result.credits),
+        )
+        yield record
+        if stop is not None and stop(record):
+            return
+
+
+def aggregate(records: Iterable[RoundRecord]) -> Aggregate:
+    """Counts streamed rounds.
+
+    :param records: Records of any number of rounds
+    :type records: Iterable[RoundRecord]
+    :return: Counters of the rounds
+    :rtype: Aggregate
+    """
+    rounds = 0
+    won = 0
+    lost = 0
+    gambler_states = [0] * len(GAMBLER_STATES)
+    dealer_states = [0] * len(DEALER_STATES)
+    for record in records:
+        rounds += 1
+        for state, delta in zip(record.gambler_states, record.deltas):
+            gambler_states[GAMBLER_STATES.index(state)] += 1
+            if delta > 0:
+                won += delta
+            else:
+                lost -= delta
+        dealer_states[DEALER_STATES.index(record.dealer_state)] += 1
+
+    return Aggregate(
+        rounds=rounds,
+        credits_won=won,
+        credits_lost=lost,
+        gambler_states=tuple(gambler_states),
+        dealer_states=tuple(dealer_states),
+    )
+
+
+def write_csv(records: Iterable[RoundRecord], output: TextIO) -> int:
+    """Writes records as CSV rows, a state, hand and delta column per seat.
+
+    :param records: Records of a table
+    :type records: Iterable[RoundRecord]
+    :param output: Text file the rows are written to
+    :type output: TextIO
+    :return: Number of records written
+    :rtype: int
+    """
+    writer = csv.writer(output)
+    written = 0
+    for record in records:
+        if not written:
+            header = ['round', 'dealer_state', 'dealer_hand']
+            for seat in range(len(record.deltas)):
+                header.extend('gambler_{0}_{1}'.format(seat, column) for column in (
+                    'state', 'hand', 'delta',
+                ))
+            writer.writerow(header)
+        row: List[object] = [record.number, record.dealer_state, record.dealer_hand]
+        for fields in zip(record.gambler_states, record.gambler_hands, record.deltas):
+            row.extend(fields)
+        writer.writerow(row)
+        written += 1
+    return written
+
+
+def run_table(seed: int, settings: TableSettings) -> Aggregate:
+    """Plays every round of a table with a shoe living across rounds.
+
+    :param seed: Seed of the table
+    :type seed: int
+    :param settings: Settings of the run
+    :type settings: TableSettings
+    :return: Counters of the table
+    :rtype: Aggregate
+    """
+    return aggregate(stream_table(seed, settings))
+
+
+def run_tables(seeds: Iterable[int], settings: TableSettings) -> Aggregate:
+    """Plays many tables in a row and merges their counters.
+
+    :param seeds: Seed of each table
+    :type seeds: Iterable[int]
+    :param settings: Settings of the run
+    :type settings: TableSettings
+    :return: Counters of all tables
+    :rtype: Aggregate
+    """
+    return reduce(
+        Aggregate.merge,
+        (run_table(seed, settings) for seed in seeds),
+        Aggregate(),
+    )
+
+
+def run(
+    tables: int,
+    settings: TableSettings = TableSettings(),
+    master_seed: int = 0,
+    workers: Optional[int] = None,
+) -> Aggregate:
+    """Runs independent tables on a process pool.
+
+    Tables are split in a few batches per worker, each batch comes back as a
+    single aggregate.
+
+    :param tables: Number of tables
+    :type tables: int
+    :param settings: Settings of the run
+    :type settings: TableSettings
+    :param master_seed: Seed from which table seeds are derived
+    :type master_seed: int
+    :param workers: Number of processes, all cores by default
+    :type workers: Optional[int]
+    :return: Counters of all tables
+    :rtype: Aggregate
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = [table_seed(master_seed, table) for table in range(tables)]
+    if workers == 1:
+        return run_tables(seeds, settings)
+
+    batches: List[List[int]] = [
+        seeds[start::workers * TASKS_PER_WORKER]
+        for start in range(min(tables, workers * TASKS_PER_WORKER))
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        aggregates = executor.map(run_tables, batches, [settings] * len(batches))
+        return reduce(Aggregate.merge, aggregates, Aggregate())
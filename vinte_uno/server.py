@@ -0,0 +1,159 @@
+"""
+This module hosts many tables on a single asyncio event loop.
+
+Gamblers decide through coroutines, a table awaits its gamblers without
+blocking the loop, so other tables keep playing meanwhile.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, Sequence
+
+from vinte_uno.simulation import FINAL_DEALER_STATES, RoundResult, round_result
+from vinte_uno.vinte_uno import GAMING, Dealer, Deck, Gambler, Shoe
+
+Decide = Callable[[Gambler, Dealer], Awaitable[bool]]
+LATENCY_WINDOW = 100000
+
+
+class TurnStats:
+    """Counters and recent latencies of played turns."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Instantiates this class.
+
+        :param window: Number of recent turn latencies kept
+        :type window: int
+        """
+        self.turns: int = 0
+        self.decisions: int = 0
+        self.timeouts: int = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float, decisions: int) -> None:
+        """Records a played turn.
+
+        :param latency: Seconds spent on the turn, decisions included
+        :type latency: float
+        :param decisions: Number of gamblers that decided on the turn
+        :type decisions: int
+        """
+        self.turns += 1
+        self.decisions += decisions
+        self.latencies.append(latency)
+
+    def percentile(self, percent: float) -> float:
+        """Returns a percentile of recent turn latencies.
+
+        :param percent: Percentile, from 0 to 100
+        :type percent: float
+        :return: Latency in seconds, zero when no turn was played
+        :rtype: float
+        """
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * percent / 100))
+        return latencies[index]
+
+
+class AsyncTable:
+    """Class that plays rounds of a table awaiting gamblers decisions."""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        decide: Decide,
+        deck: Optional[Deck] = None,
+        bet: int = 1,
+        timeout: Optional[float] = None,
+        stats: Optional[TurnStats] = None,
+    ) -> None:
+        """Instantiates this class.
+
+        :param names: Names of gamblers sitting at the table
+        :param decide: Coroutine function telling if a gambler stays
+        :param deck: Deck or shoe kept across rounds, a new shoe by default, reshuffled
+            at its cut card
+        :param bet: Credit bet by each gambler
+        :param timeout: Seconds a gambler has to decide before staying
+        :param stats: Turn counters, possibly shared with other tables
+        :type names: Sequence[str]
+        :type decide: Decide
+        :type deck: Optional[Deck]
+        :type bet: int
+        :type timeout: Optional[float]
+        :type stats: Optional[TurnStats]
+        """
+        self.names: Sequence[str] = names
+        self.decide: Decide = decide
+        self.deck: Deck = deck if deck is not None else Shoe()
+        self.bet: int = bet
+        self.timeout: Optional[float] = timeout
+        self.stats: TurnStats = stats if stats is not None else TurnStats()
+
+    async def play_round(self) -> RoundResult:
+        """Plays a round until the dealer busts or stays.
+
+        :return: Outcome of the round, gamblers in seat order
+        :rtype: RoundResult
+        """
+        gamblers = [Gambler(name=name, credit=self.bet) for name in self.names]
+        dealer = Dealer(gamblers=list(gamblers), deck=self.deck)
+        while dealer.state not in FINAL_DEALER_STATES:
+            start = time.perf_counter()
+            dealer.turn()
+            gaming = [gambler for gambler in gamblers if gambler.state == GAMING]
+            if gaming:
+                stays = await asyncio.gather(
+                    *(self._decide(gambler, dealer) for gambler in gaming),
+                )
+                for gambler, stay in zip(gaming, stays):
+                    if stay:
+                        gambler.stay()
+            else:
+                await asyncio.sleep(0)
+            self.stats.record(time.perf_counter() - start, len(gaming))
+
+        return round_result(dealer, gamblers)
+
+    async def play(self, rounds: int) -> List[RoundResult]:
+        """Plays many rounds in a row.
+
+        :param rounds: Number of rounds
+        :type rounds: int
+        :return: Outcome of each round
+        :rtype: List[RoundResult]
+        """
+        return [await self.play_round() for _ in range(rounds)]
+
+    async def _decide(self, gambler: Gambler, dealer: Dealer) -> bool:
+        if self.timeout is None:
+            return await self.decide(gambler, dealer)
+        try:
+            return await asyncio.wait_for(self.decide(gambler, dealer), self.timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            return True
+
+
+class TableHost:
+    """Class that runs many tables concurrently on the running loop."""
+
+    def __init__(self, tables: Sequence[AsyncTable]) -> None:
+        """Instantiates this class.
+
+        :param tables: Tables to be hosted
+        :type tables: Sequence[AsyncTable]
+        """
+        self.tables: Sequence[AsyncTable] = tables
+
+    async def serve(self, rounds: int) -> List[List[RoundResult]]:
+        """Plays rounds on every table concurrently.
+
+        :param rounds: Number of rounds played by each table
+        :type rounds: int
+        :return: Outcome of each round, per table
+        :rtype: List[List[RoundResult]]
+        """
+        return list(await asyncio.gather(*(table.play(rounds) for table in self.tables)))
@@ -0,0 +1,146 @@
+"""
+This module plays whole rounds with the game engine.
+"""
+import time
+from array import array
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from vinte_uno.vinte_uno import (
+    BUSTED,
+    DEALER_RANK_POINTS_LIMIT,
+    GAMING,
+    STAYED,
+    Dealer,
+    Deck,
+    Gambler,
+)
+
+FINAL_DEALER_STATES = (BUSTED, STAYED)
+STAND_ON = DEALER_RANK_POINTS_LIMIT
+Policy = Callable[[Gambler, Dealer], bool]
+
+
+class RoundResult(NamedTuple):  # noqa: H601
+    """Object that contains the outcome of a round."""
+
+    dealer_state: str
+    dealer_hand: int
+    gambler_states: Tuple[str, ...]
+    gambler_hands: Tuple[int, ...]
+    credits: Tuple[int, ...]
+
+
+class TickStats(NamedTuple):  # noqa: H601
+    """Throughput of a ``step_tables`` tick."""
+
+    stepped: int
+    finished: int
+    seconds: float
+
+    @property
+    def steps_per_second(self) -> float:
+        """A property that contains tables stepped per second.
+
+        :return: Throughput of the tick
+        :rtype: float
+        """
+        return self.stepped / self.seconds if self.seconds else 0.0
+
+
+def stacked_deck(cards: Sequence[int]) -> Deck:
+    """Builds a deck that deals cards in the given order.
+
+    :param cards: Card ids, the first one is dealt first
+    :type cards: Sequence[int]
+    :return: A deck object
+    :rtype: Deck
+    """
+    deck = Deck()
+    deck.cards = array('B', reversed(cards))
+    return deck
+
+
+def play_round(
+    dealer: Dealer,
+    stand_on: int = STAND_ON,
+    policy: Optional[Policy] = None,
+) -> RoundResult:
+    """Plays a round until the dealer busts or stays.
+
+    Gamblers stay as soon as their hand reaches ``stand_on`` points, or when
+    the given policy tells so.
+
+    :param dealer: A dealer with its gamblers, before dealing
+    :type dealer: Dealer
+    :param stand_on: Points from which gamblers stay
+    :type stand_on: int
+    :param policy: Function telling if a gaming gambler stays
+    :type policy: Optional[Policy]
+    :return: Outcome of the round, gamblers in seat order
+    :rtype: RoundResult
+    """
+    gamblers: List[Gambler] = list(dealer.gamblers)
+    while dealer.state not in FINAL_DEALER_STATES:
+        dealer.turn()
+        _decide(dealer, stand_on, policy)
+
+    return round_result(dealer, gamblers)
+
+
+def step_tables(
+    tables: Sequence[Dealer],
+    stand_on: int = STAND_ON,
+    policy: Optional[Policy] = None,
+) -> TickStats:
+    """Advances many tables by one turn, as ``play_round`` does per loop.
+
+    Tables are stepped in the given order, tables whose round is over are
+    skipped.
+
+    :param tables: Dealers of the tables
+    :type tables: Sequence[Dealer]
+    :param stand_on: Points from which gamblers stay
+    :type stand_on: int
+    :param policy: Function telling if a gaming gambler stays
+    :type policy: Optional[Policy]
+    :return: Throughput of the tick
+    :rtype: TickStats
+    """
+    start = time.perf_counter()
+    stepped = 0
+    finished = 0
+    for dealer in tables:
+        if dealer.state in FINAL_DEALER_STATES:
+            continue
+        dealer.turn()
+        _decide(dealer, stand_on, policy)
+        stepped += 1
+        finished += dealer.state in FINAL_DEALER_STATES
+    return TickStats(stepped, finished, time.perf_counter() - start)
+
+
+def _decide(dealer: Dealer, stand_on: int, policy: Optional[Policy]) -> None:
+    for gambler in dealer.gamblers:
+        if gambler.state != GAMING:
+            continue
+        if policy(gambler, dealer) if policy is not None else gambler.hand >= stand_on:
+            gambler.stay()
+
+
+def round_result(dealer: Dealer, gamblers: Sequence[Gambler]) -> RoundResult:
+    """Collects the outcome of a finished round.
+
+    :param dealer: A dealer whose round is over
+    :type dealer: Dealer
+    :param gamblers: Gamblers of the round in seat order
+    :type gamblers: Sequence[Gambler]
+    :return: Outcome of the round
+    :rtype: RoundResult
+    """
+    return RoundResult(
+        dealer_state=dealer.state,
+        dealer_hand=dealer.hand,
+        gambler_states=tuple(gambler.state for gambler in gamblers),
+        gambler_hands=tuple(gambler.hand for gambler in gamblers),
+        credits=tuple(gambler.credit for gambler in gamblers),
+    )
@@ -0,0 +1,246 @@
+"""
+This module freezes tables into compact snapshots and restores them.
+
+States are stored as indexes on ``GAMBLER_STATES`` and ``DEALER_STATES``,
+cards as ids on ``CARDS``, exhaustion policies as indexes on
+``EXHAUSTION_POLICIES``, everything else in typed arrays. Payouts of the
+table are the ones of its dealer.
+"""
+import random
+from array import array
+from typing import Optional, Tuple, Union
+
+from vinte_uno.vinte_uno import (
+    CARDS,
+    DEALER_STATES,
+    EXHAUSTION_POLICIES,
+    GAMBLER_STATES,
+    CountTracker,
+    Dealer,
+    Deck,
+    Gambler,
+    Payouts,
+    Shoe,
+)
+
+CardIds = Union[array, memoryview]
+
+
+class TableSnapshot:
+    """Compact state of a dealer, its gamblers and its deck.
+
+    Gambler cards are concatenated in ``cards``, ``hand_sizes`` telling how
+    many of them belong to each gambler in seat order. Discards and reserve
+    of the deck are empty unless its exhaustion policy keeps them. Card ids
+    are held in arrays, or in ``memoryview`` slices of a decoded message.
+    """
+
+    __slots__ = (
+        'dealer_name',
+        'dealer_state',
+        'dealer_credit',
+        'dealer_amount',
+        'dealer_cards',
+        'names',
+        'states',
+        'credits',
+        'amounts',
+        'hand_sizes',
+        'cards',
+        'deck',
+        'decks',
+        'cut_card',
+        'payouts',
+        'exhaustion',
+        'dealt',
+        'reserve',
+        'unshuffled',
+    )
+
+    def __init__(  # noqa: WPS211
+        self,
+        dealer_name: str,
+        dealer_state: int,
+        dealer_credit: int,
+        dealer_amount: int,
+        dealer_cards: CardIds,
+        names: Tuple[str, ...],
+        states: array,
+        credits: array,
+        amounts: array,
+        hand_sizes: array,
+        cards: CardIds,
+        deck: CardIds,
+        decks: int = 0,
+        cut_card: int = 0,
+        payouts: Payouts = Payouts(),
+        exhaustion: int = 0,
+        dealt: Optional[CardIds] = None,
+        reserve: Optional[CardIds] = None,
+        unshuffled: int = 0,
+    ) -> None:
+        """Instantiates this class.
+
+        :param dealer_name: Dealer name
+        :param dealer_state: Dealer state index on ``DEALER_STATES``
+        :param dealer_credit: Dealer bet value
+        :param dealer_amount: Dealer amount of credits
+        :param dealer_cards: Card ids on dealer hand
+        :param names: Gambler names in seat order
+        :param states: Gambler state indexes on ``GAMBLER_STATES``
+        :param credits: Gambler bet values
+        :param amounts: Gambler amounts of credits
+        :param hand_sizes: Number of cards on each gambler hand
+        :param cards: Card ids on gambler hands, concatenated
+        :param deck: Remaining card ids, the last one dealt first
+        :param decks: Number of decks of a shoe, zero for a single deck
+        :param cut_card: Remaining cards when the cut card comes out
+        :param payouts: Payout ratios of the table
+        :param exhaustion: Deck exhaustion policy index on ``EXHAUSTION_POLICIES``
+        :param dealt: Card ids dealt this round, kept to reshuffle discards
+        :param reserve: Card ids of the deck reserve
+        :param unshuffled: Reserve cards the shuffle has not reached yet
+        """
+        self.dealer_name = dealer_name
+        self.dealer_state = dealer_state
+        self.dealer_credit = dealer_credit
+        self.dealer_amount = dealer_amount
+        self.dealer_cards = dealer_cards
+        self.names = names
+        self.states = states
+        self.credits = credits
+        self.amounts = amounts
+        self.hand_sizes = hand_sizes
+        self.cards = cards
+        self.deck = deck
+        self.decks = decks
+        self.cut_card = cut_card
+        self.payouts = payouts
+        self.exhaustion = exhaustion
+        self.dealt = dealt if dealt is not None else array('B')
+        self.reserve = reserve if reserve is not None else array('B')
+        self.unshuffled = unshuffled
+
+    def __eq__(self, other: object) -> bool:
+        """Compares two snapshots field by field.
+
+        :param other: Another object
+        :return: If both snapshots hold the same table
+        :rtype: bool
+        """
+        if not isinstance(other, TableSnapshot):
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self.__slots__
+        )
+
+    @classmethod
+    def freeze(cls, dealer: Dealer) -> 'TableSnapshot':
+        """Captures the state of a table.
+
+        :param dealer: Dealer of the table
+        :type dealer: Dealer
+        :return: A snapshot of the table
+        :rtype: TableSnapshot
+        """
+        gamblers = dealer.gamblers
+        cards = array('B')
+        for gambler in gamblers:
+            cards.extend(gambler.cards)
+        deck = dealer.deck
+        return cls(
+            dealer_name=dealer.name,
+            dealer_state=DEALER_STATES.index(dealer.state),
+            dealer_credit=dealer.credit,
+            dealer_amount=dealer.amount,
+            dealer_cards=array('B', dealer.cards),
+            names=tuple(gambler.name for gambler in gamblers),
+            states=array('B', [GAMBLER_STATES.index(gambler.state) for gambler in gamblers]),
+            credits=array('q', [gambler.credit for gambler in gamblers]),
+            amounts=array('q', [gambler.amount for gambler in gamblers]),
+            hand_sizes=array('B', [len(gambler.cards) for gambler in gamblers]),
+            cards=cards,
+            deck=array('B', deck.cards),
+            decks=len(deck.composition) // len(CARDS) if isinstance(deck, Shoe) else 0,
+            cut_card=deck.cut_card if isinstance(deck, Shoe) else 0,
+            payouts=dealer.payouts,
+            exhaustion=EXHAUSTION_POLICIES.index(deck.exhaustion),
+            dealt=array('B', deck.dealt or ()),
+            reserve=array('B', deck.reserve or ()),
+            unshuffled=deck.unshuffled,
+        )
+
+    def restore(
+        self,
+        rng: Optional[random.Random] = None,
+        tracker: Optional[CountTracker] = None,
+    ) -> Dealer:
+        """Rebuilds the table captured by this snapshot.
+
+        Snapshots do not keep the tracker of a deck, the given one is reset
+        to the cards left on the restored deck.
+
+        :param rng: Random generator of the restored deck
+        :type rng: Optional[random.Random]
+        :param tracker: Tracker of the cards left on the restored deck, if any
+        :type tracker: Optional[CountTracker]
+        :return: Dealer of the restored table
+        :rtype: Dealer
+        """
+        gamblers = []
+        offset = 0
+        for seat, name in enumerate(self.names):
+            gambler = Gambler(name=name, credit=self.credits[seat])
+            gambler.amount = self.amounts[seat]
+            gambler.state = GAMBLER_STATES[self.states[seat]]
+            gambler.cards = self.cards[offset:offset + self.hand_sizes[seat]]
+            offset += self.hand_sizes[seat]
+            gamblers.append(gambler)
+
+        deck: Deck
+        exhaustion = EXHAUSTION_POLICIES[self.exhaustion]
+        if self.decks:
+            deck = Shoe(decks=self.decks, rng=rng, exhaustion=exhaustion)
+            deck.cut_card = self.cut_card
+        else:
+            deck = Deck(rng=rng, exhaustion=exhaustion)
+        dealer = Dealer(
+            gamblers=gamblers,
+            name=self.dealer_name,
+            credit=self.dealer_credit,
+            deck=deck,
+            payouts=self.payouts,
+        )
+        dealer.amount = self.dealer_amount
+        dealer.state = DEALER_STATES[self.dealer_state]
+        dealer.cards = self.dealer_cards
+        deck.cards = array('B', self.deck)
+        if deck.dealt is not None:
+            deck.dealt = array('B', self.dealt)
+        if deck.reserve is not None:
+            deck.reserve = array('B', self.reserve)
+            deck.unshuffled = self.unshuffled
+        if tracker is not None:
+            deck.tracker = tracker
+            tracker.reset(deck.cards)
+        return dealer
+
+    @property
+    def nbytes(self) -> int:
+        """A property that contains the size of array buffers.
+
+        :return: Bytes held by the arrays of this snapshot
+        :rtype: int
+        """
+        buffers = (
+            self.dealer_cards,
+            self.states,
+            self.credits,
+            self.amounts,
+            self.hand_sizes,
+            self.cards,
+            self.deck,
+            self.dealt,
+            self.reserve,
+        )
+        return sum(len(buffer) * buffer.itemsize for buffer in buffers)
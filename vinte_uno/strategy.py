@@ -0,0 +1,289 @@
+"""
+This module serves hit and stand expected values for gambler decisions.
+
+A ``Strategy`` holds, for every gambler total, soft flag and dealer up-card,
+the expected value of staying and of hitting once more then playing on
+optimally. Values follow the game rules: reaching twenty one wins right
+away, a stayed gambler wins when the dealer busts or ends below its hand
+and pushes on a tie.
+Shoes are approximated as infinite, with the composition of ``decks`` full
+decks, and dealer odds come from ``vinte_uno.probability``.
+
+Tables are flat ``array('d')`` buffers built once per rule set and cached
+on disk.
+"""
+import hashlib
+import os
+import tempfile
+from array import array
+from contextlib import suppress
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from vinte_uno.probability import WEIGHTS, dealer_odds, hand_total, shoe_composition
+from vinte_uno.vinte_uno import (
+    ACE_WEIGHT,
+    CARD_WEIGHTS,
+    DEALER_RANK_POINTS_LIMIT,
+    TWENTY_ONE_RANK_POINTS,
+    Dealer,
+    Gambler,
+    Payouts,
+)
+
+FORMAT_VERSION = 1
+CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'vinte_uno')
+TOTALS = TWENTY_ONE_RANK_POINTS + 1
+STAND = 0
+HIT = 1
+ACTIONS = 2
+TABLE_SIZE = ACTIONS * len(WEIGHTS) * TOTALS * 2
+
+
+class Rules(NamedTuple):  # noqa: H601
+    """Rule set the expected values are computed for.
+
+    Payouts are given per bet unit, as on ``Payouts``, and default to the
+    ones of ``Payouts()``: a beaten gambler keeps its credit.
+    """
+
+    decks: int = 6
+    win: float = 1.0
+    twenty_one: float = 1.0
+    loss: float = 0.0
+    push: float = 0.0
+    bust: float = 1.0
+
+    @classmethod
+    def from_payouts(cls, payouts: Payouts, decks: int = 6) -> 'Rules':
+        """Builds the rule set of a table settled with the given payouts.
+
+        :param payouts: Payout ratios of the table
+        :type payouts: Payouts
+        :param decks: Number of decks of the shoe
+        :type decks: int
+        :return: A rule set
+        :rtype: Rules
+        """
+        return cls(
+            decks=decks,
+            win=payouts.win,
+            twenty_one=payouts.twenty_one,
+            loss=payouts.loss,
+            push=payouts.push,
+            bust=payouts.bust,
+        )
+
+
+def _index(total: int, soft: bool, up_weight: int, action: int) -> int:
+    return ((int(soft) * TOTALS + total) * len(WEIGHTS) + up_weight - ACE_WEIGHT) * ACTIONS + action
+
+
+def _stand_value(total: int, up_weight: int, rules: Rules, counts: Tuple[int, ...]) -> float:
+    """Expected value of staying on a total.
+
+    :param total: Gambler total
+    :param up_weight: Dealer up-card weight
+    :param rules: Rule set
+    :param counts: Shoe composition, up-card removed
+    :return: Expected value per bet unit
+    """
+    odds = dealer_odds(up_weight, counts)
+    value = odds.bust * rules.win
+    for dealer_total, probability in zip(range(DEALER_RANK_POINTS_LIMIT, TOTALS), odds):
+        if total > dealer_total:
+            value += probability * rules.win
+        elif total < dealer_total:
+            value -= probability * rules.loss
+        else:
+            value += probability * rules.push
+    return value
+
+
+class _Decisions:
+    """Expected values of the decisions against one dealer up-card."""
+
+    def __init__(self, up_weight: int, rules: Rules) -> None:
+        """Instantiates this class.
+
+        :param up_weight: Dealer up-card weight
+        :param rules: Rule set
+        """
+        full = shoe_composition(rules.decks)
+        counts = tuple(count - (weight == up_weight) for weight, count in zip(WEIGHTS, full))
+        self.rules = rules
+        self.draws = [(weight, count / sum(full)) for weight, count in zip(WEIGHTS, full)]
+        self.stand = [_stand_value(total, up_weight, rules, counts) for total in range(TOTALS)]
+        self.best: Dict[Tuple[int, bool], Tuple[float, float]] = {}
+
+    def evaluate(self, hard: int, has_ace: bool) -> Tuple[float, float]:
+        """Expected values of staying and hitting on a hand.
+
+        :param hard: Hand total, aces counting as one
+        :param has_ace: If there is an ace on hand
+        :return: Stand and hit expected values
+        """
+        if (hard, has_ace) not in self.best:
+            hit = sum(
+                probability * self.value(hard + weight, has_ace or weight == ACE_WEIGHT)
+                for weight, probability in self.draws
+            )
+            self.best[hard, has_ace] = (self.stand[hand_total(hard, has_ace)], hit)
+        return self.best[hard, has_ace]
+
+    def value(self, hard: int, has_ace: bool) -> float:
+        """Expected value of a hand played on optimally.
+
+        :param hard: Hand total, aces counting as one
+        :param has_ace: If there is an ace on hand
+        :return: Expected value
+        """
+        total = hand_total(hard, has_ace)
+        if total > TWENTY_ONE_RANK_POINTS:
+            return -self.rules.bust
+        if total == TWENTY_ONE_RANK_POINTS:
+            return self.rules.twenty_one
+        return max(self.evaluate(hard, has_ace))
+
+
+def build(rules: Rules = Rules()) -> array:
+    """Computes stand and hit expected values of every decision.
+
+    :param rules: Rule set
+    :type rules: Rules
+    :return: Expected values, see ``Strategy``
+    :rtype: array
+    """
+    table = array('d', bytes(TABLE_SIZE * array('d').itemsize))
+    for up_weight in WEIGHTS:
+        decisions = _Decisions(up_weight, rules)
+        for hard in range(ACE_WEIGHT, TOTALS):
+            for has_ace in (False, True):
+                total = hand_total(hard, has_ace)
+                if total < TWENTY_ONE_RANK_POINTS:
+                    stand, hit = decisions.evaluate(hard, has_ace)
+                    table[_index(total, total != hard, up_weight, STAND)] = stand
+                    table[_index(total, total != hard, up_weight, HIT)] = hit
+    return table
+
+
+def cache_path(rules: Rules, directory: str = CACHE_DIRECTORY) -> str:
+    """Path of the cached table of a rule set.
+
+    :param rules: Rule set
+    :type rules: Rules
+    :param directory: Cache directory
+    :type directory: str
+    :return: File path
+    :rtype: str
+    """
+    key = '{0}:{1!r}:{2}'.format(FORMAT_VERSION, tuple(rules), DEALER_RANK_POINTS_LIMIT)
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return os.path.join(directory, 'strategy-{0}.bin'.format(digest))
+
+
+def _write_cache(table: array, path: str) -> None:
+    """Writes a table to its cache file, replacing it atomically.
+
+    :param table: Expected values
+    :param path: Cache file path
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(descriptor, 'wb') as cache:
+            table.tofile(cache)
+        os.replace(temporary, path)
+    except OSError:
+        os.unlink(temporary)
+        raise
+
+
+class Strategy:
+    """Class that serves expected values of gambler decisions in O(1)."""
+
+    def __init__(self, table: array, rules: Rules = Rules()) -> None:
+        """Instantiates this class.
+
+        :param table: Expected values computed by ``build``
+        :type table: array
+        :param rules: Rule set of the table
+        :type rules: Rules
+        """
+        self.table: array = table
+        self.rules: Rules = rules
+
+    @classmethod
+    def load(
+        cls,
+        rules: Rules = Rules(),
+        directory: Optional[str] = CACHE_DIRECTORY,
+    ) -> 'Strategy':
+        """Loads the table of a rule set, building and caching it if missing.
+
+        Cache files that are unreadable or of the wrong size are rebuilt. When
+        the cache directory is not writable the table is only kept in memory.
+
+        :param rules: Rule set
+        :type rules: Rules
+        :param directory: Cache directory, no disk cache when None
+        :type directory: Optional[str]
+        :return: A strategy object
+        :rtype: Strategy
+        """
+        if directory is None:
+            return cls(build(rules), rules)
+
+        path = cache_path(rules, directory)
+        table = array('d')
+        try:
+            with open(path, 'rb') as cached:
+                table.frombytes(cached.read())
+        except (OSError, ValueError):
+            table = array('d')
+        if len(table) != TABLE_SIZE:
+            table = build(rules)
+            with suppress(OSError):
+                _write_cache(table, path)
+        return cls(table, rules)
+
+    def values(self, total: int, soft: bool, up_weight: int) -> Tuple[float, float]:
+        """Expected values of staying and of hitting.
+
+        :param total: Gambler total
+        :type total: int
+        :param soft: If an ace counts as eleven on the gambler hand
+        :type soft: bool
+        :param up_weight: Dealer up-card weight
+        :type up_weight: int
+        :return: Stand and hit expected values per bet unit
+        :rtype: Tuple[float, float]
+        """
+        index = _index(total, soft, up_weight, STAND)
+        return self.table[index], self.table[index + HIT]
+
+    def should_stay(self, gambler: Gambler, dealer: Dealer) -> bool:
+        """Tells if a gambler stays, as a policy of ``simulation.play_round``.
+
+        :param gambler: A gaming gambler
+        :type gambler: Gambler
+        :param dealer: Dealer of the table, holding its up-card
+        :type dealer: Dealer
+        :return: If staying is worth at least hitting
+        :rtype: bool
+        """
+        stand, hit = self.values(gambler.hand, gambler.soft, CARD_WEIGHTS[dealer.cards[0]])
+        return stand >= hit
+
+
+@lru_cache(maxsize=8)
+def strategy(rules: Rules = Rules()) -> Strategy:
+    """Returns the strategy of a rule set, loaded once per process.
+
+    :param rules: Rule set
+    :type rules: Rules
+    :return: A strategy object
+    :rtype: Strategy
+    """
+    return Strategy.load(rules)
@@ -1,15 +1,40 @@
 """
 This module contains the core functionality of this program.
+
+Cards, decks and hand evaluation live in ``vinte_uno.cards`` and are
+exported here as well. The ``transitions`` package is imported when a
+player state machine is first needed.
 """
-import random
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Iterator, List, NamedTuple, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from vinte_uno.cards import (  # noqa: F401
+    ACE_RANK_POINTS,
+    ACE_WEIGHT,
+    CARD_IDS,
+    CARD_WEIGHTS,
+    CARDS,
+    DEALER_RANK_POINTS_LIMIT,
+    EXHAUSTION_POLICIES,
+    FAIL_FAST,
+    HAND_KEYS,
+    HAND_TOTALS,
+    RANKS,
+    RESERVE,
+    RESHUFFLE_DISCARDS,
+    SUITS,
+    TWENTY_ONE_RANK_POINTS,
+    Card,
+    Cards,
+    CountTracker,
+    Deck,
+    Hand,
+    Shoe,
+)
 
-from transitions import Machine
+if TYPE_CHECKING:
+    from transitions import Machine  # noqa: WPS433
 
-TWENTY_ONE_RANK_POINTS = 21
-ACE_RANK_POINTS = 11
-DEALER_RANK_POINTS_LIMIT = 17
 READY_TO_GAME = 'READY_TO_GAME'
 GAMING = 'GAMING'
 TWENTY_ONE = 'TWENTY_ONE'
@@ -54,89 +79,232 @@ MATCH_STATES = (
 )
 
 
-class Card(NamedTuple):  # noqa: H601
-    """Object that contains cards properties."""
+class Payouts(NamedTuple):  # noqa: H601
+    """Payout ratios of a table, per bet unit.
+
+    A gambler gains ``win`` when beating the dealer, ``twenty_one`` when
+    reaching twenty one and ``push`` on a tie; it loses ``loss`` when beaten
+    and ``bust`` when busting. Payouts are truncated to whole credits. By
+    default a beaten gambler keeps its credit.
+    """
+
+    win: float = 1.0
+    twenty_one: float = 1.0
+    push: float = 0.0
+    loss: float = 0.0
+    bust: float = 1.0
 
-    rank: str
-    suit: str
-    weight: int
-    image: str
 
+class Listener:
+    """Object notified of what happens to the players it listens to.
 
-class Cards:
-    """Object that generates set of cards.
+    A player notifies the listener set on its ``listener`` attribute, none
+    by default. ``Listeners`` shares that attribute between many listeners.
     """
 
-    def __init__(self) -> None:
-        """Initializes Cards class.
-        """
-        self.suits: Set[str] = {'spades', 'clubs', 'diamonds', 'hearts'}
-        self.ranks: Set[Tuple[str, int]] = {
-            ('ace', 1),
-            ('2', 2),
-            ('3', 3),
-            ('4', 4),
-            ('5', 5),
-            ('6', 6),
-            ('7', 7),
-            ('8', 8),
-            ('9', 9),
-            ('10', 10),
-            ('Jack', 10),
-            ('Queen', 10),
-            ('King', 10),
-        }
-
-    def generate(self) -> Iterator[Card]:
-        """Generates deck cards.
-
-        :yield: A generator with Card objects
-        :rtype: Iterator[Card]
-        """
-        for suit in self.suits:
-            yield from self._helper(suit=suit)
-
-    def _helper(self, suit: str) -> Iterator[Card]:
-        rank_attrs = {}
-        for rank in self.ranks:
-            rank_attrs['string'] = str(rank[0])
-            rank_attrs['weight'] = str(rank[1])
-            image = '{0}-{1}.png'.format(rank_attrs['string'], suit)
-            yield Card(
-                suit=suit,
-                rank=rank_attrs['string'],
-                weight=int(rank_attrs['weight']),
-                image=image,
-            )
+    def on_pick(self, player: 'Player', card_id: int) -> None:
+        """Called after a player picks a card from the deck.
 
+        :param player: Player that hit
+        :type player: Player
+        :param card_id: Card id, see ``CARDS``
+        :type card_id: int
+        """
 
-class Deck:
-    """Class that represents deck aggregating cards."""
+    def on_trigger(self, player: 'Player', trigger: str, succeeded: bool) -> None:
+        """Called after a trigger is fired on a player, callbacks included.
 
-    def __init__(self) -> None:
-        """Instantiates this class."""
-        self.cards: List[Card] = list(Cards().generate())
+        :param player: Player whose trigger was fired
+        :type player: Player
+        :param trigger: Trigger name
+        :type trigger: str
+        :param succeeded: If the transition happened
+        :type succeeded: bool
+        """
 
-    def pick(self) -> Card:
-        """Returns a card randomly and pick from deck.
+    def on_turn(self, dealer: 'Dealer') -> None:
+        """Called when a dealer starts a turn.
 
-        :raises ValueError: When not have cards on deck
-        :return: A random card object
-        :rtype: Card
+        :param dealer: Dealer of the table
+        :type dealer: Dealer
         """
-        max_index = len(self.cards)
-        if max_index < 1:
-            raise ValueError("Doesn't have enough cards!")
-        index = random.SystemRandom().randint(0, max_index - 1)
-        card = self.cards[index]
-        self.cards.remove(card)
-        return card
 
+    def on_reset(self, player: 'Player') -> None:
+        """Called after a player is reset for a new round.
+
+        :param player: Player that was reset
+        :type player: Player
+        """
+
+
+class Listeners(Listener):
+    """Listener forwarding every event to many listeners, in order."""
+
+    def __init__(self, *listeners: Optional[Listener]) -> None:
+        """Instantiates this class.
+
+        :param listeners: Listeners to notify, None ones skipped
+        :type listeners: Optional[Listener]
+        """
+        self.listeners: List[Listener] = [
+            listener for listener in listeners if listener is not None
+        ]
+
+    def on_pick(self, player: 'Player', card_id: int) -> None:
+        """Forwards a picked card.
+
+        :param player: Player that hit
+        :type player: Player
+        :param card_id: Card id, see ``CARDS``
+        :type card_id: int
+        """
+        for listener in self.listeners:
+            listener.on_pick(player, card_id)
+
+    def on_trigger(self, player: 'Player', trigger: str, succeeded: bool) -> None:
+        """Forwards a fired trigger.
+
+        :param player: Player whose trigger was fired
+        :type player: Player
+        :param trigger: Trigger name
+        :type trigger: str
+        :param succeeded: If the transition happened
+        :type succeeded: bool
+        """
+        for listener in self.listeners:
+            listener.on_trigger(player, trigger, succeeded)
+
+    def on_turn(self, dealer: 'Dealer') -> None:
+        """Forwards the start of a turn.
+
+        :param dealer: Dealer of the table
+        :type dealer: Dealer
+        """
+        for listener in self.listeners:
+            listener.on_turn(dealer)
+
+    def on_reset(self, player: 'Player') -> None:
+        """Forwards a player reset.
+
+        :param player: Player that was reset
+        :type player: Player
+        """
+        for listener in self.listeners:
+            listener.on_reset(player)
+
+
+class _LazyMachine:
+    """Descriptor building the state machine of a player class on first use."""
+
+    def __get__(self, instance: Optional['Player'], owner: Type['Player']) -> 'Machine':
+        """Returns the state machine of a player class.
+
+        :param instance: Player the machine is looked up from, if any
+        :param owner: Player class
+        :return: The machine shared by the instances of the class
+        """
+        machine = vars(owner).get('_machine')
+        if machine is None:
+            from transitions import Machine  # noqa: WPS433, WPS442
+
+            machine = Machine(
+                model=None,
+                states=list(owner.states),
+                transitions=[dict(transition) for transition in owner.transitions],
+                initial=owner.states[0],
+            )
+            owner._machine = machine  # type: ignore
+        return machine
+
+
+def _bind_trigger(owner: Type['Player'], name: str) -> Callable[..., bool]:
+    """Builds a trigger method that fires an event of a shared machine.
+
+    :param owner: Player class
+    :type owner: Type[Player]
+    :param name: Trigger name
+    :type name: str
+    :return: A method that fires the event on the calling player
+    :rtype: Callable[..., bool]
+    """
+    events: List[Any] = []
+
+    def trigger(model: 'Player', *args: object, **kwargs: object) -> bool:  # noqa: WPS430
+        if not events:
+            events.append(owner.machine.events[name])
+        succeeded: bool = events[0].trigger(model, *args, **kwargs)
+        if model.listener is not None:
+            model.listener.on_trigger(model, name, succeeded)
+        return succeeded
 
-class Player(Machine, metaclass=ABCMeta):  # noqa: H601
-    """Base class for Gambler and Dealer entities."""
+    trigger.__name__ = name
+    trigger.__qualname__ = name
+    return trigger
 
-    states: Tuple = ()
+
+def _bind_state_check(state: str) -> Callable[['Player'], bool]:
+    """Builds a method telling if a player is in a state.
+
+    :param state: State name
+    :type state: str
+    :return: A method comparing the state of the calling player
+    :rtype: Callable[[Player], bool]
+    """
+
+    def is_state(model: 'Player') -> bool:  # noqa: WPS430
+        return model.state == state
+
+    is_state.__name__ = 'is_{0}'.format(state)
+    is_state.__qualname__ = is_state.__name__
+    return is_state
+
+
+def triggers(cls: type) -> List[str]:
+    """Lists trigger names of a player class, automatic transitions last.
+
+    :param cls: Player class
+    :type cls: type
+    :return: Trigger names
+    :rtype: List[str]
+    """
+    names = []
+    for transition in cls.transitions:  # type: ignore
+        if transition['trigger'] not in names:
+            names.append(transition['trigger'])
+    names.extend('to_{0}'.format(state) for state in cls.states)  # type: ignore
+    return names
+
+
+class Player(Hand, metaclass=ABCMeta):  # noqa: H601
+    """Base class for Gambler and Dealer entities.
+
+    Each concrete subclass compiles its ``states`` and ``transitions`` into a
+    single ``transitions.Machine`` that is shared by all of its instances, the
+    triggers being bound once as class methods, along with the ``is_<STATE>``
+    checks and the ``trigger`` method a ``transitions`` model provides. The
+    machine is built the first time a trigger fires or ``machine`` is looked
+    up.
+    """
+
+    states: Tuple[str, ...] = ()
+    transitions: Tuple[Dict[str, object], ...] = ()
+    machine: 'Machine' = _LazyMachine()  # type: ignore
+    listener: Optional[Listener] = None
+    payouts: Payouts = Payouts()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Binds the triggers and state checks of a player class.
+
+        :param kwargs: Keyword arguments for parent classes
+        """
+        super().__init_subclass__(**kwargs)  # type: ignore
+        for trigger in triggers(cls):
+            if trigger not in vars(cls):
+                setattr(cls, trigger, _bind_trigger(cls, trigger))
+        for state in cls.states:
+            check = 'is_{0}'.format(state)
+            if check not in vars(cls):
+                setattr(cls, check, _bind_state_check(state))
 
     def __init__(self, name: str, credit: int, amount: int = 0) -> None:
         """Instantiates this class.
@@ -145,33 +313,41 @@ class Player(Machine, metaclass=ABCMeta):  # noqa: H601
         :param credit: represents a bet value
         :param amount: amount of credits on player account
         """
-        super().__init__(model=self, states=list(self.states), initial=self.states[0])
+        self.state: str = self.states[0]
         self.name: str = name
-        self.cards: Set[Card] = set()
+        super().__init__()
         self.credit: int = credit
         self.amount: int = amount
 
-    @property
-    def hand(self) -> int:
-        """A property that contains total rank points on Player hand.
+    def trigger(self, trigger_name: str, *args: object, **kwargs: object) -> bool:
+        """Fires a trigger by its name, as ``transitions`` models do.
 
-        :return: total rank points
-        :rtype: int
+        :param trigger_name: Trigger name
+        :type trigger_name: str
+        :param args: Positional arguments passed to the trigger
+        :param kwargs: Keyword arguments passed to the trigger
+        :raises AttributeError: When the trigger is unknown
+        :return: If the transition happened
+        :rtype: bool
         """
-        if not self.cards:
-            return 0
+        if trigger_name not in triggers(type(self)):
+            raise AttributeError("Do not know event named '{0}'.".format(trigger_name))
+        succeeded: bool = getattr(self, trigger_name)(*args, **kwargs)
+        return succeeded
 
-        have_ace = False
-        rank_points = 0
-        for card in self.cards:
-            rank_points += card.weight
-            if card.rank == 'ace':
-                have_ace = True
+    def reset(self, credit: int = 1) -> None:
+        """Puts the player back to its initial state for a new round.
 
-        if rank_points == ACE_RANK_POINTS and have_ace:
-            return ACE_RANK_POINTS + (rank_points - 1)
+        The hand is cleared in place, the amount of credits is kept.
 
-        return rank_points
+        :param credit: Bet value of the new round
+        :type credit: int
+        """
+        self.state = self.states[0]
+        self.clear()
+        self.credit = credit
+        if self.listener is not None:
+            self.listener.on_reset(self)
 
     def hit(self, deck: Deck) -> None:
         """Player hits on game.
@@ -180,7 +356,10 @@ class Player(Machine, metaclass=ABCMeta):  # noqa: H601
         :type deck: Deck
         """
         if self.state in HIT_STATES:
-            self.cards.add(deck.pick())
+            card_id = deck.pick()
+            self.add_card(card_id)
+            if self.listener is not None:
+                self.listener.on_pick(self, card_id)
 
     def show(self) -> List[Dict[str, object]]:
         """Shows cards on player hands.
@@ -189,7 +368,8 @@ class Player(Machine, metaclass=ABCMeta):  # noqa: H601
         :rtype: List[Dict[str, object]]
         """
         cards = []
-        for card in self.cards:
+        for card_id in self.cards:
+            card = CARDS[card_id]
             cards.append(
                 {
                     'suit': card.suit,
@@ -224,6 +404,33 @@ class Gambler(Player):
     """Class that represents gambler."""
 
     states: Tuple[str, ...] = GAMBLER_STATES
+    transitions: Tuple[Dict[str, object], ...] = (
+        {
+            'trigger': 'play',
+            'source': READY_TO_GAME,
+            'dest': GAMING,
+            'conditions': ['should_play'],
+        },
+        {
+            'trigger': 'win',
+            'source': GAMING,
+            'dest': TWENTY_ONE,
+            'conditions': ['should_win'],
+            'after': ['after_win'],
+        },
+        {'trigger': 'stay', 'source': GAMING, 'dest': STAYED},
+        {
+            'trigger': 'bust',
+            'source': GAMING,
+            'dest': BUSTED,
+            'conditions': ['should_bust'],
+            'after': ['after_bust'],
+        },
+    )
+    play: Callable[[], bool]
+    win: Callable[[], bool]
+    stay: Callable[[], bool]
+    bust: Callable[[], bool]
 
     def __init__(self, name: str, credit: int = 1) -> None:
         """Initializes dealer class.
@@ -234,27 +441,6 @@ class Gambler(Player):
         :type credit: int
         """
         super().__init__(name=name, credit=credit)
-        self.add_transition(
-            trigger='play',
-            source=READY_TO_GAME,
-            dest=GAMING,
-            conditions=['should_play'],
-        )
-        self.add_transition(
-            trigger='win',
-            source=GAMING,
-            dest=TWENTY_ONE,
-            conditions=['should_win'],
-            after=['after_win'],
-        )
-        self.add_transition(trigger='stay', source=GAMING, dest=STAYED)
-        self.add_transition(
-            trigger='bust',
-            source=GAMING,
-            dest=BUSTED,
-            conditions=['should_bust'],
-            after=['after_bust'],
-        )
 
     def should_play(self) -> bool:
         """Condition for play trigger.
@@ -278,78 +464,126 @@ class Gambler(Player):
     def after_bust(self) -> None:
         """Event dispatched after the gambler busts.
         """
-        self.credit -= self.credit
+        self.credit -= int(self.credit * self.payouts.bust)
 
     def after_win(self) -> None:
         """Event dispatched after the gambler get 21 points.
         """
-        self.credit += self.credit
+        self.credit += int(self.credit * self.payouts.twenty_one)
 
 
 class Dealer(Player):
     """Class that represents dealer."""
 
     states: Tuple[str, ...] = DEALER_STATES
-
-    def __init__(self, gamblers: List[Gambler], name: str = 'Dealer', credit: int = 1) -> None:
+    transitions: Tuple[Dict[str, object], ...] = (
+        {
+            'trigger': 'deal',
+            'source': DEAL_PENDING,
+            'dest': STARTED,
+            'conditions': ['should_deal'],
+            'after': ['after_deal'],
+        },
+        {
+            'trigger': 'hide',
+            'source': STARTED,
+            'dest': HIDING,
+            'conditions': ['should_hide'],
+        },
+        {
+            'trigger': 'expose',
+            'source': HIDING,
+            'dest': EXPOSED,
+            'conditions': ['should_expose'],
+            'after': ['after_expose'],
+        },
+        {
+            'trigger': 'bust',
+            'source': EXPOSED,
+            'dest': BUSTED,
+            'conditions': ['should_bust'],
+            'after': ['after_bust'],
+        },
+        {
+            'trigger': 'stay',
+            'source': EXPOSED,
+            'dest': STAYED,
+            'conditions': ['should_stay'],
+            'after': ['after_stay'],
+        },
+    )
+    deal: Callable[[], bool]
+    hide: Callable[[], bool]
+    expose: Callable[[], bool]
+    bust: Callable[[], bool]
+    stay: Callable[[], bool]
+    steps: Dict[str, str] = {
+        DEAL_PENDING: 'deal',
+        STARTED: 'hide',
+        HIDING: 'expose',
+    }
+
+    def __init__(
+        self,
+        gamblers: List[Gambler],
+        name: str = 'Dealer',
+        credit: int = 1,
+        deck: Optional[Deck] = None,
+        payouts: Optional[Payouts] = None,
+    ) -> None:
         """Initializes dealer class.
 
         :param gamblers: List containing gamblers of the round.
         :param name: Player name
         :param credit: Represents bet value
+        :param deck: Deck or shoe kept across rounds, a new deck by default
+        :param payouts: Payout ratios given to the table players, if any
         :type gamblers: List[Gambler]
         :type name: str
         :type credit: int
+        :type deck: Optional[Deck]
+        :type payouts: Optional[Payouts]
         """
         super().__init__(name=name, credit=credit)
         self.gamblers: List[Gambler] = gamblers
-        self.deck: Deck = Deck()
-        self.add_transition(
-            trigger='deal',
-            source=DEAL_PENDING,
-            dest=STARTED,
-            conditions=['should_deal'],
-            after=['after_deal'],
-        )
-        self.add_transition(
-            trigger='hide',
-            source=STARTED,
-            dest=HIDING,
-            conditions=['should_hide'],
-        )
-        self.add_transition(
-            trigger='expose',
-            source=HIDING,
-            dest=EXPOSED,
-            conditions=['should_expose'],
-            after=['after_expose'],
-        )
-        self.add_transition(
-            trigger='bust',
-            source=EXPOSED,
-            dest=BUSTED,
-            conditions=['should_bust'],
-            after=['after_bust'],
-        )
-        self.add_transition(
-            trigger='stay',
-            source=EXPOSED,
-            dest=STAYED,
-            conditions=['should_stay'],
-            after=['after_stay'],
-        )
+        if payouts is not None:
+            self.payouts = payouts
+            for gambler in gamblers:
+                gambler.payouts = payouts
+        self.deck: Deck = deck if deck is not None else Deck()
+        self.deck.start_round()
+
+    def reset(self, credit: int = 1, gambler_credit: int = 1, reshuffle: bool = False) -> None:
+        """Puts the table back to its initial state for a new round.
+
+        The dealer and its gamblers are reset, then the deck starts the
+        round as when the dealer is built.
+
+        :param credit: Dealer bet value of the new round
+        :type credit: int
+        :param gambler_credit: Gamblers bet value of the new round
+        :type gambler_credit: int
+        :param reshuffle: Puts every card back on the deck first
+        :type reshuffle: bool
+        """
+        super().reset(credit=credit)
+        for gambler in self.gamblers:
+            gambler.reset(credit=gambler_credit)
+        if reshuffle:
+            self.deck.reshuffle()
+        self.deck.start_round()
 
     def turn(self) -> None:
         """Players hits a card and turns.
         """
+        if self.listener is not None:
+            self.listener.on_turn(self)
         self._hit()
-        states = {
-            'DEAL_PENDING': self.deal,
-            'STARTED': self.hide,
-            'HIDING': self.expose,
-            'EXPOSED': self.bust if self.hand > TWENTY_ONE_RANK_POINTS else self.stay,
-        }
-        states.get(self.state)()
+        if self.state == EXPOSED:
+            trigger = 'bust' if self.value.bust else 'stay'
+        else:
+            trigger = self.steps[self.state]
+        getattr(self, trigger)()
 
     def should_deal(self) -> bool:
         """Condition for run deal trigger on state machine.
@@ -372,11 +606,9 @@ class Dealer(Player):
     def after_bust(self) -> None:
         """Event that runs after dealer busts.
 
-        All in-game gamblers earns the double bet.
+        Every stayed gambler wins.
         """
-        for gambler in self.gamblers:
-            if gambler.state not in {BUSTED, TWENTY_ONE}:
-                gambler.credit += gambler.credit
+        self.settle()
 
     def after_expose(self) -> None:
         """Event that runs after expose trigger.
@@ -388,21 +620,47 @@ class Dealer(Player):
     def after_stay(self) -> None:
         """Event that runs after dealer stays.
 
-        The most scored in-game gambler earns the double bet.
+        Stayed gamblers beating the dealer win, tied ones push.
+        """
+        self.settle()
+
+    def settle(self) -> None:
+        """Resolves every stayed gambler against the dealer in one pass.
+
+        Gamblers keep their seat order, the ones who busted or reached twenty
+        one having been settled when it happened. Ratios are read once for
+        each payouts object met, gamblers of a table sharing the same one.
         """
-        gamblers = [gamblr for gamblr in self.gamblers if gamblr.state == STAYED]
-        if not gamblers:
-            return
+        hand = -1 if self.state == BUSTED else self.hand
+        payouts = None
+        win = push = loss = 0.0
+        for gambler in self.gamblers:
+            if gambler.state != STAYED:
+                continue
+            if gambler.payouts is not payouts:
+                payouts = gambler.payouts
+                win, push, loss = payouts.win, payouts.push, -payouts.loss
+            key = gambler.key
+            points = HAND_TOTALS[key] if key < HAND_KEYS else gambler.hand
+            ratio = win if points > hand else push if points == hand else loss
+            gambler.credit += int(gambler.credit * ratio)
+
+    def resolve(self, gambler: Gambler) -> None:
+        """Busts a gaming gambler who just hit, or makes it win on twenty one.
 
-        # TODO: Must improve this logic
-        max_score = max(gamblers, key=lambda element: element.hand).hand
-        self.gamblers = list(set(self.gamblers) - set(gamblers))
-        for idx, gambler in enumerate(gamblers):
-            if gambler.hand == max_score and max_score > self.hand:
-                gamblers[idx].credit += gambler.credit
+        A gambler reaching twenty one also takes the dealer bet.
+
+        :param gambler: A gaming gambler of the table
+        :type gambler: Gambler
+        """
+        value = gambler.value
+        if value.bust:
+            gambler.bust()
 
-        self.gamblers += gamblers
-        self.gamblers.sort(key=lambda element: element.name)
+        if value.twenty_one:
+            gambler.win()
+            gambler.credit += self.credit
+            self.credit -= self.credit
 
     def should_hide(self) -> bool:
         """Condition for hide the last dealer card.
@@ -430,8 +688,9 @@ class Dealer(Player):
         :return: Condition for apply transition
         :rtype: bool
         """
-        first_condition = (self.hand >= DEALER_RANK_POINTS_LIMIT)
-        second_condition = (self.hand <= TWENTY_ONE_RANK_POINTS)
+        value = self.value
+        first_condition = (value.total >= DEALER_RANK_POINTS_LIMIT)
+        second_condition = not value.bust
         third_condition = True
         for gambler in self.gamblers:
             if gambler.state == STAYED:
@@ -452,17 +711,12 @@ class Dealer(Player):
         return cards
 
     def _hit(self) -> None:
+        if len(self.deck.cards) <= len(self.gamblers):
+            players = [*self.gamblers, self]
+            self.deck.ensure(sum(player.state in HIT_STATES for player in players))
         for gambler in self.gamblers:
             gambler.hit(deck=self.deck)
-            if gambler.state != GAMING:
-                continue
-
-            if gambler.hand > TWENTY_ONE_RANK_POINTS:
-                gambler.bust()
-
-            if gambler.hand == TWENTY_ONE_RANK_POINTS:
-                gambler.win()
-                gambler.credit += self.credit
-                self.credit -= self.credit
+            if gambler.state == GAMING:
+                self.resolve(gambler)
 
         self.hit(deck=self.deck)
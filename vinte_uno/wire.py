@@ -0,0 +1,337 @@
+"""
+This module encodes hands, table snapshots and round results in binary.
+
+Every message starts with a fixed header: the ``MAGIC`` bytes, the format
+``VERSION`` and the message kind. Fields follow in a fixed little-endian
+layout, states as indexes on ``GAMBLER_STATES``/``DEALER_STATES`` and cards
+as ids on ``CARDS``. Tables hold up to ``MAX_SEATS`` gamblers. Decoding does
+not copy card ids, they are returned as ``memoryview`` slices of the given
+buffer, and raises ``ValueError`` on truncated messages, unknown states or
+unknown card ids.
+"""
+import struct
+from array import array
+from typing import List, Tuple
+
+from vinte_uno.simulation import RoundResult
+from vinte_uno.snapshot import TableSnapshot
+from vinte_uno.vinte_uno import (
+    CARDS,
+    DEALER_STATES,
+    EXHAUSTION_POLICIES,
+    GAMBLER_STATES,
+    Payouts,
+    Player,
+)
+
+MAGIC = b'VU'
+VERSION = 4
+HAND = 1
+TABLE = 2
+ROUND = 3
+HEADER = struct.Struct('<2sBB')
+HAND_FIXED = struct.Struct('<B')
+TABLE_FIXED = struct.Struct('<BBHqqHBH')
+PAYOUTS = struct.Struct('<5d')
+DECK_FIXED = struct.Struct('<BHHH')
+SEAT = struct.Struct('<BBqq')
+ROUND_FIXED = struct.Struct('<BBH')
+ROUND_SEAT = struct.Struct('<BBq')
+NAME_SIZE = struct.Struct('<B')
+MAX_SEATS = 0xFFFF
+MAX_NAME_SIZE = 0xFF
+
+
+def _header(kind: int) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, kind)
+
+
+def _check_header(view: memoryview, kind: int) -> int:
+    """Validates the header of a message.
+
+    :param view: Message buffer
+    :param kind: Expected message kind
+    :raises ValueError: When the message is not of the expected kind or version
+    :return: Offset of the message body
+    """
+    try:
+        magic, version, message_kind = HEADER.unpack_from(view)
+    except struct.error as error:
+        raise ValueError('Truncated message!') from error
+    if magic != MAGIC:
+        raise ValueError('Not a vinte_uno message!')
+    if version != VERSION:
+        raise ValueError('Unsupported wire version {0}!'.format(version))
+    if message_kind != kind:
+        raise ValueError('Unexpected message kind {0}!'.format(message_kind))
+    return HEADER.size
+
+
+def _check_seats(seats: int) -> None:
+    """Validates the number of gamblers of a message.
+
+    :param seats: Number of gamblers
+    :raises ValueError: When the number does not fit the layout
+    """
+    if seats > MAX_SEATS:
+        raise ValueError('Tables hold up to {0} gamblers!'.format(MAX_SEATS))
+
+
+def _check_state(state: int, states: Tuple[str, ...], kind: str = 'state') -> int:
+    """Validates a decoded state index.
+
+    :param state: State index
+    :param states: States the index refers to
+    :param kind: What the index stands for, in error messages
+    :raises ValueError: When the index is out of the states
+    :return: The state index
+    """
+    if state >= len(states):
+        raise ValueError('Unknown {0} {1}!'.format(kind, state))
+    return state
+
+
+def _check_cards(cards: memoryview) -> memoryview:
+    """Validates decoded card ids.
+
+    :param cards: Card ids
+    :raises ValueError: When an id is not on ``CARDS``
+    :return: The card ids
+    """
+    if cards and max(cards) >= len(CARDS):
+        raise ValueError('Unknown card id {0}!'.format(max(cards)))
+    return cards
+
+
+def _take(view: memoryview, offset: int, size: int) -> Tuple[memoryview, int]:
+    """Slices size bytes of a buffer without copying them.
+
+    :param view: Message buffer
+    :param offset: Offset of the slice
+    :param size: Size of the slice
+    :raises ValueError: When the buffer is too short
+    :return: The slice and the offset following it
+    """
+    if offset + size > len(view):
+        raise ValueError('Truncated message!')
+    return view[offset:offset + size], offset + size
+
+
+def _unpack(layout: struct.Struct, view: memoryview, offset: int) -> Tuple[tuple, int]:
+    """Unpacks fixed fields of a buffer.
+
+    :param layout: Layout of the fields
+    :param view: Message buffer
+    :param offset: Offset of the fields
+    :raises ValueError: When the buffer is too short
+    :return: Field values and the offset following them
+    """
+    try:
+        return layout.unpack_from(view, offset), offset + layout.size
+    except struct.error as error:
+        raise ValueError('Truncated message!') from error
+
+
+def _encode_name(name: str) -> bytes:
+    """Encodes a name prefixed by its size.
+
+    :param name: Player name
+    :raises ValueError: When the encoded name does not fit its size field
+    :return: Encoded name
+    """
+    encoded = name.encode('utf-8')
+    if len(encoded) > MAX_NAME_SIZE:
+        raise ValueError('Names hold up to {0} bytes!'.format(MAX_NAME_SIZE))
+    return NAME_SIZE.pack(len(encoded)) + encoded
+
+
+def _decode_name(view: memoryview, offset: int) -> Tuple[str, int]:
+    (size,), offset = _unpack(NAME_SIZE, view, offset)
+    name, offset = _take(view, offset, size)
+    return str(name, 'utf-8'), offset
+
+
+def encode_hand(player: Player) -> bytes:
+    """Encodes cards on a player hand.
+
+    :param player: A player object
+    :type player: Player
+    :return: Hand message
+    :rtype: bytes
+    """
+    return b''.join((_header(HAND), HAND_FIXED.pack(len(player.cards)), bytes(player.cards)))
+
+
+def decode_hand(buffer: bytes) -> memoryview:
+    """Decodes cards of a hand message.
+
+    :param buffer: Hand message
+    :type buffer: bytes
+    :raises ValueError: When the message is invalid
+    :return: Card ids, a view on the buffer
+    :rtype: memoryview
+    """
+    view = memoryview(buffer)
+    offset = _check_header(view, HAND)
+    (size,), offset = _unpack(HAND_FIXED, view, offset)
+    cards, _ = _take(view, offset, size)
+    return _check_cards(cards)
+
+
+def encode_table(snapshot: TableSnapshot) -> bytes:
+    """Encodes a table snapshot.
+
+    :param snapshot: A table snapshot
+    :type snapshot: TableSnapshot
+    :raises ValueError: When the table has too many gamblers
+    :return: Table message
+    :rtype: bytes
+    """
+    _check_seats(len(snapshot.names))
+    parts: List[bytes] = [
+        _header(TABLE),
+        TABLE_FIXED.pack(
+            snapshot.dealer_state,
+            snapshot.decks,
+            snapshot.cut_card,
+            snapshot.dealer_credit,
+            snapshot.dealer_amount,
+            len(snapshot.names),
+            len(snapshot.dealer_cards),
+            len(snapshot.deck),
+        ),
+        PAYOUTS.pack(*snapshot.payouts),
+        DECK_FIXED.pack(
+            snapshot.exhaustion,
+            len(snapshot.dealt),
+            len(snapshot.reserve),
+            snapshot.unshuffled,
+        ),
+    ]
+    for seat in range(len(snapshot.names)):
+        parts.append(SEAT.pack(
+            snapshot.states[seat],
+            snapshot.hand_sizes[seat],
+            snapshot.credits[seat],
+            snapshot.amounts[seat],
+        ))
+    parts.append(_encode_name(snapshot.dealer_name))
+    parts.extend(_encode_name(name) for name in snapshot.names)
+    parts.extend((bytes(snapshot.dealer_cards), bytes(snapshot.cards), bytes(snapshot.deck)))
+    parts.extend((bytes(snapshot.dealt), bytes(snapshot.reserve)))
+    return b''.join(parts)
+
+
+def decode_table(buffer: bytes) -> TableSnapshot:
+    """Decodes a table message.
+
+    Card ids of the snapshot are views on the buffer.
+
+    :param buffer: Table message
+    :type buffer: bytes
+    :raises ValueError: When the message is invalid
+    :return: A table snapshot
+    :rtype: TableSnapshot
+    """
+    view = memoryview(buffer)
+    offset = _check_header(view, TABLE)
+    fields, offset = _unpack(TABLE_FIXED, view, offset)
+    dealer_state, decks, cut_card, dealer_credit, dealer_amount, seats, dealer_size, deck_size = (
+        fields
+    )
+    _check_state(dealer_state, DEALER_STATES)
+    payouts, offset = _unpack(PAYOUTS, view, offset)
+    (exhaustion, dealt_size, reserve_size, unshuffled), offset = _unpack(DECK_FIXED, view, offset)
+    _check_state(exhaustion, EXHAUSTION_POLICIES, 'exhaustion policy')
+    states = array('B')
+    hand_sizes = array('B')
+    credits = array('q')
+    amounts = array('q')
+    for _ in range(seats):
+        (state, hand_size, credit, amount), offset = _unpack(SEAT, view, offset)
+        states.append(_check_state(state, GAMBLER_STATES))
+        hand_sizes.append(hand_size)
+        credits.append(credit)
+        amounts.append(amount)
+    dealer_name, offset = _decode_name(view, offset)
+    names = []
+    for _ in range(seats):
+        name, offset = _decode_name(view, offset)
+        names.append(name)
+    dealer_cards, offset = _take(view, offset, dealer_size)
+    cards, offset = _take(view, offset, sum(hand_sizes))
+    deck, offset = _take(view, offset, deck_size)
+    dealt, offset = _take(view, offset, dealt_size)
+    reserve, offset = _take(view, offset, reserve_size)
+    for card_ids in (dealer_cards, cards, deck, dealt, reserve):
+        _check_cards(card_ids)
+    return TableSnapshot(
+        dealer_name=dealer_name,
+        dealer_state=dealer_state,
+        dealer_credit=dealer_credit,
+        dealer_amount=dealer_amount,
+        dealer_cards=dealer_cards,
+        names=tuple(names),
+        states=states,
+        credits=credits,
+        amounts=amounts,
+        hand_sizes=hand_sizes,
+        cards=cards,
+        deck=deck,
+        decks=decks,
+        cut_card=cut_card,
+        payouts=Payouts(*payouts),
+        exhaustion=exhaustion,
+        dealt=dealt,
+        reserve=reserve,
+        unshuffled=unshuffled,
+    )
+
+
+def encode_round(result: RoundResult) -> bytes:
+    """Encodes the outcome of a round.
+
+    :param result: Outcome of a round
+    :type result: RoundResult
+    :raises ValueError: When the round has too many gamblers
+    :return: Round message
+    :rtype: bytes
+    """
+    _check_seats(len(result.gambler_states))
+    parts = [
+        _header(ROUND),
+        ROUND_FIXED.pack(
+            DEALER_STATES.index(result.dealer_state),
+            result.dealer_hand,
+            len(result.gambler_states),
+        ),
+    ]
+    for state, hand, credit in zip(result.gambler_states, result.gambler_hands, result.credits):
+        parts.append(ROUND_SEAT.pack(GAMBLER_STATES.index(state), hand, credit))
+    return b''.join(parts)
+
+
+def decode_round(buffer: bytes) -> RoundResult:
+    """Decodes a round message.
+
+    :param buffer: Round message
+    :type buffer: bytes
+    :raises ValueError: When the message is invalid
+    :return: Outcome of a round
+    :rtype: RoundResult
+    """
+    view = memoryview(buffer)
+    offset = _check_header(view, ROUND)
+    (dealer_state, dealer_hand, seats), offset = _unpack(ROUND_FIXED, view, offset)
+    if offset + seats * ROUND_SEAT.size > len(view):
+        raise ValueError('Truncated message!')
+    seat_fields = list(ROUND_SEAT.iter_unpack(view[offset:offset + seats * ROUND_SEAT.size]))
+    return RoundResult(
+        dealer_state=DEALER_STATES[_check_state(dealer_state, DEALER_STATES)],
+        dealer_hand=dealer_hand,
+        gambler_states=tuple(
+            GAMBLER_STATES[_check_state(fields[0], GAMBLER_STATES)] for fields in seat_fields
+        ),
+        gambler_hands=tuple(fields[1] for fields in seat_fields),
+        credits=tuple(fields[2] for fields in seat_fields),
+    )